@@ -5,6 +5,7 @@ import sys
 from pm.cli.api import add_api_args
 from pm.cli.db import add_db_args
 from pm.cli.encryption import add_encryption_args
+from pm.cli.search import add_search_args
 from pm.cli.tasks import add_tasks_args
 from pm.cli.user import add_user_args
 from pm.cli.workflow import add_workflow_args
@@ -25,6 +26,7 @@ def main() -> int:
     add_encryption_args(
         subparsers.add_parser('encryption', help='Encryption key generation commands')
     )
+    add_search_args(subparsers.add_parser('search', help='Text search index commands'))
     add_user_args(subparsers.add_parser('user', help='User commands'))
     add_workflow_args(subparsers.add_parser('workflow', help='Workflow commands'))
     add_tasks_args(subparsers.add_parser('tasks', help='Celery tasks commands'))
@@ -0,0 +1,102 @@
+from typing import TYPE_CHECKING, ClassVar
+
+from starsol_mongo_migrate import BaseMigration
+
+if TYPE_CHECKING:
+    from pymongo.client_session import ClientSession
+    from pymongo.database import Database
+
+FIELD_SORT_VALUE = {
+    '$switch': {
+        'branches': [
+            {
+                'case': {'$in': ['$$f.type', ['user', 'user_multi']]},
+                'then': '$$f.value.email',
+            },
+            {
+                'case': {
+                    '$in': [
+                        '$$f.type',
+                        ['enum', 'enum_multi', 'state', 'version', 'version_multi'],
+                    ],
+                },
+                'then': '$$f.value.value',
+            },
+        ],
+        'default': '$$f.value',
+    },
+}
+
+SORT_KEYS = {
+    'id': {
+        '$let': {
+            'vars': {'parts': {'$split': [{'$arrayElemAt': ['$aliases', -1]}, '-']}},
+            'in': {
+                'slug': {'$arrayElemAt': ['$$parts', 0]},
+                'num': {
+                    '$convert': {
+                        'input': {'$arrayElemAt': ['$$parts', -1]},
+                        'to': 'int',
+                        'onError': None,
+                        'onNull': None,
+                    },
+                },
+            },
+        },
+    },
+    'fields': {
+        '$arrayToObject': {
+            '$map': {
+                'input': {
+                    '$filter': {
+                        'input': {'$ifNull': ['$fields', []]},
+                        'as': 'f',
+                        'cond': {
+                            '$not': [
+                                {'$regexMatch': {'input': '$$f.name', 'regex': '[.$]'}},
+                            ],
+                        },
+                    },
+                },
+                'as': 'f',
+                'in': {
+                    'k': {'$toLower': '$$f.name'},
+                    'v': {'$ifNull': [FIELD_SORT_VALUE, None]},
+                },
+            },
+        },
+    },
+}
+
+
+class Migration(BaseMigration):
+    """Materialize issue sort keys (id parts and custom field values)"""
+
+    revision: ClassVar[str] = '20261017000000'
+    down_revision: ClassVar[str | None] = '20250819000000'
+    name = 'issue sort keys'
+
+    def upgrade(self, session: 'ClientSession | None', db: 'Database') -> None:
+        issues_collection = db.get_collection('issues')
+
+        issues_collection.update_many(
+            {},
+            [{'$set': {'sort_keys': SORT_KEYS}}],
+            session=session,
+        )
+        issues_collection.create_index(
+            [('sort_keys.id.slug', 1), ('sort_keys.id.num', 1), ('_id', 1)],
+            name='sort_keys_id_index',
+        )
+
+    def downgrade(self, session: 'ClientSession | None', db: 'Database') -> None:
+        issues_collection = db.get_collection('issues')
+
+        for index in issues_collection.list_indexes():
+            if index['name'].startswith('sort_keys_'):
+                issues_collection.drop_index(index['name'])
+        issues_collection.update_many(
+            {},
+            {'$unset': {'sort_keys': ''}},
+            session=session,
+        )
@@ -0,0 +1,108 @@
+from typing import TYPE_CHECKING, ClassVar
+
+from starsol_mongo_migrate import BaseMigration
+
+if TYPE_CHECKING:
+    from pymongo.client_session import ClientSession
+    from pymongo.database import Database
+
+
+def _split_pipeline(array: str, into: str) -> list[dict]:
+    return [
+        {'$match': {f'{array}.0': {'$exists': True}}},
+        {'$unwind': f'${array}'},
+        {
+            '$replaceWith': {
+                '$mergeObjects': [
+                    f'${array}',
+                    {'_id': f'${array}.id', 'issue_id': '$_id'},
+                ],
+            },
+        },
+        {'$unset': 'id'},
+        {'$merge': {'into': into, 'on': '_id', 'whenMatched': 'keepExisting'}},
+    ]
+
+
+def _embed_pipeline(array: str, sort_key: str) -> list[dict]:
+    return [
+        {'$sort': {'issue_id': 1, sort_key: 1}},
+        {'$set': {'id': '$_id'}},
+        {'$unset': 'revision_id'},
+        {'$group': {'_id': '$issue_id', array: {'$push': '$$ROOT'}}},
+        {'$unset': [f'{array}._id', f'{array}.issue_id']},
+        {
+            '$merge': {
+                'into': 'issues',
+                'on': '_id',
+                'whenMatched': [{'$set': {array: f'$$new.{array}'}}],
+                'whenNotMatched': 'discard',
+            },
+        },
+    ]
+
+
+class Migration(BaseMigration):
+    """Move issue comments and history to their own collections"""
+
+    revision: ClassVar[str] = '20261017010000'
+    down_revision: ClassVar[str | None] = '20261017000000'
+    name = 'issue comments and history collections'
+
+    def upgrade(self, session: 'ClientSession | None', db: 'Database') -> None:
+        issues_collection = db.get_collection('issues')
+
+        issues_collection.aggregate(
+            _split_pipeline('comments', 'issue_comments'),
+            session=session,
+        )
+        issues_collection.aggregate(
+            _split_pipeline('history', 'issue_history'),
+            session=session,
+        )
+        issues_collection.update_many(
+            {},
+            [
+                {
+                    '$set': {
+                        'comments_count': {'$size': {'$ifNull': ['$comments', []]}},
+                        'last_comment_at': {'$max': '$comments.created_at'},
+                        'history_count': {'$size': {'$ifNull': ['$history', []]}},
+                        'last_history_at': {'$max': '$history.time'},
+                    },
+                },
+                {'$unset': ['comments', 'history']},
+            ],
+            session=session,
+        )
+
+    def downgrade(self, session: 'ClientSession | None', db: 'Database') -> None:
+        issues_collection = db.get_collection('issues')
+
+        issues_collection.update_many(
+            {},
+            {'$set': {'comments': [], 'history': []}},
+            session=session,
+        )
+        db.get_collection('issue_comments').aggregate(
+            _embed_pipeline('comments', 'created_at'),
+            session=session,
+        )
+        db.get_collection('issue_history').aggregate(
+            _embed_pipeline('history', 'time'),
+            session=session,
+        )
+        issues_collection.update_many(
+            {},
+            {
+                '$unset': {
+                    'comments_count': '',
+                    'last_comment_at': '',
+                    'history_count': '',
+                    'last_history_at': '',
+                },
+            },
+            session=session,
+        )
+        db.drop_collection('issue_comments', session=session)
+        db.drop_collection('issue_history', session=session)
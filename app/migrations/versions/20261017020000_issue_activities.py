@@ -0,0 +1,77 @@
+from typing import TYPE_CHECKING, ClassVar
+
+from starsol_mongo_migrate import BaseMigration
+
+if TYPE_CHECKING:
+    from pymongo.client_session import ClientSession
+    from pymongo.database import Database
+
+MERGE_ACTIVITIES = {
+    '$merge': {'into': 'activities', 'on': '_id', 'whenMatched': 'keepExisting'},
+}
+
+
+def _record_pipeline(action: str, time_field: str, with_changes: bool) -> list[dict]:
+    return [
+        {
+            '$lookup': {
+                'from': 'issues',
+                'localField': 'issue_id',
+                'foreignField': '_id',
+                'as': 'issue',
+            },
+        },
+        {'$unwind': '$issue'},
+        {
+            '$project': {
+                '_id': 0,
+                'time': f'${time_field}',
+                'author': '$author',
+                'action': {'$literal': action},
+                'issue_id': '$issue_id',
+                'project_id': '$issue.project.id',
+                'record_id': '$_id',
+                'changes': '$changes' if with_changes else {'$literal': None},
+            },
+        },
+        MERGE_ACTIVITIES,
+    ]
+
+
+class Migration(BaseMigration):
+    """Fill the activity log with existing issues, history records and comments"""
+
+    revision: ClassVar[str] = '20261017020000'
+    down_revision: ClassVar[str | None] = '20261017010000'
+    name = 'issue activities'
+
+    def upgrade(self, session: 'ClientSession | None', db: 'Database') -> None:
+        db.get_collection('issues').aggregate(
+            [
+                {
+                    '$project': {
+                        '_id': 0,
+                        'time': '$created_at',
+                        'author': '$created_by',
+                        'action': {'$literal': 'issue_created'},
+                        'issue_id': '$_id',
+                        'project_id': '$project.id',
+                        'record_id': {'$literal': None},
+                        'changes': {'$literal': None},
+                    },
+                },
+                MERGE_ACTIVITIES,
+            ],
+            session=session,
+        )
+        db.get_collection('issue_history').aggregate(
+            _record_pipeline('issue_updated', 'time', with_changes=True),
+            session=session,
+        )
+        db.get_collection('issue_comments').aggregate(
+            _record_pipeline('issue_commented', 'created_at', with_changes=False),
+            session=session,
+        )
+
+    def downgrade(self, session: 'ClientSession | None', db: 'Database') -> None:
+        db.drop_collection('activities', session=session)
@@ -163,6 +163,7 @@ async def _init_default_roles() -> None:
 
 @app.on_event('startup')
 async def app_init() -> None:
+    import pm.models as m
     from pm.cache import init_cache_system
     from pm.models import __beanie_models__
     from pm.tasks.app import broker
@@ -173,6 +174,8 @@ async def app_init() -> None:
     db = client.get_default_database()
     await init_beanie(db, document_models=__beanie_models__)
     init_read_only_projection_models(__beanie_models__)
+    m.start_audit_writer()
+    await m.Issue.ensure_sort_key_indexes(CONFIG.ISSUE_SORT_KEY_INDEXED_FIELDS)
 
     await _init_system_groups()
     await _init_default_roles()
@@ -183,6 +186,12 @@ async def app_init() -> None:
     # Initialize cache system
     await init_cache_system()
 
+    if CONFIG.SEARCH_INDEXER_EMBEDDED and CONFIG.REDIS_EVENT_BUS_URL:
+        from pm.services.text_search import SEARCH_BACKEND, start_embedded_indexer
+
+        if SEARCH_BACKEND.is_indexed:
+            start_embedded_indexer()
+
     logger.info('API server worker initialized')
 
 
@@ -215,9 +224,21 @@ connect_error_handlers(app)
 
 @app.on_event('shutdown')
 async def app_shutdown() -> None:
+    from pm.api.events_hub import shutdown_events_hub
     from pm.cache import shutdown_cache_system
+    from pm.models import stop_audit_writer
+    from pm.services.index_advisor import flush_usage
+    from pm.services.text_search import SEARCH_BACKEND, stop_embedded_indexer
     from pm.tasks.app import broker
 
+    # Stop shared event bus subscriber
+    await shutdown_events_hub()
+
+    await stop_embedded_indexer()
+    await SEARCH_BACKEND.close()
+    await flush_usage()
+    await stop_audit_writer()
+
     # Clean shutdown of taskiq broker
     await broker.shutdown()
 
@@ -16,7 +16,7 @@ import pm.models as m
 from pm.api.exceptions import MFARequiredError
 from pm.api.request_ctx import set_request_context
 from pm.api.utils.jwt_validator import JWTValidationError, is_jwt, validate_jwt
-from pm.cache import cached
+from pm.cache import CacheTag, cached
 from pm.config import API_SERVICE_TOKEN_KEYS, CONFIG
 from pm.permissions import (
     GlobalPermissions,
@@ -36,6 +36,8 @@ __all__ = (
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
+ACL_LOCAL_CACHE_TTL = 60  # seconds
+
 
 def _serialize_permissions_dict(
     data: dict[PydanticObjectId, set[ProjectPermissions]],
@@ -98,6 +100,16 @@ def _user_global_permissions_key_builder(
     return f'user_global_permissions:{user.id}'
 
 
+# pylint: disable=unused-argument
+# ruff: noqa: ARG001
+def _user_accessible_tags_key_builder(
+    func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> str:
+    """Build cache key for resolve_accessible_tag_ids based on user ID."""
+    user_ctx = args[0]
+    return f'user_accessible_tags:{user_ctx.user.id}'
+
+
 @dataclass
 class UserContext:
     user: m.User
@@ -214,6 +226,28 @@ class UserContext:
             ]
         }
 
+    def get_issue_event_read_filter(self) -> Callable[[dict], bool]:
+        """In-memory counterpart of ``get_issue_filter_for_permission(ISSUE_READ)``.
+
+        Evaluates issue event payloads built by ``issue_event_data``.
+        """
+        project_ids = {
+            str(pr)
+            for pr in self.get_projects_with_permission(ProjectPermissions.ISSUE_READ)
+        }
+        user_id = str(self.user.id)
+        group_ids = {str(gr) for gr in self.all_group_ids}
+
+        def check(data: dict) -> bool:
+            summary = data.get('permissions') or {}
+            if summary.get('inherit', True) and data.get('project_id') in project_ids:
+                return True
+            return user_id in summary.get('users', ()) or not group_ids.isdisjoint(
+                summary.get('groups', ())
+            )
+
+        return check
+
     def check_issue_permissions(
         self,
         issue: m.Issue,
@@ -229,8 +263,7 @@ class UserContext:
     async def get_accessible_tag_ids(self) -> set[PydanticObjectId]:
         """Lazy load and cache accessible tag IDs for this request"""
         if self._accessible_tag_ids is None:
-            accessible_tags = await m.Tag.find(m.Tag.get_filter_query(self)).to_list()
-            self._accessible_tag_ids = {tag.id for tag in accessible_tags}
+            self._accessible_tag_ids = await resolve_accessible_tag_ids(self)
         return self._accessible_tag_ids
 
 
@@ -307,12 +340,13 @@ async def admin_context_dependency(
 
 
 @cached(
-    ttl=120,
-    tags=['groups:all'],
+    ttl=CONFIG.CACHE_ACL_TTL_SECONDS,
+    tags=[CacheTag.GROUPS],
     namespace='acl',
     serializer=serialize_objectid_set,
     deserializer=deserialize_objectid_set,
     key_builder=_user_groups_key_builder,
+    local_ttl=ACL_LOCAL_CACHE_TTL,
 )
 async def resolve_all_user_groups(user: m.User) -> set[PydanticObjectId]:
     """Resolve all group IDs for user (stored + dynamic)"""
@@ -333,32 +367,40 @@ async def resolve_all_user_groups(user: m.User) -> set[PydanticObjectId]:
 
 
 @cached(
-    ttl=120,
-    tags=['projects:all', 'permissions:all'],
+    ttl=CONFIG.CACHE_ACL_TTL_SECONDS,
+    tags=[CacheTag.PROJECTS, CacheTag.PERMISSIONS, CacheTag.GROUPS],
     namespace='acl',
     serializer=_serialize_permissions_dict,
     deserializer=_deserialize_permissions_dict,
     key_builder=_user_permissions_key_builder,
+    local_ttl=ACL_LOCAL_CACHE_TTL,
 )
 async def resolve_user_permissions(
     user: m.User,
     all_group_ids: set[PydanticObjectId] | None = None,
 ) -> dict[PydanticObjectId, set[ProjectPermissions]]:
-    """Resolve project permissions for user across all projects."""
+    """Resolve project permissions for user.
+
+    Only projects granting a role to the user or one of their groups are
+    loaded; projects missing from the result grant no permissions.
+    """
     if all_group_ids is None:
         all_group_ids = await resolve_all_user_groups(user)
 
-    projects = await m.Project.find_all().to_list()
+    projects = await m.Project.find_by_permission_targets(
+        user.id, all_group_ids
+    ).to_list()
     return {pr.id: pr.get_user_permissions(user, all_group_ids) for pr in projects}
 
 
 @cached(
-    ttl=120,
-    tags=['groups:all', 'global_permissions:all'],
+    ttl=CONFIG.CACHE_ACL_TTL_SECONDS,
+    tags=[CacheTag.GROUPS, CacheTag.GLOBAL_PERMISSIONS],
     namespace='acl',
     serializer=_serialize_global_permissions_set,
     deserializer=_deserialize_global_permissions_set,
     key_builder=_user_global_permissions_key_builder,
+    local_ttl=ACL_LOCAL_CACHE_TTL,
 )
 async def resolve_user_global_permissions(
     user: m.User,
@@ -428,3 +470,17 @@ async def get_user_from_service_token(token: str, request: Request) -> m.User |
         )
     user: m.User | None = await m.User.find_one(m.User.email == data['sub'])
     return user
+
+
+@cached(
+    ttl=CONFIG.CACHE_ACL_TTL_SECONDS,
+    tags=[CacheTag.TAGS, CacheTag.GROUPS],
+    namespace='acl',
+    serializer=serialize_objectid_set,
+    deserializer=deserialize_objectid_set,
+    key_builder=_user_accessible_tags_key_builder,
+    local_ttl=ACL_LOCAL_CACHE_TTL,
+)
+async def resolve_accessible_tag_ids(user_ctx: UserContext) -> set[PydanticObjectId]:
+    """Resolve IDs of tags shared with the user or one of their groups."""
+    return set(await m.Tag.distinct('_id', m.Tag.get_filter_query(user_ctx)))
@@ -1,17 +1,60 @@
 import redis.asyncio as aioredis
 
+import pm.models as m
 from pm.config import CONFIG
+from pm.permissions import ProjectPermissions
 from pm.utils.events_bus import Event
 
-__all__ = ('send_event',)
+__all__ = (
+    'issue_event_data',
+    'send_event',
+    'send_events',
+)
 
 _POOL = None
 if CONFIG.REDIS_EVENT_BUS_URL:
     _POOL = aioredis.ConnectionPool.from_url(CONFIG.REDIS_EVENT_BUS_URL)
 
 
+def issue_event_data(issue: m.Issue) -> dict:
+    """Build issue event payload with a summary of issue-level read access.
+
+    The summary lets event consumers check access in memory with the same
+    semantics as ``UserContext.get_issue_filter_for_permission``.
+    """
+    readers: dict[str, list[str]] = {'users': [], 'groups': []}
+    for perm in issue.permissions:
+        if ProjectPermissions.ISSUE_READ not in perm.role.permissions:
+            continue
+        target_key = (
+            'users' if perm.target_type == m.PermissionTargetType.USER else 'groups'
+        )
+        readers[target_key].append(str(perm.target.id))
+    return {
+        'issue_id': str(issue.id),
+        'project_id': str(issue.project.id),
+        'permissions': {
+            'inherit': not issue.disable_project_permissions_inheritance,
+            **readers,
+        },
+    }
+
+
 async def send_event(event: Event) -> None:
     if not _POOL:
         return
     async with aioredis.Redis(connection_pool=_POOL) as client:
-        await event.send(client=client)
+        await event.send(client=client, maxlen=CONFIG.EVENTS_STREAM_MAXLEN)
+
+
+async def send_events(events: list[Event]) -> None:
+    """Send events in a single pipelined round trip."""
+    if not _POOL or not events:
+        return
+    async with (
+        aioredis.Redis(connection_pool=_POOL) as client,
+        client.pipeline(transaction=False) as pipe,
+    ):
+        for event in events:
+            await event.send(client=pipe, maxlen=CONFIG.EVENTS_STREAM_MAXLEN)
+        await pipe.execute()
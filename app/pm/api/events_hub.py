@@ -0,0 +1,285 @@
+import asyncio
+import contextlib
+import logging
+from collections import defaultdict
+from collections.abc import AsyncGenerator, Callable
+
+import redis.asyncio as aioredis
+import redis.exceptions as redis_exc
+
+from pm.config import CONFIG
+from pm.utils.events_bus import EVENTS_STREAM, Event, stream_id_key
+
+__all__ = (
+    'RESYNC',
+    'EventSubscription',
+    'EventsHub',
+    'ResyncT',
+    'get_events_hub',
+    'shutdown_events_hub',
+)
+
+logger = logging.getLogger(__name__)
+
+RECONNECT_DELAY = 1  # seconds
+RECONNECT_MAX_DELAY = 30  # seconds
+READ_BLOCK_MS = 5000
+READ_BATCH_SIZE = 100
+
+
+class ResyncT:
+    """Marker returned to a subscriber which lost events and must resync its state."""
+
+
+RESYNC = ResyncT()
+
+
+class EventSubscription:
+    """Per-connection bounded queue fed by the shared hub.
+
+    When the consumer is too slow the oldest queued event is dropped and
+    the next read returns ``RESYNC`` before the remaining events. Events
+    rejected by ``predicate`` are never queued.
+    """
+
+    def __init__(
+        self,
+        issue_ids: set[str] | None = None,
+        project_ids: set[str] | None = None,
+        max_size: int = 1000,
+        predicate: Callable[[Event], bool] | None = None,
+    ) -> None:
+        self.issue_ids = issue_ids or None
+        self.project_ids = project_ids or None
+        self.predicate = predicate
+        self.dropped = 0
+        self._queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=max_size)
+        self._resync = False
+        self._wakeup = asyncio.Event()
+
+    @property
+    def is_wildcard(self) -> bool:
+        return not self.issue_ids and not self.project_ids
+
+    def accepts(self, event: Event) -> bool:
+        return self.predicate is None or self.predicate(event)
+
+    def matches(self, event: Event) -> bool:
+        if not self.is_wildcard and not (
+            (self.issue_ids and event.data.get('issue_id') in self.issue_ids)
+            or (self.project_ids and event.data.get('project_id') in self.project_ids)
+        ):
+            return False
+        return self.accepts(event)
+
+    def push(self, event: Event) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+            self._resync = True
+        self._queue.put_nowait(event)
+        self._wakeup.set()
+
+    def request_resync(self) -> None:
+        self._resync = True
+        self._wakeup.set()
+
+    async def get(self) -> Event | ResyncT:
+        while True:
+            if self._resync:
+                self._resync = False
+                return RESYNC
+            if not self._queue.empty():
+                return self._queue.get_nowait()
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+
+class EventsHub:
+    """Single Redis stream reader per worker dispatching decoded events to subscriptions.
+
+    Subscriptions are indexed by issue and project id so each event is decoded
+    once and only delivered to the connections interested in it.
+    """
+
+    def __init__(self, redis_url: str, stream: str = EVENTS_STREAM) -> None:
+        self.redis_url = redis_url
+        self.stream = stream
+        self.last_id: str | None = None
+        self._wildcard: set[EventSubscription] = set()
+        self._by_issue: defaultdict[str, set[EventSubscription]] = defaultdict(set)
+        self._by_project: defaultdict[str, set[EventSubscription]] = defaultdict(set)
+        self._task: asyncio.Task | None = None
+
+    @property
+    def subscriptions_count(self) -> int:
+        return len(self._all_subscriptions())
+
+    def add(self, sub: EventSubscription) -> None:
+        if sub.is_wildcard:
+            self._wildcard.add(sub)
+        for issue_id in sub.issue_ids or ():
+            self._by_issue[issue_id].add(sub)
+        for project_id in sub.project_ids or ():
+            self._by_project[project_id].add(sub)
+        self._ensure_started()
+
+    def remove(self, sub: EventSubscription) -> None:
+        self._wildcard.discard(sub)
+        for index, keys in (
+            (self._by_issue, sub.issue_ids),
+            (self._by_project, sub.project_ids),
+        ):
+            for key in keys or ():
+                if not (subs := index.get(key)):
+                    continue
+                subs.discard(sub)
+                if not subs:
+                    del index[key]
+
+    @contextlib.asynccontextmanager
+    async def subscribe(
+        self,
+        issue_ids: set[str] | None = None,
+        project_ids: set[str] | None = None,
+        predicate: Callable[[Event], bool] | None = None,
+    ) -> AsyncGenerator[EventSubscription, None]:
+        sub = EventSubscription(
+            issue_ids=issue_ids,
+            project_ids=project_ids,
+            max_size=CONFIG.EVENTS_SUBSCRIPTION_QUEUE_SIZE,
+            predicate=predicate,
+        )
+        self.add(sub)
+        try:
+            yield sub
+        finally:
+            self.remove(sub)
+
+    def match(self, event: Event) -> set[EventSubscription]:
+        result = set(self._wildcard)
+        if (issue_id := event.data.get('issue_id')) and (
+            subs := self._by_issue.get(issue_id)
+        ):
+            result.update(subs)
+        if (project_id := event.data.get('project_id')) and (
+            subs := self._by_project.get(project_id)
+        ):
+            result.update(subs)
+        return result
+
+    def dispatch(self, event: Event) -> None:
+        for sub in self.match(event):
+            if sub.accepts(event):
+                sub.push(event)
+
+    def resync_all(self) -> None:
+        for sub in self._all_subscriptions():
+            sub.request_resync()
+
+    async def stop(self) -> None:
+        if not self._task:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def _all_subscriptions(self) -> set[EventSubscription]:
+        subs = set(self._wildcard)
+        for index in (self._by_issue, self._by_project):
+            for subs_ in index.values():
+                subs.update(subs_)
+        return subs
+
+    def _ensure_started(self) -> None:
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def replay(self, after_id: str, limit: int) -> list[Event] | None:
+        """Read events stored after ``after_id``.
+
+        Returns ``None`` when the gap cannot be replayed: the id is unknown,
+        already trimmed from the stream or more than ``limit`` events behind.
+        """
+        try:
+            after_key = stream_id_key(after_id)
+        except ValueError:
+            return None
+        async with aioredis.from_url(self.redis_url) as client:
+            first = await client.xrange(self.stream, count=1)
+            if not first or stream_id_key(first[0][0]) > after_key:
+                return None
+            entries = await client.xrange(
+                self.stream, min=f'({after_id}', count=limit + 1
+            )
+        if len(entries) > limit:
+            return None
+        return [
+            Event.from_stream_entry(entry_id, fields) for entry_id, fields in entries
+        ]
+
+    async def _read_start_id(self, client: aioredis.Redis) -> str:
+        if self.last_id is None:
+            last = await client.xrevrange(self.stream, count=1)
+            return last[0][0].decode() if last else '0-0'
+        first = await client.xrange(self.stream, count=1)
+        if first and stream_id_key(first[0][0]) > stream_id_key(self.last_id):
+            # entries we have not seen were trimmed while disconnected
+            self.resync_all()
+        return self.last_id
+
+    async def _run(self) -> None:
+        delay = RECONNECT_DELAY
+        while True:
+            client = aioredis.from_url(self.redis_url)
+            try:
+                self.last_id = await self._read_start_id(client)
+                delay = RECONNECT_DELAY
+                while True:
+                    response = await client.xread(
+                        {self.stream: self.last_id},
+                        count=READ_BATCH_SIZE,
+                        block=READ_BLOCK_MS,
+                    )
+                    for _, entries in response:
+                        for entry_id, fields in entries:
+                            self._dispatch_entry(entry_id, fields)
+            except (redis_exc.RedisError, ConnectionError, OSError) as err:
+                logger.warning(
+                    'Event bus reader disconnected, reconnecting',
+                    exc_info=err,
+                    extra={'delay': delay},
+                )
+            finally:
+                with contextlib.suppress(
+                    redis_exc.RedisError, ConnectionError, OSError
+                ):
+                    await client.aclose()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    def _dispatch_entry(self, entry_id: bytes, fields: dict[bytes, bytes]) -> None:
+        self.last_id = entry_id.decode()
+        try:
+            event = Event.from_stream_entry(entry_id, fields)
+        except (ValueError, KeyError) as err:
+            logger.warning('Malformed event on bus', exc_info=err)
+            return
+        self.dispatch(event)
+
+
+_HUB: EventsHub | None = None
+
+
+def get_events_hub() -> EventsHub:
+    global _HUB  # pylint: disable=global-statement  # noqa: PLW0603
+    if _HUB is None:
+        _HUB = EventsHub(CONFIG.REDIS_EVENT_BUS_URL)
+    return _HUB
+
+
+async def shutdown_events_hub() -> None:
+    if _HUB is not None:
+        await _HUB.stop()
@@ -5,7 +5,7 @@ import beanie.operators as bo
 from beanie import PydanticObjectId
 
 import pm.models as m
-from pm.cache import cached
+from pm.cache import CacheTag, cached
 from pm.utils.cache.serializers import deserialize_objectid_set, serialize_objectid_set
 from pm.utils.document import DocumentIdRO
 
@@ -53,7 +53,7 @@ def _user_favorite_projects_key_builder(
 
 @cached(
     ttl=120,
-    tags=['projects:all'],
+    tags=[CacheTag.PROJECTS],
     namespace='settings',
     serializer=serialize_objectid_set,
     deserializer=deserialize_objectid_set,
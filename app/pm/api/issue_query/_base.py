@@ -1,6 +1,7 @@
 from typing import Any
 
 import pm.models as m
+from pm.services.custom_field_catalog import get_custom_field_catalog
 
 __all__ = (
     'IssueQueryTransformError',
@@ -17,18 +18,5 @@ class IssueQueryTransformError(Exception):
 
 
 async def get_custom_fields() -> dict[str, m.CustomFieldTypeT]:
-    fields = (
-        await m.CustomField.find(with_children=True)
-        .aggregate(
-            [
-                {
-                    '$group': {
-                        '_id': '$name',
-                        'type': {'$first': '$type'},
-                    },
-                },
-            ],
-        )
-        .to_list()
-    )
-    return {field['_id'].lower(): m.CustomFieldTypeT(field['type']) for field in fields}
+    catalog = await get_custom_field_catalog()
+    return catalog.types
@@ -1,5 +1,7 @@
 import re
+from dataclasses import dataclass
 from datetime import date, datetime, time
+from functools import lru_cache
 from typing import Any
 
 from beanie import PydanticObjectId
@@ -8,6 +10,7 @@ from dateutil.relativedelta import relativedelta
 from lark import (
     Lark,
     Transformer,
+    Tree,
     UnexpectedCharacters,
     UnexpectedEOF,
     UnexpectedToken,
@@ -26,7 +29,10 @@ from pm.api.issue_query.parse_logical_expression import (
     check_brackets,
     parse_logical_expression,
 )
+from pm.services.index_advisor import observe_search
+from pm.services.text_search import SEARCH_BACKEND
 from pm.utils.dateutils import utcnow
+from pm.utils.text_search import BaseSearchBackend, TooManyHitsError
 
 from ._base import IssueQueryTransformError, get_custom_fields
 
@@ -41,7 +47,11 @@ DURATION_UNIT_MULTIPLIERS = {
 __all__ = (
     'HASHTAG_VALUES',
     'RESERVED_FIELDS',
+    'CompiledExpression',
     'SearchTransformError',
+    'compile_expression',
+    'compile_search',
+    'resolve_text_search',
     'transform_search',
     'transform_text_search',
 )
@@ -502,19 +512,26 @@ class SearchTransformError(IssueQueryTransformError):
 
 parser = Lark(EXPRESSION_GRAMMAR, parser='lalr', propagate_positions=False, cache=True)
 
+COMPILED_QUERY_CACHE_SIZE = 1024
 
-async def transform_expression(
-    expression: str,
-    cached_fields: dict[str, m.CustomFieldTypeT],
-    current_user_email: str | None = None,
-) -> dict:
+
+@dataclass(frozen=True, slots=True)
+class CompiledExpression:
+    """Parse result of a single expression node of a search query.
+
+    ``tree`` is the Lark tree to bind, ``context`` is trailing text which
+    could not be parsed and is searched as text. Without a tree the whole
+    expression is a text search.
+    """
+
+    tree: Tree | None = None
+    context: str | None = None
+    text: str | None = None
+
+
+def _parse_expression(expression: str) -> Tree:
     try:
-        tree = parser.parse(expression)
-        transformer = MongoQueryTransformer(
-            current_user_email,
-            cached_fields=cached_fields,
-        )
-        return transformer.transform(tree)
+        return parser.parse(expression)
     except UnexpectedToken as err:
         raise SearchTransformError(
             'Failed to parse query',
@@ -530,6 +547,19 @@ async def transform_expression(
         raise SearchTransformError(
             'Failed to parse query', position=err.pos_in_stream
         ) from err
+
+
+def _bind_expression(
+    tree: Tree,
+    cached_fields: dict[str, m.CustomFieldTypeT],
+    current_user_email: str | None = None,
+) -> dict:
+    try:
+        transformer = MongoQueryTransformer(
+            current_user_email,
+            cached_fields=cached_fields,
+        )
+        return transformer.transform(tree)
     except ValueError as err:
         raise SearchTransformError(str(err)) from err
     except VisitError as err:
@@ -538,68 +568,116 @@ async def transform_expression(
         raise SearchTransformError('Failed to parse query') from err
 
 
+async def transform_expression(
+    expression: str,
+    cached_fields: dict[str, m.CustomFieldTypeT],
+    current_user_email: str | None = None,
+) -> dict:
+    return _bind_expression(
+        _parse_expression(expression),
+        cached_fields=cached_fields,
+        current_user_email=current_user_email,
+    )
+
+
+@lru_cache(maxsize=COMPILED_QUERY_CACHE_SIZE)
+def compile_expression(expression: str) -> CompiledExpression:
+    """Parse an expression node, falling back to text search where the syntax allows."""
+    try:
+        return CompiledExpression(tree=_parse_expression(expression))
+    except SearchTransformError as exc:
+        if not isinstance(exc.orig_exc, UnexpectedToken):
+            raise
+        if any(keyword in ('_COLON', 'FIELD_NAME') for keyword in exc.expected):
+            return CompiledExpression(text=expression)
+        if exc.position > 0 and expression[exc.position - 1].isspace():
+            whitespace_start = exc.position - 1
+            while whitespace_start > 0 and expression[whitespace_start - 1].isspace():
+                whitespace_start -= 1
+            return CompiledExpression(
+                tree=_parse_expression(expression[:whitespace_start].strip()),
+                context=expression[whitespace_start:].strip() or None,
+            )
+        raise
+
+
 OPERATOR_MAP = {
     LogicalOperatorT.AND: '$and',
     LogicalOperatorT.OR: '$or',
 }
 
 
-def _check_mongo_text_exp_exceeded(query: dict) -> bool:
+def _count_text_clauses(query: dict) -> int:
     count = 0
     stack = [query]
     while stack:
         current = stack.pop()
         if '$text' in current:
             count += 1
-            if count > 1:
-                return True
         for value in current.values():
             if isinstance(value, dict):
                 stack.append(value)
             elif isinstance(value, list):
                 stack.extend(item for item in value if isinstance(item, dict))
-    return count > 1
+    return count
+
+
+async def _replace_text_clauses(node: Any, backend: BaseSearchBackend) -> Any:
+    if isinstance(node, list):
+        return [await _replace_text_clauses(item, backend) for item in node]
+    if not isinstance(node, dict):
+        return node
+    result = {
+        key: await _replace_text_clauses(value, backend)
+        for key, value in node.items()
+        if key != '$text'
+    }
+    if '$text' not in node:
+        return result
+    try:
+        clause = await backend.match(node['$text']['$search'])
+    except TooManyHitsError as err:
+        raise SearchTransformError(
+            f'Text search matches more than {err.max_hits} issues, '
+            'make it more specific',
+        ) from err
+    return {'$and': [result, clause]} if result else clause
+
+
+async def resolve_text_search(
+    query: dict,
+    backend: BaseSearchBackend | None = None,
+) -> dict:
+    """Let the search backend serve the ``$text`` clauses of a query."""
+    if backend is None:
+        backend = SEARCH_BACKEND
+    if not (count := _count_text_clauses(query)):
+        return query
+    if backend.text_clause_limit is not None and count > backend.text_clause_limit:
+        raise SearchTransformError('Failed to parse query')
+    return await _replace_text_clauses(query, backend)
 
 
 async def _transform_tree_and_extract_context(
-    node: Node,
+    node: ExpressionNode,
     cached_fields: dict[str, m.CustomFieldTypeT],
     current_user_email: str | None = None,
 ) -> dict:
-    try:
-        return await transform_expression(
-            node.expression,
-            cached_fields=cached_fields,
-            current_user_email=current_user_email,
-        )
-    except SearchTransformError as exc:
-        orig_exc = getattr(exc, 'orig_exc', None)
-        if orig_exc and isinstance(orig_exc, UnexpectedToken):
-            if any(keyword in ('_COLON', 'FIELD_NAME') for keyword in exc.expected):
-                return transform_text_search(node.expression)
-            if exc.position > 0 and node.expression[exc.position - 1].isspace():
-                whitespace_start = exc.position - 1
-                while (
-                    whitespace_start > 0
-                    and node.expression[whitespace_start - 1].isspace()
-                ):
-                    whitespace_start -= 1
-                orig_node_exp = node.expression[:whitespace_start].strip()
-                context_part = node.expression[whitespace_start:].strip()
-                result = await transform_expression(
-                    orig_node_exp,
-                    cached_fields=cached_fields,
-                    current_user_email=current_user_email,
-                )
-                if context_part:
-                    text_field_query = result.get('$text', {}).get('$search')
-                    if text_field_query is not None:
-                        result['$text']['$search'] += ' ' + context_part
-                    else:
-                        result['__context_search'] = context_part
-                return result
-            raise
-        raise
+    compiled = compile_expression(node.expression)
+    if compiled.tree is None:
+        return transform_text_search(compiled.text)
+    result = _bind_expression(
+        compiled.tree,
+        cached_fields=cached_fields,
+        current_user_email=current_user_email,
+    )
+    if compiled.context:
+        text_field_query = result.get('$text', {}).get('$search')
+        if text_field_query is not None:
+            result['$text']['$search'] += ' ' + compiled.context
+        else:
+            result['__context_search'] = compiled.context
+    return result
 
 
 async def _merge_nodes_with_context(
@@ -640,10 +718,15 @@ async def transform_tree(
     return {}
 
 
-async def transform_search(query: str, current_user_email: str | None = None) -> dict:
-    if not query:
-        return {}
+@lru_cache(maxsize=COMPILED_QUERY_CACHE_SIZE)
+def compile_search(query: str) -> Node | None:
+    """Parse the logical structure of a search query.
 
+    The result only depends on the query text and is cached; expression nodes
+    are parsed by ``compile_expression`` (cached as well) when first bound.
+    User and time relative values (``me``, ``now``, ``today``, ``this``
+    periods) are resolved when binding, so cached plans never go stale.
+    """
     try:
         check_brackets(query)
     except BracketError as err:
@@ -653,7 +736,7 @@ async def transform_search(query: str, current_user_email: str | None = None) ->
                 position=err.pos,
             ) from err
     try:
-        tree = parse_logical_expression(query)
+        return parse_logical_expression(query)
     except OperatorError as err:
         raise SearchTransformError(
             f'Invalid operator "{err.operator}" at position {err.pos}',
@@ -662,7 +745,12 @@ async def transform_search(query: str, current_user_email: str | None = None) ->
         ) from err
     except UnexpectedEndOfExpressionError as err:
         raise SearchTransformError(str(err)) from err
-    if not tree:
+
+
+async def transform_search(query: str, current_user_email: str | None = None) -> dict:
+    if not query:
+        return {}
+    if not (tree := compile_search(query)):
         return {}
     custom_fields = await get_custom_fields()
     result = await transform_tree(
@@ -671,9 +759,8 @@ async def transform_search(query: str, current_user_email: str | None = None) ->
     if result and '__context_search' in result:
         ctx = result.pop('__context_search')
         result = {'$and': [result, transform_text_search(ctx)]}
-    if _check_mongo_text_exp_exceeded(result):
-        raise SearchTransformError('Failed to parse query')
-    return result
+    observe_search(result)
+    return await resolve_text_search(result)
 
 
 def transform_text_search(search: str) -> dict:
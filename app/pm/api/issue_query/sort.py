@@ -6,8 +6,6 @@ from lark import (
     UnexpectedToken,
 )
 
-import pm.models as m
-
 from ._base import IssueQueryTransformError, get_custom_fields
 
 __all__ = (
@@ -61,58 +59,6 @@ class SortTransformer(Transformer):
 parser = Lark(SORT_GRAMMAR, lexer='dynamic_complete')
 
 
-def map_value_subfield(field_type: m.CustomFieldTypeT) -> str:
-    if field_type in (m.CustomFieldTypeT.USER, m.CustomFieldTypeT.USER_MULTI):
-        return 'value.email'
-    if field_type in (
-        m.CustomFieldTypeT.ENUM,
-        m.CustomFieldTypeT.ENUM_MULTI,
-        m.CustomFieldTypeT,
-        m.CustomFieldTypeT.STATE,
-        m.CustomFieldTypeT.VERSION,
-        m.CustomFieldTypeT.VERSION_MULTI,
-    ):
-        return 'value.value'
-    return 'value'
-
-
-def _gen_sort_field(
-    field_name: str,
-    custom_fields: dict[str, m.CustomFieldTypeT],
-) -> dict:
-    if not (field_type := custom_fields.get(field_name.lower())):
-        raise SortTransformError(f'Field {field_name} not found')
-    return {
-        '$ifNull': [
-            {
-                '$arrayElemAt': [
-                    {
-                        '$map': {
-                            'input': {
-                                '$filter': {
-                                    'input': '$fields',
-                                    'as': 'field',
-                                    'cond': {
-                                        '$regexMatch': {
-                                            'input': '$$field.name',
-                                            'regex': f'^{field_name.lower()}$',
-                                            'options': 'i',
-                                        },
-                                    },
-                                },
-                            },
-                            'as': 'matchedField',
-                            'in': f'$$matchedField.{map_value_subfield(field_type)}',
-                        },
-                    },
-                    0,
-                ],
-            },
-            None,
-        ],
-    }
-
-
 async def transform_sort(
     sort_expr: str,
 ) -> list:
@@ -131,49 +77,18 @@ async def transform_sort(
 
     custom_fields = await get_custom_fields()
 
-    add_field_stage = {}
     sort_stage = {}
-    projection_stage = {}
 
     for field_name, is_descending in fields:
         field_name_lower = field_name.lower()
+        direction = -1 if is_descending else 1
 
         if field_name_lower == 'project':
-            sort_field = 'project.name'
-            sort_stage[sort_field] = -1 if is_descending else 1
+            sort_stage['project.name'] = direction
             continue
         if field_name_lower == 'id':
-            sort_field = f'{field_name_lower}__sort'
-            add_field_stage.update(
-                {
-                    f'{sort_field}___p1': {
-                        '$arrayElemAt': [
-                            {'$split': [{'$arrayElemAt': ['$aliases', -1]}, '-']},
-                            0,
-                        ]
-                    },
-                    f'{sort_field}___p2': {
-                        '$toInt': {
-                            '$arrayElemAt': [
-                                {'$split': [{'$arrayElemAt': ['$aliases', -1]}, '-']},
-                                -1,
-                            ]
-                        }
-                    },
-                }
-            )
-            sort_stage.update(
-                {
-                    f'{sort_field}___p1': -1 if is_descending else 1,
-                    f'{sort_field}___p2': -1 if is_descending else 1,
-                }
-            )
-            projection_stage.update(
-                {
-                    f'{sort_field}___p1': 0,
-                    f'{sort_field}___p2': 0,
-                }
-            )
+            sort_stage['sort_keys.id.slug'] = direction
+            sort_stage['sort_keys.id.num'] = direction
             continue
         if field_name_lower in {
             'subject',
@@ -182,38 +97,22 @@ async def transform_sort(
             'resolved_at',
             'closed_at',
         }:
-            sort_stage[field_name_lower] = -1 if is_descending else 1
+            sort_stage[field_name_lower] = direction
             continue
         if field_name_lower in {'created_by', 'updated_by'}:
-            sort_field = f'{field_name_lower}.email'
-            sort_stage[sort_field] = -1 if is_descending else 1
+            sort_stage[f'{field_name_lower}.email'] = direction
             continue
-        sort_field = f'{field_name_lower}__sort'
-        add_field_stage[sort_field] = _gen_sort_field(
-            field_name_lower,
-            custom_fields=custom_fields,
-        )
-        projection_stage[sort_field] = 0
-        sort_stage[sort_field] = -1 if is_descending else 1
+        if field_name_lower not in custom_fields:
+            raise SortTransformError(f'Field {field_name} not found')
+        # sort keys are materialized on write, see Issue.update_sort_keys
+        sort_stage[f'sort_keys.fields.{field_name_lower}'] = direction
 
     pipeline = []
-    if add_field_stage:
-        pipeline.append(
-            {
-                '$addFields': add_field_stage,
-            },
-        )
     if sort_stage:
         pipeline.append(
             {
                 '$sort': sort_stage,
             },
         )
-    if projection_stage:
-        pipeline.append(
-            {
-                '$project': projection_stage,
-            },
-        )
 
     return pipeline
@@ -1,16 +1,24 @@
+import asyncio
 from datetime import datetime
 from enum import StrEnum
 from http import HTTPStatus
-from http.client import HTTPException
-from typing import Self
+from typing import Annotated, Self
 
 import beanie.operators as bo
 from beanie import PydanticObjectId
-from fastapi import Depends
-from pydantic import BaseModel
+from fastapi import Depends, HTTPException, Query
+from pydantic import BaseModel, Field
 
 import pm.models as m
 from pm.api.context import current_user, current_user_context_dependency
+from pm.api.utils.pagination import (
+    COUNT_MODE_PATTERN,
+    CountMode,
+    InvalidCursorError,
+    fetch_page,
+    keyset_pipeline,
+    next_cursor,
+)
 from pm.api.utils.router import APIRouter
 from pm.api.views.error_responses import AUTH_ERRORS, error_responses
 from pm.api.views.issue import (
@@ -18,7 +26,7 @@ from pm.api.views.issue import (
     ProjectField,
     issue_change_output_from_obj,
 )
-from pm.api.views.output import BaseListOutput
+from pm.api.views.output import CursorListOutput
 from pm.api.views.user import UserIdentifier, UserOutput
 from pm.permissions import ProjectPermissions
 from pm.utils.dateutils import utcfromtimestamp
@@ -39,6 +47,33 @@ class ActionT(StrEnum):
     ISSUE_COMMENTED = 'issue_commented'
 
 
+class ActivityListParams(BaseModel):
+    start: float
+    end: float
+    user_id: UserIdentifier | None = None
+    limit: int = Query(100, ge=1, le=1000, description='limit results')
+    cursor: str | None = Query(
+        None,
+        description='next_cursor of the previous page',
+    )
+    count_mode: str = Query(
+        'exact',
+        pattern=COUNT_MODE_PATTERN,
+        description='exact, estimated, none or capped:N (count at most N activities)',
+    )
+
+
+class IssueShortRO(BaseModel):
+    id: Annotated[PydanticObjectId, Field(alias='_id')]
+    aliases: list[str]
+    project: m.ProjectLinkField
+    subject: str
+
+    @property
+    def id_readable(self) -> str:
+        return self.aliases[-1] if self.aliases else str(self.id)
+
+
 class IssueShortOutput(BaseModel):
     id: PydanticObjectId
     aliases: list[str]
@@ -47,7 +82,7 @@ class IssueShortOutput(BaseModel):
     id_readable: str
 
     @classmethod
-    def from_obj(cls, obj: m.Issue) -> Self:
+    def from_obj(cls, obj: m.Issue | IssueShortRO) -> Self:
         return cls(
             id=obj.id,
             aliases=obj.aliases,
@@ -65,87 +100,102 @@ class Activity(BaseModel):
     changes: list[IssueChangeOutputRootModel] | None = None
 
 
-def _get_issue_activity_unsorted(
-    issue: m.Issue,
-    start: datetime,
-    end: datetime,
-) -> list[Activity]:
-    results = [
-        Activity(
-            author=UserOutput.from_obj(history.author),
-            action=ActionT.ISSUE_UPDATED,
-            issue=IssueShortOutput.from_obj(issue),
-            time=history.time,
-            changes=[issue_change_output_from_obj(c) for c in history.changes],
-        )
-        for history in issue.history
-        if start <= history.time <= end
-    ]
-    results.extend(
-        Activity(
-            author=UserOutput.from_obj(comment.author),
-            action=ActionT.ISSUE_COMMENTED,
-            issue=IssueShortOutput.from_obj(issue),
-            time=comment.created_at,
-        )
-        for comment in issue.comments
-        if start <= comment.created_at <= end
+async def _readable_issue_filter() -> dict:
+    """Activities of issues the current user can read.
+
+    Issues with their own permissions or not inheriting project permissions
+    are few, their ids are resolved upfront so unreadable activities are
+    filtered out before the page is limited.
+    """
+    user_ctx = current_user()
+    issue_flt = user_ctx.get_issue_filter_for_permission(ProjectPermissions.ISSUE_READ)
+    project_ids = list(
+        user_ctx.get_projects_with_permission(ProjectPermissions.ISSUE_READ)
     )
-    if start <= issue.created_at <= end:
-        results.append(
-            Activity(
-                author=UserOutput.from_obj(issue.created_by),
-                action=ActionT.ISSUE_CREATED,
-                issue=IssueShortOutput.from_obj(issue),
-                time=issue.created_at,
-            ),
-        )
-    return results
+    collection = m.Issue.get_motor_collection()
+    granted_ids, not_inheriting_ids = await asyncio.gather(
+        collection.distinct(
+            '_id',
+            {'$and': [issue_flt, {'permissions.0': {'$exists': True}}]},
+        ),
+        collection.distinct(
+            '_id',
+            {
+                'project.id': {'$in': project_ids},
+                'disable_project_permissions_inheritance': True,
+            },
+        ),
+    )
+    project_flt: dict = {'project_id': {'$in': project_ids}}
+    if not_inheriting_ids:
+        project_flt['issue_id'] = {'$nin': not_inheriting_ids}
+    return {
+        '$or': [
+            project_flt,
+            {'issue_id': {'$in': granted_ids}},
+        ],
+    }
 
 
 @router.get('/list')
 async def get_activity_list(
-    start: float,
-    end: float,
-    user_id: UserIdentifier | None = None,
-) -> BaseListOutput[Activity]:
-    start_dt = utcfromtimestamp(start)
-    end_dt = utcfromtimestamp(end)
+    query: ActivityListParams = Depends(),
+) -> CursorListOutput[Activity]:
     user_ctx = current_user()
-    flt = [
-        user_ctx.get_issue_filter_for_permission(ProjectPermissions.ISSUE_READ),
-        bo.Or(
-            bo.And(
-                m.Issue.history.time >= start_dt,
-                m.Issue.history.time <= end_dt,
-            ),
-            bo.And(
-                m.Issue.comments.created_at >= start_dt,
-                m.Issue.comments.created_at <= end_dt,
-            ),
-            bo.And(
-                m.Issue.created_at >= start_dt,
-                m.Issue.created_at <= end_dt,
-            ),
-        ),
-    ]
-    if user_id:
-        user = await m.User.find_one_by_id_or_email(user_id)
+    flt: dict = {
+        'time': {
+            '$gte': utcfromtimestamp(query.start),
+            '$lte': utcfromtimestamp(query.end),
+        },
+    }
+    if query.user_id:
+        user = await m.User.find_one_by_id_or_email(query.user_id)
         if not user:
             raise HTTPException(HTTPStatus.NOT_FOUND, 'User not found')
-        flt.append(
-            bo.Or(
-                m.Issue.created_by.id == user.id,
-                m.Issue.history.author.id == user.id,
-                m.Issue.comments.author.id == user.id,
-            ),
+        flt['author.id'] = user.id
+    q = m.IssueActivity.find(flt, await _readable_issue_filter())
+    try:
+        pipeline, sort = keyset_pipeline(
+            [{'$sort': {'time': 1}}],
+            m.IssueActivity,
+            limit=query.limit,
+            cursor=query.cursor,
         )
-    results = []
-    async for issue in m.Issue.find(*flt):
-        results.extend(_get_issue_activity_unsorted(issue, start_dt, end_dt))
-    return BaseListOutput.make(
-        count=len(results),
-        limit=len(results),
+    except InvalidCursorError as err:
+        raise HTTPException(HTTPStatus.BAD_REQUEST, str(err)) from err
+    docs, cnt, count_exact = await fetch_page(
+        q, pipeline, CountMode.parse(query.count_mode)
+    )
+
+    activities = [m.IssueActivity.model_validate(doc) for doc in docs]
+    issues = {
+        issue.id: issue
+        async for issue in m.Issue.find(
+            bo.In(m.Issue.id, list({a.issue_id for a in activities})),
+            user_ctx.get_issue_filter_for_permission(ProjectPermissions.ISSUE_READ),
+        ).project(IssueShortRO)
+    }
+    items = [
+        Activity(
+            author=UserOutput.from_obj(activity.author),
+            action=ActionT(activity.action),
+            issue=IssueShortOutput.from_obj(issues[activity.issue_id]),
+            time=activity.time,
+            changes=[issue_change_output_from_obj(c) for c in activity.changes]
+            if activity.changes is not None
+            else None,
+        )
+        for activity in activities
+        if activity.issue_id in issues
+    ]
+    if len(items) < len(activities):
+        # activities of issues deleted meanwhile are counted
+        count_exact = False
+    return CursorListOutput.make(
+        items=items,
+        count=cnt if cnt is not None else len(items),
+        limit=query.limit,
         offset=0,
-        items=sorted(results, key=lambda a: a.time),
+        next_cursor=next_cursor(docs, sort, query.limit),
+        count_exact=count_exact,
     )
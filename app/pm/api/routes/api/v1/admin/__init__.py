@@ -4,7 +4,9 @@ from pm.api.context import admin_context_dependency
 from pm.api.utils.router import APIRouter
 from pm.api.views.error_responses import AUTH_ERRORS, error_responses
 
+from .query import router as query_router
 from .user import router as user_router
+from .workflow import router as workflow_router
 
 __all__ = ('router',)
 
@@ -16,3 +18,5 @@ router = APIRouter(
 )
 
 router.include_router(user_router)
+router.include_router(query_router)
+router.include_router(workflow_router)
@@ -0,0 +1,205 @@
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any, Self
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel, Field
+
+import pm.models as m
+from pm.api.context import current_user
+from pm.api.issue_query import IssueQueryTransformError, transform_query
+from pm.api.utils.pagination import keyset_pipeline
+from pm.api.utils.router import APIRouter
+from pm.api.views.output import (
+    BaseListOutput,
+    SuccessOutput,
+    SuccessPayloadOutput,
+)
+from pm.services.index_advisor import FieldStats, IndexAdvice, advise_indexes
+from pm.services.query_profile import (
+    QueryPlan,
+    SlowQuery,
+    clear_slow_queries,
+    explain_query,
+    get_slow_queries,
+    summarize_plan,
+    to_json_compatible,
+)
+
+__all__ = ('router',)
+
+router = APIRouter(prefix='/query', tags=['query'])
+
+
+class QueryExplainBody(BaseModel):
+    q: str = Field(description='Issue search query')
+    sort_by: str | None = Field(None, description='Sort expression, as in issue list')
+    limit: int = Field(50, ge=1, le=1000, description='Page size to explain')
+    include_raw: bool = Field(False, description='Include the raw explain output')
+
+
+class QueryPlanOutput(BaseModel):
+    indexes: list[str] = Field(description='Indexes used by the winning plan')
+    collection_scan: bool = Field(description='Whether the collection is scanned')
+    docs_examined: int
+    keys_examined: int
+    returned: int = Field(description='Documents returned by the query stage')
+    execution_time_ms: int
+
+    @classmethod
+    def from_obj(cls, obj: QueryPlan) -> Self:
+        return cls(
+            indexes=obj.indexes,
+            collection_scan=obj.collection_scan,
+            docs_examined=obj.docs_examined,
+            keys_examined=obj.keys_examined,
+            returned=obj.returned,
+            execution_time_ms=obj.execution_time_ms,
+        )
+
+
+class QueryExplainOutput(BaseModel):
+    filter: dict[str, Any]
+    pipeline: list[dict[str, Any]]
+    plan: QueryPlanOutput
+    explain: dict[str, Any] | None = None
+
+
+class SlowQueryOutput(BaseModel):
+    source: str
+    query: str
+    duration_ms: float
+    captured_at: datetime
+    filter: dict[str, Any]
+    pipeline: list[dict[str, Any]]
+    plan: QueryPlanOutput | None
+    error: str | None
+
+    @classmethod
+    def from_obj(cls, obj: SlowQuery) -> Self:
+        return cls(
+            source=obj.source,
+            query=obj.query,
+            duration_ms=obj.duration_ms,
+            captured_at=obj.captured_at,
+            filter=obj.filter,
+            pipeline=obj.pipeline,
+            plan=QueryPlanOutput.from_obj(obj.plan) if obj.plan else None,
+            error=obj.error,
+        )
+
+
+class FieldStatsOutput(BaseModel):
+    gid: str
+    name: str
+    path: str = Field(description='Path of the filtered value in the field')
+    operators: list[str]
+    uses: int = Field(description='Sampled searches filtering on the field')
+    issues: int = Field(description='Sampled issues having the field')
+    distinct_values: int
+    selectivity: float | None = Field(
+        description='Expected fraction of issues matched by a filter on a value',
+    )
+
+    @classmethod
+    def from_obj(cls, obj: FieldStats) -> Self:
+        return cls(
+            gid=obj.gid,
+            name=obj.name,
+            path=obj.path,
+            operators=obj.operators,
+            uses=obj.uses,
+            issues=obj.issues,
+            distinct_values=obj.distinct_values,
+            selectivity=obj.selectivity,
+        )
+
+
+class IndexAdviceOutput(BaseModel):
+    name: str
+    keys: list[tuple[str, int]]
+    fields: list[FieldStatsOutput]
+    exists: bool = Field(description='Whether the index already exists')
+
+    @classmethod
+    def from_obj(cls, obj: IndexAdvice) -> Self:
+        return cls(
+            name=obj.name,
+            keys=obj.keys,
+            fields=[FieldStatsOutput.from_obj(f) for f in obj.fields],
+            exists=obj.exists,
+        )
+
+
+@router.post('/explain')
+async def explain_issue_query(
+    body: QueryExplainBody,
+) -> SuccessPayloadOutput[QueryExplainOutput]:
+    """Explain the issue list query generated for a search query.
+
+    Permission filters of the issue list are not applied, the query runs once.
+    """
+    user_ctx = current_user()
+    try:
+        flt, sort_pipeline = await transform_query(
+            body.q,
+            current_user_email=user_ctx.user.email,
+            sort_by=body.sort_by,
+        )
+    except IssueQueryTransformError as err:
+        raise HTTPException(HTTPStatus.BAD_REQUEST, err.message) from err
+    pipeline, _ = keyset_pipeline(
+        sort_pipeline or [{'$sort': {'updated_at': -1}}],
+        m.IssueRO,
+        limit=body.limit,
+    )
+    explain = await explain_query(m.Issue, flt, pipeline)
+    return SuccessPayloadOutput(
+        payload=QueryExplainOutput(
+            filter=to_json_compatible(flt),
+            pipeline=to_json_compatible(pipeline),
+            plan=QueryPlanOutput.from_obj(summarize_plan(explain)),
+            explain=to_json_compatible(explain) if body.include_raw else None,
+        ),
+    )
+
+
+@router.get('/slow')
+async def list_slow_queries(
+    limit: int = Query(50, le=1000, description='limit results'),
+    offset: int = Query(0, description='offset'),
+) -> BaseListOutput[SlowQueryOutput]:
+    """Slow queries captured by the worker serving the request, newest first."""
+    items = get_slow_queries()
+    return BaseListOutput.make(
+        items=[SlowQueryOutput.from_obj(obj) for obj in items[offset : offset + limit]],
+        count=len(items),
+        limit=limit,
+        offset=offset,
+    )
+
+
+@router.delete('/slow')
+async def clear_captured_slow_queries() -> SuccessOutput:
+    clear_slow_queries()
+    return SuccessOutput()
+
+
+@router.get('/index-advice')
+async def get_index_advice(
+    min_uses: int | None = Query(
+        None, ge=1, description='Sampled uses of a field, defaults to config'
+    ),
+    max_selectivity: float | None = Query(
+        None, gt=0, le=1, description='Max selectivity of a field, defaults to config'
+    ),
+) -> SuccessPayloadOutput[list[IndexAdviceOutput]]:
+    """Recommend custom field indexes from sampled issue searches.
+
+    Selectivity is estimated on a sample of issues, which takes a while on
+    large collections.
+    """
+    advice = await advise_indexes(min_uses=min_uses, max_selectivity=max_selectivity)
+    return SuccessPayloadOutput(
+        payload=[IndexAdviceOutput.from_obj(obj) for obj in advice],
+    )
@@ -30,6 +30,7 @@ from pm.api.views.user import (
     UserOutput,
     UserUpdate,
 )
+from pm.cache import CacheTag, invalidate_cache_tags
 from pm.constants import BOT_USER_DOMAIN
 from pm.services.avatars import generate_default_avatar
 from pm.tasks.actions import task_send_email, task_send_pararam_message
@@ -193,6 +194,8 @@ async def update_user(
             m.Dashboard.update_user_embedded_links(obj),
         )
         await generate_default_avatar(obj)
+        if 'is_admin' in changes:
+            await invalidate_cache_tags(CacheTag.GROUPS)
     return SuccessPayloadOutput(payload=UserFullOutput.from_obj(obj))
 
 
@@ -242,6 +245,7 @@ async def assign_global_role_to_user(
     # Add the global role
     user.global_roles.append(m.GlobalRoleLinkField.from_obj(global_role))
     await user.save_changes()
+    await invalidate_cache_tags(CacheTag.GLOBAL_PERMISSIONS)
 
     return ModelIdOutput.make(role_id)
 
@@ -265,5 +269,6 @@ async def remove_global_role_from_user(
     # Remove the global role
     user.global_roles = [role for role in user.global_roles if role.id != role_id]
     await user.save_changes()
+    await invalidate_cache_tags(CacheTag.GLOBAL_PERMISSIONS)
 
     return ModelIdOutput.make(role_id)
@@ -0,0 +1,69 @@
+from typing import Any, Self
+
+from pydantic import BaseModel, Field
+
+from pm.api.utils.router import APIRouter
+from pm.api.views.output import SuccessPayloadOutput
+from pm.services.workflows import get_workflow_latency_stats
+from pm.workflows import get_compiled_scripts_stats
+
+__all__ = ('router',)
+
+router = APIRouter(prefix='/workflow', tags=['workflow'])
+
+
+class ScriptCacheStatsOutput(BaseModel):
+    size: int = Field(description='Compiled workflow scripts held by the worker')
+    hits: int
+    misses: int = Field(description='Scripts compiled on use')
+    evictions: int
+
+    @classmethod
+    def from_obj(cls, obj: dict[str, int]) -> Self:
+        return cls(
+            size=obj['size'],
+            hits=obj['hits'],
+            misses=obj['misses'],
+            evictions=obj['evictions'],
+        )
+
+
+class WorkflowLatencyOutput(BaseModel):
+    id: str
+    name: str | None
+    buckets: dict[str, int] = Field(
+        description='Runs per bucket, keyed by its upper bound in milliseconds'
+    )
+    count: int
+    total_ms: float
+    max_ms: float
+
+    @classmethod
+    def from_obj(cls, wf_id: str, obj: dict[str, Any]) -> Self:
+        return cls(
+            id=wf_id,
+            name=obj['name'],
+            buckets=obj['buckets'],
+            count=obj['count'],
+            total_ms=obj['total_ms'],
+            max_ms=obj['max_ms'],
+        )
+
+
+@router.get('/script-cache')
+async def get_script_cache_stats() -> SuccessPayloadOutput[ScriptCacheStatsOutput]:
+    """Compiled script cache stats of the worker serving the request."""
+    return SuccessPayloadOutput(
+        payload=ScriptCacheStatsOutput.from_obj(get_compiled_scripts_stats()),
+    )
+
+
+@router.get('/latency')
+async def get_workflow_latency() -> SuccessPayloadOutput[list[WorkflowLatencyOutput]]:
+    """On change workflow script latencies of the worker serving the request."""
+    return SuccessPayloadOutput(
+        payload=[
+            WorkflowLatencyOutput.from_obj(wf_id, stats)
+            for wf_id, stats in get_workflow_latency_stats().items()
+        ],
+    )
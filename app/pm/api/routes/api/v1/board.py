@@ -1,4 +1,5 @@
 # pylint: disable=too-many-lines
+import time
 from collections.abc import Sequence
 from http import HTTPStatus
 from typing import Annotated, Any
@@ -11,11 +12,14 @@ from pydantic import BaseModel, Field, RootModel
 
 import pm.models as m
 from pm.api.context import current_user, current_user_context_dependency
-from pm.api.events_bus import send_event
+from pm.api.events_bus import issue_event_data, send_event
 from pm.api.exceptions import ValidateModelError
 from pm.api.helpers.issue_validation import validate_custom_fields_values
 from pm.api.issue_query import IssueQueryTransformError, transform_query
-from pm.api.issue_query.search import transform_text_search
+from pm.api.issue_query.search import (
+    resolve_text_search,
+    transform_text_search,
+)
 from pm.api.utils.router import APIRouter
 from pm.api.views.custom_fields import (
     BooleanCustomFieldGroupWithValuesOutput,
@@ -65,7 +69,10 @@ from pm.api.views.select import (
 )
 from pm.api.views.user import UserOutput
 from pm.permissions import PermAnd, ProjectPermissions
+from pm.services.custom_field_catalog import get_custom_field_catalog
 from pm.services.issue import update_tags_on_close_resolve
+from pm.services.query_profile import observe_query
+from pm.services.workflows import run_on_change_workflows
 from pm.tasks.actions.notification_batch import schedule_batched_notification
 from pm.utils.dateutils import utcnow
 from pm.utils.events_bus import Event, EventType
@@ -533,7 +540,7 @@ async def get_board_issues(
             raise HTTPException(HTTPStatus.BAD_REQUEST, err.message) from err
 
     if query.search:
-        q = q.find(transform_text_search(query.search))
+        q = q.find(await resolve_text_search(transform_text_search(query.search)))
 
     board_swimlanes = board.swimlanes
     if not board.swimlane_field:
@@ -545,7 +552,16 @@ async def get_board_issues(
         if sl is not None
     }
 
-    for issue in await q.project(m.IssueRO).to_list():
+    start = time.perf_counter()
+    issues = await q.project(m.IssueRO).to_list()
+    observe_query(
+        'board',
+        ' '.join(filter(None, (board.query, query.q))),
+        q,
+        [],
+        (time.perf_counter() - start) * 1000,
+    )
+    for issue in issues:
         if board.swimlane_field and not (
             sl_field := issue.get_field_by_gid(board.swimlane_field.gid)
         ):
@@ -710,9 +726,7 @@ async def move_issue(
             )
         if issue.is_changed:
             try:
-                for wf in pr.workflows:
-                    if isinstance(wf, m.OnChangeWorkflow):
-                        await wf.run(issue, user_ctx)
+                await run_on_change_workflows(pr.workflows, issue, user_ctx)
             except WorkflowError as err:
                 raise ValidateModelError(
                     payload=await IssueListOutput.from_obj(issue, accessible_tag_ids),
@@ -721,11 +735,12 @@ async def move_issue(
                 ) from err
             issue.update_state(now=now)
             await update_tags_on_close_resolve(issue)
-            issue.gen_history_record(user_ctx.user, time=now)
-            latest_history_changes = issue.history[-1].changes if issue.history else []
+            record = issue.gen_history_record(user_ctx.user, time=now)
+            latest_history_changes = record.changes if record else []
             issue.updated_at = now
             issue.updated_by = m.UserLinkField.from_obj(user_ctx.user)
-            await issue.replace()
+            await issue.write_changes()
+            await m.IssueHistoryEntry.append(issue, record)
             await schedule_batched_notification(
                 'update',
                 issue.subject,
@@ -738,10 +753,7 @@ async def move_issue(
             await send_event(
                 Event(
                     type=EventType.ISSUE_UPDATE,
-                    data={
-                        'issue_id': str(issue.id),
-                        'project_id': str(issue.project.id),
-                    },
+                    data=issue_event_data(issue),
                 ),
             )
     board.move_issue(issue.id, after_issue.id if after_issue else None)
@@ -1174,12 +1186,12 @@ async def _resolve_custom_field_groups(
 ) -> list[m.CustomFieldGroupLink]:
     if not field_gids:
         return []
-    results = await m.CustomField.find(
-        bo.In(m.CustomField.gid, field_gids),
-        with_children=True,
-    ).to_list()
-
-    groups = {cf.gid: m.CustomFieldGroupLink.from_obj(cf) for cf in results}
+    catalog = await get_custom_field_catalog()
+    groups = {
+        gid: m.CustomFieldGroupLink.from_obj(cf)
+        for gid in field_gids
+        if (cf := catalog.group_field(gid))
+    }
 
     if len(groups) != len(field_gids):
         not_found = set(field_gids) - set(groups.keys())
@@ -20,6 +20,7 @@ from pm.api.views.output import (
 )
 from pm.api.views.params import ListParams
 from pm.api.views.select import SelectParams
+from pm.cache import CacheTag, invalidate_cache_tags
 from pm.permissions import GlobalPermissions
 
 __all__ = ('router',)
@@ -162,6 +163,7 @@ async def delete_global_role(
     await m.User.find().update(
         {'$pull': {'global_roles': {'id': role_id}}},
     )
+    await invalidate_cache_tags(CacheTag.GLOBAL_PERMISSIONS)
     return ModelIdOutput.make(role_id)
 
 
@@ -188,6 +190,7 @@ async def grant_global_permission(
     await obj.save_changes()
     # Update embedded links in groups that reference this global role
     await m.Group.update_global_role_embedded_links(obj)
+    await invalidate_cache_tags(CacheTag.GLOBAL_PERMISSIONS)
     return SuccessPayloadOutput(payload=GlobalRoleOutput.from_obj(obj))
 
 
@@ -213,4 +216,5 @@ async def revoke_global_permission(
     await obj.replace()
     # Update embedded links in groups that reference this global role
     await m.Group.update_global_role_embedded_links(obj)
+    await invalidate_cache_tags(CacheTag.GLOBAL_PERMISSIONS)
     return SuccessPayloadOutput(payload=GlobalRoleOutput.from_obj(obj))
@@ -23,6 +23,7 @@ from pm.api.views.output import (
 )
 from pm.api.views.params import ListParams
 from pm.api.views.user import UserIdentifier, UserOutput
+from pm.cache import CacheTag, invalidate_cache_tags
 from pm.permissions import GLOBAL_PERMISSIONS_BY_CATEGORY, GlobalPermissions
 
 __all__ = ('router',)
@@ -211,6 +212,7 @@ async def delete_group(
         m.Search.remove_group_embedded_links(group_id),
         m.Dashboard.remove_group_embedded_links(group_id),
     )
+    await invalidate_cache_tags(CacheTag.GROUPS)
     return ModelIdOutput.make(group_id)
 
 
@@ -277,6 +279,7 @@ async def add_group_member(
 
     user.groups.append(m.GroupLinkField.from_obj(group))
     await user.save_changes()
+    await invalidate_cache_tags(CacheTag.GROUPS)
     return ModelIdOutput.from_obj(group)
 
 
@@ -304,6 +307,7 @@ async def remove_group_member(
 
     user.groups = [gr for gr in user.groups if gr.id != group.id]
     await user.save_changes()
+    await invalidate_cache_tags(CacheTag.GROUPS)
     return ModelIdOutput.from_obj(group)
 
 
@@ -359,6 +363,7 @@ async def assign_global_role_to_group(
     # Add the global role
     group.global_roles.append(m.GlobalRoleLinkField.from_obj(global_role))
     await group.save_changes()
+    await invalidate_cache_tags(CacheTag.GLOBAL_PERMISSIONS)
 
     return ModelIdOutput.make(role_id)
 
@@ -384,5 +389,6 @@ async def remove_global_role_from_group(
     # Remove the global role
     group.global_roles = [role for role in group.global_roles if role.id != role_id]
     await group.save_changes()
+    await invalidate_cache_tags(CacheTag.GLOBAL_PERMISSIONS)
 
     return ModelIdOutput.make(role_id)
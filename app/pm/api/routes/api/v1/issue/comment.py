@@ -8,6 +8,7 @@ from pydantic import BaseModel, Field
 
 import pm.models as m
 from pm.api.context import current_user
+from pm.api.events_bus import issue_event_data, send_event
 from pm.api.helpers.user import resolve_users_by_email
 from pm.api.utils.router import APIRouter
 from pm.api.views.encryption import EncryptedObject
@@ -25,6 +26,7 @@ from pm.tasks.actions.notification_batch import schedule_batched_notification
 from pm.tasks.actions.ocr_process import process_attachments_ocr
 from pm.tasks.types import CommentChange
 from pm.utils.dateutils import utcnow
+from pm.utils.events_bus import Event, EventType
 from pm.utils.mentions import detect_mention_changes, extract_mentions_from_text
 
 from ._utils import update_attachments
@@ -66,17 +68,21 @@ async def list_comments(
     user_ctx = current_user()
     user_ctx.validate_issue_permission(issue, ProjectPermissions.COMMENT_READ)
 
+    comments = (
+        await m.IssueCommentEntry.of_issue(issue.id)
+        .sort(+m.IssueCommentEntry.created_at)
+        .skip(query.offset)
+        .limit(query.limit)
+        .to_list()
+    )
     items = sorted(
-        [
-            await IssueCommentOutput.from_obj(c)
-            for c in issue.comments[query.offset : query.offset + query.limit]
-        ],
+        [await IssueCommentOutput.from_obj(c) for c in comments],
         key=lambda comment: comment.created_at,
         reverse=True,
     )
 
     return BaseListOutput.make(
-        count=len(issue.comments),
+        count=issue.comments_count,
         limit=query.limit,
         offset=query.offset,
         items=items,
@@ -95,7 +101,7 @@ async def get_comment(
     user_ctx = current_user()
     user_ctx.validate_issue_permission(issue, ProjectPermissions.COMMENT_READ)
 
-    comment = next((c for c in issue.comments if c.id == comment_id), None)
+    comment = await m.IssueCommentEntry.get_for_issue(issue.id, comment_id)
     if not comment:
         raise HTTPException(HTTPStatus.NOT_FOUND, 'Comment not found')
     return SuccessPayloadOutput(payload=await IssueCommentOutput.from_obj(comment))
@@ -117,7 +123,8 @@ async def create_comment(
         PermAnd(ProjectPermissions.COMMENT_READ, ProjectPermissions.COMMENT_CREATE),
     )
 
-    comment = m.IssueComment(
+    comment = m.IssueCommentEntry(
+        issue_id=issue.id,
         text=body.text.value if body.text else None,
         author=m.UserLinkField.from_obj(user_ctx.user),
         created_at=now,
@@ -126,7 +133,7 @@ async def create_comment(
         encryption=body.text.encryption if body.text else None,
     )
     await update_attachments(comment, body.attachments, user=user_ctx.user, now=now)
-    issue.comments.append(comment)
+    issue.comment_added(comment)
     issue.updated_at = comment.created_at
     issue.updated_by = comment.author
 
@@ -136,7 +143,15 @@ async def create_comment(
         [u.id for u in mentioned_users.values() if u.id not in issue.subscribers]
     )
 
-    await issue.save_changes()
+    await comment.insert()
+    await issue.write_changes()
+    await m.IssueActivity.log(m.IssueActivity.issue_commented(issue, comment))
+    await send_event(
+        Event(
+            type=EventType.ISSUE_UPDATE,
+            data=issue_event_data(issue),
+        ),
+    )
 
     ocr_attachment_ids = [str(a.id) for a in comment.attachments if not a.encryption]
     if ocr_attachment_ids:
@@ -183,7 +198,7 @@ async def update_comment(
         PermAnd(ProjectPermissions.COMMENT_READ, ProjectPermissions.COMMENT_UPDATE),
     )
 
-    comment = next((c for c in issue.comments if c.id == comment_id), None)
+    comment = await m.IssueCommentEntry.get_for_issue(issue.id, comment_id)
     if not comment:
         raise HTTPException(HTTPStatus.NOT_FOUND, 'Comment not found')
     if comment.author.id != user_ctx.user.id:
@@ -229,11 +244,18 @@ async def update_comment(
                 ]
             )
 
-    if issue.is_changed:
+    if comment.is_changed or issue.is_changed:
         comment.updated_at = now
         issue.updated_at = comment.created_at
         issue.updated_by = comment.author
-        await issue.save_changes()
+        await comment.save_changes()
+        await issue.write_changes()
+        await send_event(
+            Event(
+                type=EventType.ISSUE_UPDATE,
+                data=issue_event_data(issue),
+            ),
+        )
 
         ocr_attachment_ids = [
             str(a.id)
@@ -279,7 +301,7 @@ async def delete_comment(
     user_ctx = current_user()
     user_ctx.validate_issue_permission(issue, ProjectPermissions.COMMENT_READ)
 
-    comment = next((c for c in issue.comments if c.id == comment_id), None)
+    comment = await m.IssueCommentEntry.get_for_issue(issue.id, comment_id)
     if not comment:
         raise HTTPException(HTTPStatus.NOT_FOUND, 'Comment not found')
 
@@ -292,8 +314,16 @@ async def delete_comment(
         ),
     )
 
-    issue.comments = [c for c in issue.comments if c.id != comment_id]
-    await issue.replace()
+    await comment.delete()
+    await m.IssueActivity.delete_record(comment_id)
+    issue.comment_deleted()
+    await issue.write_changes()
+    await send_event(
+        Event(
+            type=EventType.ISSUE_UPDATE,
+            data=issue_event_data(issue),
+        ),
+    )
 
     await schedule_batched_notification(
         'update',
@@ -329,14 +359,14 @@ async def hide_comment(
         PermAnd(ProjectPermissions.COMMENT_READ, ProjectPermissions.COMMENT_HIDE),
     )
 
-    comment = next((c for c in issue.comments if c.id == comment_id), None)
+    comment = await m.IssueCommentEntry.get_for_issue(issue.id, comment_id)
     if not comment:
         raise HTTPException(HTTPStatus.NOT_FOUND, 'Comment not found')
     if comment.is_hidden:
         raise HTTPException(HTTPStatus.CONFLICT, 'Comment is already hidden')
 
     comment.is_hidden = True
-    await issue.save_changes()
+    await comment.save_changes()
 
     return SuccessPayloadOutput(payload=await IssueCommentOutput.from_obj(comment))
 
@@ -356,13 +386,13 @@ async def restore_comment(
         PermAnd(ProjectPermissions.COMMENT_READ, ProjectPermissions.COMMENT_RESTORE),
     )
 
-    comment = next((c for c in issue.comments if c.id == comment_id), None)
+    comment = await m.IssueCommentEntry.get_for_issue(issue.id, comment_id)
     if not comment:
         raise HTTPException(HTTPStatus.NOT_FOUND, 'Comment not found')
     if not comment.is_hidden:
         raise HTTPException(HTTPStatus.CONFLICT, 'Comment is not hidden')
 
     comment.is_hidden = False
-    await issue.save_changes()
+    await comment.save_changes()
 
     return SuccessPayloadOutput(payload=await IssueCommentOutput.from_obj(comment))
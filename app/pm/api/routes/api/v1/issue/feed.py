@@ -2,8 +2,11 @@ from datetime import datetime
 from enum import StrEnum
 from http import HTTPStatus
 from typing import Self
+from uuid import UUID
 
+import beanie.operators as bo
 from beanie import PydanticObjectId
+from bson import Binary
 from fastapi import Depends, HTTPException
 from pydantic import BaseModel
 
@@ -59,6 +62,78 @@ class IssueFeedRecordOutput(BaseModel):
         )
 
 
+def _as_uuid(value: Binary | UUID) -> UUID:
+    return value.as_uuid() if isinstance(value, Binary) else value
+
+
+def _feed_pipeline(
+    issue_id: PydanticObjectId,
+    type_: IssueFeedRecordType,
+    time_field: str,
+) -> list[dict]:
+    return [
+        {'$match': {'issue_id': issue_id}},
+        {
+            '$project': {
+                '_id': 1,
+                'type': {'$literal': type_.value},
+                'time': f'${time_field}',
+            },
+        },
+    ]
+
+
+async def _feed_window(
+    issue: m.Issue,
+    types: list[IssueFeedRecordType],
+    offset: int,
+    limit: int,
+    reverse: bool = False,
+) -> list[m.IssueCommentEntry | m.IssueHistoryEntry]:
+    """Records of the requested page, ordered and paged by Mongo.
+
+    Only ids and times of both collections are merged and sorted, then the
+    records of the page are loaded.
+    """
+    sources = {
+        IssueFeedRecordType.COMMENT: (m.IssueCommentEntry, 'created_at'),
+        IssueFeedRecordType.HISTORY: (m.IssueHistoryEntry, 'time'),
+    }
+    first, *others = types
+    model, time_field = sources[first]
+    pipeline = _feed_pipeline(issue.id, first, time_field)
+    for type_ in others:
+        other_model, other_time_field = sources[type_]
+        pipeline.append(
+            {
+                '$unionWith': {
+                    'coll': other_model.get_motor_collection().name,
+                    'pipeline': _feed_pipeline(issue.id, type_, other_time_field),
+                },
+            },
+        )
+    direction = -1 if reverse else 1
+    pipeline.extend(
+        [
+            {'$sort': {'time': direction, '_id': direction}},
+            {'$skip': offset},
+            {'$limit': limit},
+        ],
+    )
+    window = [
+        (doc['type'], _as_uuid(doc['_id']))
+        async for doc in model.get_motor_collection().aggregate(pipeline)
+    ]
+    records = {}
+    for type_ in types:
+        type_model = sources[type_][0]
+        ids = [id_ for t, id_ in window if t == type_]
+        if ids:
+            async for record in type_model.find(bo.In(type_model.id, ids)):
+                records[type_, record.id] = record
+    return [records[key] for key in window if key in records]
+
+
 @router.get('/list')
 async def list_issue_feed(
     issue_id_or_alias: PydanticObjectId | str,
@@ -68,30 +143,30 @@ async def list_issue_feed(
     if not issue:
         raise HTTPException(HTTPStatus.NOT_FOUND, 'Issue not found')
 
-    records: list[IssueFeedRecordOutput] = []
+    types: list[IssueFeedRecordType] = []
+    count = 0
 
     user_ctx = current_user()
     if user_ctx.has_permission(issue.project.id, ProjectPermissions.COMMENT_READ):
-        records.extend(
-            [await IssueFeedRecordOutput.from_obj(c) for c in issue.comments]
-        )
+        types.append(IssueFeedRecordType.COMMENT)
+        count += issue.comments_count
     if user_ctx.has_permission(issue.project.id, ProjectPermissions.ISSUE_READ):
-        records.extend([await IssueFeedRecordOutput.from_obj(h) for h in issue.history])
-
-    sort_by = query.sort_by
+        types.append(IssueFeedRecordType.HISTORY)
+        count += issue.history_count
 
-    if sort_by:
-        reverse = sort_by.startswith('-')
-        sort_field = sort_by.lstrip('-')
+    reverse = False
+    if query.sort_by and query.sort_by.lstrip('-') in ALLOWED_SORT_FIELDS:
+        reverse = query.sort_by.startswith('-')
 
-        if sort_field in ALLOWED_SORT_FIELDS:
-            records.sort(key=lambda r: getattr(r, sort_field), reverse=reverse)
-    else:
-        records.sort(key=lambda r: r.time, reverse=False)
+    records = []
+    if types:
+        records = await _feed_window(
+            issue, types, query.offset, query.limit, reverse=reverse
+        )
 
     return BaseListOutput.make(
-        count=len(records),
+        count=count,
         limit=query.limit,
         offset=query.offset,
-        items=records[query.offset : query.offset + query.limit],
+        items=[await IssueFeedRecordOutput.from_obj(r) for r in records],
     )
@@ -87,6 +87,7 @@ from pm.api.views.query_builder import (
 from pm.api.views.user import UserOutput
 from pm.models.tag import TagLinkField
 from pm.permissions import ProjectPermissions
+from pm.services.custom_field_catalog import get_custom_field_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -189,21 +190,14 @@ DEFAULT_SORT_OBJECT = SortObject(
 
 async def _get_custom_field_groups() -> dict[str, m.CustomField]:
     """Get custom field groups deduplicated by gid."""
-    fields = await m.CustomField.find(with_children=True).to_list()
-    groups = {}
-    for field in fields:
-        if field.gid not in groups:
-            groups[field.gid] = field
-    return groups
+    catalog = await get_custom_field_catalog()
+    return catalog.groups()
 
 
 async def _get_all_custom_fields() -> dict[str, list[m.CustomField]]:
     """Get all custom fields grouped by name (for parsing)."""
-    fields = await m.CustomField.find(with_children=True).to_list()
-    res = {}
-    for field in fields:
-        res.setdefault(field.name.lower(), []).append(field)
-    return res
+    catalog = await get_custom_field_catalog()
+    return catalog.by_name
 
 
 def _create_available_field(
@@ -227,9 +221,7 @@ async def _collect_field_options(
     field: m.CustomField,
 ) -> list[Any]:
     """Collect all options from field group using same pattern as select options endpoint."""
-    group_fields = await m.CustomField.find(
-        m.CustomField.gid == field.gid, with_children=True
-    ).to_list()
+    group_fields = (await get_custom_field_catalog()).group(field.gid)
 
     try:
         all_options = []
@@ -34,14 +34,17 @@ async def list_history(
     user_ctx = current_user()
     user_ctx.validate_issue_permission(issue, ProjectPermissions.ISSUE_READ)
 
-    items = sorted(
-        [IssueHistoryOutput.from_obj(record) for record in issue.history],
-        key=lambda r: r.time,
-        reverse=True,
+    records = (
+        await m.IssueHistoryEntry.of_issue(issue.id)
+        .sort(-m.IssueHistoryEntry.time, -m.IssueHistoryEntry.id)
+        .skip(query.offset)
+        .limit(query.limit)
+        .to_list()
     )
+    items = [IssueHistoryOutput.from_obj(record) for record in records]
 
     return BaseListOutput.make(
-        count=len(issue.history),
+        count=issue.history_count,
         limit=query.limit,
         offset=query.offset,
         items=items,
@@ -69,14 +72,14 @@ async def hide_history(
     user_ctx = current_user()
     user_ctx.validate_issue_permission(issue, ProjectPermissions.HISTORY_HIDE)
 
-    record = next((r for r in issue.history if r.id == history_id), None)
+    record = await m.IssueHistoryEntry.get_for_issue(issue.id, history_id)
     if not record:
         raise HTTPException(HTTPStatus.NOT_FOUND, 'History record not found')
     if record.is_hidden:
         raise HTTPException(HTTPStatus.CONFLICT, 'History record is already hidden')
 
     record.is_hidden = True
-    await issue.save()
+    await record.save_changes()
 
     return SuccessPayloadOutput(payload=IssueHistoryOutput.from_obj(record))
 
@@ -102,13 +105,13 @@ async def restore_history(
     user_ctx = current_user()
     user_ctx.validate_issue_permission(issue, ProjectPermissions.HISTORY_RESTORE)
 
-    record = next((r for r in issue.history if r.id == history_id), None)
+    record = await m.IssueHistoryEntry.get_for_issue(issue.id, history_id)
     if not record:
         raise HTTPException(HTTPStatus.NOT_FOUND, 'History record not found')
     if not record.is_hidden:
         raise HTTPException(HTTPStatus.CONFLICT, 'History record is not hidden')
 
     record.is_hidden = False
-    await issue.save()
+    await record.save_changes()
 
     return SuccessPayloadOutput(payload=IssueHistoryOutput.from_obj(record))
@@ -1,4 +1,6 @@
 # pylint: disable=too-many-lines
+import asyncio
+import time
 from http import HTTPStatus
 from typing import Annotated, Any
 from uuid import UUID, uuid4
@@ -10,7 +12,7 @@ from pydantic import BaseModel, Field
 
 import pm.models as m
 from pm.api.context import current_user
-from pm.api.events_bus import send_event
+from pm.api.events_bus import issue_event_data, send_event
 from pm.api.exceptions import ValidateModelError
 from pm.api.helpers.issue_validation import validate_custom_fields_values
 from pm.api.helpers.user import get_user_favorite_projects, resolve_users_by_email
@@ -18,8 +20,19 @@ from pm.api.issue_query import (
     IssueQueryTransformError,
     transform_query,
 )
-from pm.api.issue_query.search import transform_text_search
+from pm.api.issue_query.search import (
+    resolve_text_search,
+    transform_text_search,
+)
 from pm.api.routes.api.v1.project import ProjectListItemOutput
+from pm.api.utils.pagination import (
+    COUNT_MODE_PATTERN,
+    CountMode,
+    InvalidCursorError,
+    fetch_page,
+    keyset_pipeline,
+    next_cursor,
+)
 from pm.api.utils.router import APIRouter
 from pm.api.views.encryption import EncryptedObject
 from pm.api.views.error_responses import READ_ERRORS, WRITE_ERRORS, error_responses
@@ -38,6 +51,7 @@ from pm.api.views.output import (
     BatchFailureItem,
     BatchOperationOutput,
     BatchSuccessItem,
+    CursorListOutput,
     ErrorOutput,
     ModelIdOutput,
     SuccessOutput,
@@ -49,6 +63,8 @@ from pm.api.views.select import SelectParams
 from pm.permissions import PermAnd, ProjectPermissions
 from pm.services.files import resolve_files
 from pm.services.issue import update_tags_on_close_resolve
+from pm.services.query_profile import observe_query
+from pm.services.workflows import run_on_change_workflows
 from pm.tasks.actions.notification_batch import schedule_batched_notification
 from pm.tasks.actions.ocr_process import process_attachments_ocr
 from pm.utils.dateutils import utcnow
@@ -98,6 +114,27 @@ class IssueDraftUpdate(BaseModel):
 class IssueListParams(IssueSearchParams):
     limit: int = Query(50, le=1000, description='limit results')
     offset: int = Query(0, description='offset')
+    cursor: str | None = Query(
+        None,
+        description='next_cursor of the previous page, offset is ignored when set',
+    )
+    count_mode: str = Query(
+        'exact',
+        pattern=COUNT_MODE_PATTERN,
+        description='exact, estimated, none or capped:N (count at most N issues)',
+    )
+
+
+class LinkableIssueSelectParams(SelectParams):
+    cursor: str | None = Query(
+        None,
+        description='next_cursor of the previous page, offset is ignored when set',
+    )
+    count_mode: str = Query(
+        'exact',
+        pattern=COUNT_MODE_PATTERN,
+        description='exact, estimated, none or capped:N (count at most N issues)',
+    )
 
 
 class IssueInterlinkCreate(BaseModel):
@@ -142,7 +179,7 @@ class IssuePermissionOutput(BaseModel):
 @router.get('/list')
 async def list_issues(
     query: IssueListParams = Depends(),
-) -> BaseListOutput[IssueListOutput]:
+) -> CursorListOutput[IssueListOutput]:
     user_ctx = current_user()
     q = m.Issue.find(
         user_ctx.get_issue_filter_for_permission(ProjectPermissions.ISSUE_READ),
@@ -167,31 +204,45 @@ async def list_issues(
                 err.message,
             ) from err
     if query.search:
-        q = q.find(transform_text_search(query.search))
-    cnt = await q.count()
+        q = q.find(await resolve_text_search(transform_text_search(query.search)))
 
-    pipeline += sort_pipeline
-    pipeline += [
-        {
-            '$skip': query.offset,
-        },
-        {
-            '$limit': query.limit,
-        },
-    ]
-    q = q.aggregate(
+    try:
+        page_pipeline, sort = keyset_pipeline(
+            sort_pipeline,
+            m.IssueRO,
+            limit=query.limit,
+            offset=query.offset,
+            cursor=query.cursor,
+        )
+    except InvalidCursorError as err:
+        raise HTTPException(HTTPStatus.BAD_REQUEST, str(err)) from err
+    pipeline += page_pipeline
+    start = time.perf_counter()
+    (docs, cnt, count_exact), accessible_tag_ids = await asyncio.gather(
+        fetch_page(q, pipeline, CountMode.parse(query.count_mode)),
+        user_ctx.get_accessible_tag_ids(),
+    )
+    observe_query(
+        'issue_list',
+        query.q or '',
+        q,
         pipeline,
-        projection_model=m.IssueRO,
+        (time.perf_counter() - start) * 1000,
     )
-    accessible_tag_ids = await user_ctx.get_accessible_tag_ids()
+    offset = 0 if query.cursor else query.offset
 
-    return BaseListOutput.make(
+    return CursorListOutput.make(
         items=[
-            await IssueListOutput.from_obj(obj, accessible_tag_ids) async for obj in q
+            await IssueListOutput.from_obj(
+                m.IssueRO.model_validate(doc), accessible_tag_ids
+            )
+            for doc in docs
         ],
-        count=cnt,
+        count=cnt if cnt is not None else offset + len(docs),
         limit=query.limit,
-        offset=query.offset,
+        offset=offset,
+        next_cursor=next_cursor(docs, sort, query.limit),
+        count_exact=count_exact,
     )
 
 
@@ -543,9 +594,7 @@ async def create_issue_from_draft(
     )
     await update_attachments(obj, draft.attachments, user=user_ctx.user, now=now)
     try:
-        for wf in project.workflows:
-            if isinstance(wf, m.OnChangeWorkflow):
-                await wf.run(obj, user_ctx)
+        await run_on_change_workflows(project.workflows, obj, user_ctx)
     except WorkflowError as err:
         raise ValidateModelError(
             payload=await IssueOutput.from_obj(obj),
@@ -565,7 +614,7 @@ async def create_issue_from_draft(
     await send_event(
         Event(
             type=EventType.ISSUE_CREATE,
-            data={'issue_id': str(obj.id), 'project_id': str(obj.project.id)},
+            data=issue_event_data(obj),
         ),
     )
     ocr_attachment_ids = [str(a.id) for a in obj.attachments if not a.encryption]
@@ -649,9 +698,7 @@ async def create_issue(
             error_fields={e.field.name: e.msg for e in validation_errors},
         )
     try:
-        for wf in project.workflows:
-            if isinstance(wf, m.OnChangeWorkflow):
-                await wf.run(obj, user_ctx)
+        await run_on_change_workflows(project.workflows, obj, user_ctx)
     except WorkflowError as err:
         raise ValidateModelError(
             payload=await IssueOutput.from_obj(obj),
@@ -671,7 +718,7 @@ async def create_issue(
     await send_event(
         Event(
             type=EventType.ISSUE_CREATE,
-            data={'issue_id': str(obj.id), 'project_id': str(obj.project.id)},
+            data=issue_event_data(obj),
         ),
     )
     ocr_attachment_ids = [str(a.id) for a in obj.attachments if not a.encryption]
@@ -780,9 +827,7 @@ async def update_issue(
             error_fields={e.field.name: e.msg for e in validation_errors},
         )
     try:
-        for wf in project.workflows:
-            if isinstance(wf, m.OnChangeWorkflow):
-                await wf.run(obj, user_ctx)
+        await run_on_change_workflows(project.workflows, obj, user_ctx)
     except WorkflowError as err:
         raise ValidateModelError(
             payload=await IssueOutput.from_obj(obj),
@@ -804,11 +849,14 @@ async def update_issue(
     )
 
     if obj.is_changed:
-        obj.gen_history_record(user_ctx.user, now)
-        latest_history_changes = obj.history[-1].changes if obj.history else []
+        record = obj.gen_history_record(user_ctx.user, now)
+        latest_history_changes = record.changes if record else []
         obj.updated_at = now
         obj.updated_by = m.UserLinkField.from_obj(user_ctx.user)
-        await obj.replace()
+        await obj.write_changes()
+        await m.IssueHistoryEntry.append(obj, record)
+        if move_to_another_project:
+            await m.IssueActivity.move_issues([obj.id], obj.project.id)
 
         await schedule_batched_notification(
             'update',
@@ -823,7 +871,7 @@ async def update_issue(
         await send_event(
             Event(
                 type=EventType.ISSUE_UPDATE,
-                data={'issue_id': str(obj.id), 'project_id': str(obj.project.id)},
+                data=issue_event_data(obj),
             ),
         )
         ocr_attachment_ids = [
@@ -875,7 +923,7 @@ async def delete_issue(
     await send_event(
         Event(
             type=EventType.ISSUE_DELETE,
-            data={'issue_id': str(obj.id), 'project_id': str(obj.project.id)},
+            data=issue_event_data(obj),
         ),
     )
     return ModelIdOutput.from_obj(obj)
@@ -894,7 +942,7 @@ async def subscribe_issue(
 
     if user_ctx.user.id not in obj.subscribers:
         obj.subscribers.append(user_ctx.user.id)
-        await obj.replace()
+        await obj.write_changes()
     accessible_tag_ids = await user_ctx.get_accessible_tag_ids()
     return SuccessPayloadOutput(
         payload=await IssueOutput.from_obj(obj, accessible_tag_ids)
@@ -917,7 +965,7 @@ async def unsubscribe_issue(
 
     if user_ctx.user.id in obj.subscribers:
         obj.subscribers.remove(user_ctx.user.id)
-        await obj.replace()
+        await obj.write_changes()
     accessible_tag_ids = await user_ctx.get_accessible_tag_ids()
     return SuccessPayloadOutput(
         payload=await IssueOutput.from_obj(obj, accessible_tag_ids)
@@ -987,9 +1035,9 @@ async def link_issues(
                 type=body.type.inverse(),
             ),
         )
-        await target_issue.replace()
+        await target_issue.write_changes()
 
-    await obj.replace()
+    await obj.write_changes()
     accessible_tag_ids = await user_ctx.get_accessible_tag_ids()
     return SuccessPayloadOutput(
         payload=await IssueOutput.from_obj(obj, accessible_tag_ids)
@@ -1002,8 +1050,8 @@ async def link_issues(
 )
 async def select_linkable_issues(
     issue_id_or_alias: PydanticObjectId | str,
-    query: SelectParams = Depends(),
-) -> BaseListOutput[IssueListOutput]:
+    query: LinkableIssueSelectParams = Depends(),
+) -> CursorListOutput[IssueListOutput]:
     obj: m.Issue | None = await m.Issue.find_one_by_id_or_alias(issue_id_or_alias)
     if not obj:
         raise HTTPException(HTTPStatus.NOT_FOUND, 'Issue not found')
@@ -1025,11 +1073,8 @@ async def select_linkable_issues(
         ),
     )
 
-    # Count for pagination
-    cnt = await q.count()
-
     # Build pipeline to sort by favorite projects first, then by update date
-    pipeline = [
+    sort_pipeline = [
         {
             '$addFields': {
                 'is_favorite_project': {
@@ -1043,21 +1088,32 @@ async def select_linkable_issues(
                 'updated_at': -1,
             },
         },
-        {
-            '$skip': query.offset,
-        },
-        {
-            '$limit': query.limit,
-        },
     ]
+    try:
+        pipeline, sort = keyset_pipeline(
+            sort_pipeline,
+            m.IssueRO,
+            limit=query.limit,
+            offset=query.offset,
+            cursor=query.cursor,
+        )
+    except InvalidCursorError as err:
+        raise HTTPException(HTTPStatus.BAD_REQUEST, str(err)) from err
+    docs, cnt, count_exact = await fetch_page(
+        q, pipeline, CountMode.parse(query.count_mode)
+    )
+    offset = 0 if query.cursor else query.offset
 
-    q_agg = q.aggregate(pipeline, projection_model=m.IssueRO)
-
-    return BaseListOutput.make(
-        items=[await IssueListOutput.from_obj(issue) async for issue in q_agg],
-        count=cnt,
+    return CursorListOutput.make(
+        items=[
+            await IssueListOutput.from_obj(m.IssueRO.model_validate(doc))
+            for doc in docs
+        ],
+        count=cnt if cnt is not None else offset + len(docs),
         limit=query.limit,
-        offset=query.offset,
+        offset=offset,
+        next_cursor=next_cursor(docs, sort, query.limit),
+        count_exact=count_exact,
     )
 
 
@@ -1122,8 +1178,8 @@ async def update_link(
     src_il.type = body.type
     target_il.type = body.type.inverse()
 
-    await obj.replace()
-    await target_obj.replace()
+    await obj.write_changes()
+    await target_obj.write_changes()
 
     accessible_tag_ids = await user_ctx.get_accessible_tag_ids()
     return SuccessPayloadOutput(
@@ -1167,11 +1223,11 @@ async def unlink_issue(
         )
 
     obj.interlinks.remove(src_il)
-    await obj.replace()
+    await obj.write_changes()
 
     if target_obj and target_il:
         target_obj.interlinks.remove(target_il)
-        await target_obj.replace()
+        await target_obj.write_changes()
 
     accessible_tag_ids = await user_ctx.get_accessible_tag_ids()
     return SuccessPayloadOutput(
@@ -1214,7 +1270,7 @@ async def tag_issue(
         raise HTTPException(HTTPStatus.CONFLICT, 'Issue already tagged')
 
     obj.tags.append(m.TagLinkField.from_obj(tag))
-    await obj.replace()
+    await obj.write_changes()
 
     accessible_tag_ids = await user_ctx.get_accessible_tag_ids()
     return SuccessPayloadOutput(
@@ -1257,7 +1313,7 @@ async def untag_issue(
         raise HTTPException(HTTPStatus.CONFLICT, 'Issue not tagged')
 
     obj.tags = [t for t in obj.tags if t.id != tag.id]
-    await obj.replace()
+    await obj.write_changes()
 
     accessible_tag_ids = await user_ctx.get_accessible_tag_ids()
     return SuccessPayloadOutput(
@@ -1372,7 +1428,7 @@ async def grant_issue_permission(
     if any(perm == permission for perm in obj.permissions):
         raise HTTPException(HTTPStatus.CONFLICT, 'Permission already exists')
     obj.permissions.append(permission)
-    await obj.replace()
+    await obj.write_changes()
     return UUIDOutput.make(permission.id)
 
 
@@ -1446,7 +1502,7 @@ async def revoke_issue_permission(
             )
 
     obj.permissions = [perm for perm in obj.permissions if perm.id != permission_id]
-    await obj.replace()
+    await obj.write_changes()
     return UUIDOutput.make(permission_id)
 
 
@@ -1524,7 +1580,7 @@ async def copy_project_permissions_to_issue(
             copied_count += 1
 
     if copied_count > 0:
-        await obj.replace()
+        await obj.write_changes()
 
     return SuccessOutput()
 
@@ -1569,7 +1625,7 @@ async def disable_project_permissions_inheritance(
             )
 
     obj.disable_project_permissions_inheritance = True
-    await obj.replace()
+    await obj.write_changes()
 
     return SuccessOutput()
 
@@ -1607,7 +1663,7 @@ async def enable_project_permissions_inheritance(
     ]
 
     obj.disable_project_permissions_inheritance = False
-    await obj.replace()
+    await obj.write_changes()
 
     return SuccessOutput()
 
@@ -1636,7 +1692,10 @@ async def list_issue_attachments(
         )
         all_attachments.append(attachment_out)
 
-    for comment in obj.comments:
+    async for comment in m.IssueCommentEntry.find(
+        m.IssueCommentEntry.issue_id == obj.id,
+        m.IssueCommentEntry.attachments != [],
+    ):
         for attachment in comment.attachments:
             attachment_out = await IssueAttachmentWithSourceOutput.from_obj_with_source(
                 attachment, AttachmentSourceTypeT.COMMENT, comment.id
@@ -1702,7 +1761,7 @@ async def add_issue_attachment(
     obj.updated_at = now
     obj.updated_by = m.UserLinkField.from_obj(user_ctx.user)
 
-    await obj.replace()
+    await obj.write_changes()
 
     if not attachment.encryption:
         await process_attachments_ocr.kiq([str(attachment.id)], str(obj.id))
@@ -1720,7 +1779,7 @@ async def add_issue_attachment(
     await send_event(
         Event(
             type=EventType.ISSUE_UPDATE,
-            data={'issue_id': str(obj.id), 'project_id': str(obj.project.id)},
+            data=issue_event_data(obj),
         ),
     )
 
@@ -1764,7 +1823,7 @@ async def delete_issue_attachment(
     obj.updated_at = now
     obj.updated_by = m.UserLinkField.from_obj(user_ctx.user)
 
-    await obj.replace()
+    await obj.write_changes()
 
     # Send notification
     await schedule_batched_notification(
@@ -1780,7 +1839,7 @@ async def delete_issue_attachment(
     await send_event(
         Event(
             type=EventType.ISSUE_UPDATE,
-            data={'issue_id': str(obj.id), 'project_id': str(obj.project.id)},
+            data=issue_event_data(obj),
         ),
     )
 
@@ -1882,7 +1941,7 @@ async def batch_create_issue_attachments(
     if successes:
         obj.updated_at = now
         obj.updated_by = m.UserLinkField.from_obj(user_ctx.user)
-        await obj.replace()
+        await obj.write_changes()
 
         ocr_attachments = [
             str(success.payload.id)
@@ -1905,7 +1964,7 @@ async def batch_create_issue_attachments(
         await send_event(
             Event(
                 type=EventType.ISSUE_UPDATE,
-                data={'issue_id': str(obj.id), 'project_id': str(obj.project.id)},
+                data=issue_event_data(obj),
             ),
         )
 
@@ -1966,7 +2025,7 @@ async def batch_delete_issue_attachments(
         now = utcnow()
         obj.updated_at = now
         obj.updated_by = m.UserLinkField.from_obj(user_ctx.user)
-        await obj.replace()
+        await obj.write_changes()
 
         await schedule_batched_notification(
             'update',
@@ -1981,7 +2040,7 @@ async def batch_delete_issue_attachments(
         await send_event(
             Event(
                 type=EventType.ISSUE_UPDATE,
-                data={'issue_id': str(obj.id), 'project_id': str(obj.project.id)},
+                data=issue_event_data(obj),
             ),
         )
 
@@ -43,7 +43,8 @@ async def get_spent_time(
         raise HTTPException(HTTPStatus.NOT_FOUND, 'Issue not found')
     user_ctx = current_user()
     user_ctx.validate_issue_permission(issue, PermAnd(ProjectPermissions.ISSUE_READ))
-    all_authors = {c.author.id: c.author for c in issue.comments}
+    comments = await m.IssueCommentEntry.of_issue(issue.id).to_list()
+    all_authors = {c.author.id: c.author for c in comments}
     records = [
         IssueSpentTimeRecordOutput(
             id=comment.id,
@@ -51,12 +52,12 @@ async def get_spent_time(
             spent_time=comment.spent_time,
             created_at=comment.created_at,
         )
-        for comment in issue.comments
+        for comment in comments
         if comment.spent_time
     ]
     return SuccessPayloadOutput(
         payload=IssueSpentTimeOutput(
-            total_spent_time=sum((c.spent_time for c in issue.comments), start=0),
+            total_spent_time=sum((c.spent_time for c in comments), start=0),
             records=records,
         ),
     )
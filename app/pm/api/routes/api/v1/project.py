@@ -2,6 +2,7 @@
 import asyncio
 import contextlib
 from http import HTTPStatus
+from itertools import batched
 from typing import Annotated, Self
 from uuid import UUID
 
@@ -15,6 +16,7 @@ from pm.api.context import (
     current_user,
     current_user_context_dependency,
 )
+from pm.api.events_bus import issue_event_data, send_events
 from pm.api.utils.router import APIRouter
 from pm.api.views.custom_fields import (
     CustomFieldOutput,
@@ -40,6 +42,7 @@ from pm.api.views.params import ListParams
 from pm.api.views.role import RoleLinkOutput, RoleOutput
 from pm.api.views.select import SelectParams
 from pm.api.views.user import UserOutput
+from pm.cache import CacheTag, invalidate_cache_tags
 from pm.config import CONFIG
 from pm.enums import EncryptionTargetTypeT
 from pm.permissions import (
@@ -49,6 +52,7 @@ from pm.permissions import (
 )
 from pm.services.avatars import PROJECT_AVATAR_STORAGE_DIR
 from pm.services.files import STORAGE_CLIENT
+from pm.utils.events_bus import Event, EventType
 from pm.utils.file_storage._base import FileHeader, StorageFileNotFoundError
 
 __all__ = ('router',)
@@ -56,6 +60,7 @@ __all__ = ('router',)
 ProjectIdentifier = PydanticObjectId | str
 
 SLUG_PATTERN = r'^\w+$'
+ALIAS_EVENTS_BATCH_SIZE = 500
 
 router = APIRouter(
     prefix='/project',
@@ -490,10 +495,27 @@ async def create_project(
     )
     obj.permissions.append(owner_permission)
     await obj.save_changes()
+    await invalidate_cache_tags(CacheTag.PROJECTS)
 
     return SuccessPayloadOutput(payload=ProjectOutput.from_obj(obj))
 
 
+async def _update_issue_aliases(
+    project_id: PydanticObjectId,
+    old_slug: str,
+    new_slug: str,
+) -> None:
+    issues = await m.Issue.update_project_slug(project_id, old_slug, new_slug)
+    # indexed text search backends learn the new aliases from update events
+    for chunk in batched(issues, ALIAS_EVENTS_BATCH_SIZE):
+        await send_events(
+            [
+                Event(type=EventType.ISSUE_UPDATE, data=issue_event_data(issue))
+                for issue in chunk
+            ],
+        )
+
+
 @router.put('/{project_id}')
 async def update_project(
     project_id: ProjectIdentifier,
@@ -546,7 +568,7 @@ async def update_project(
                 'Project slug already used',
             )
         background_tasks.add_task(
-            m.Issue.update_project_slug,
+            _update_issue_aliases,
             obj.id,
             obj.slug,
             body.slug,
@@ -582,11 +604,12 @@ async def delete_project(
     )
     await obj.delete()
     await asyncio.gather(
-        m.Issue.find(m.Issue.project.id == obj.id).delete(),
+        m.Issue.delete_project_issues(obj.id),
         m.IssueDraft.find(m.IssueDraft.project.id == obj.id).delete(),
         m.Board.remove_project_embedded_links(obj.id),
         m.Report.remove_project_embedded_links(obj.id),
     )
+    await invalidate_cache_tags(CacheTag.PROJECTS)
     return ModelIdOutput.make(obj.id)
 
 
@@ -807,6 +830,7 @@ async def grant_permission(
         raise HTTPException(HTTPStatus.CONFLICT, 'Permission already granted')
     project.permissions.append(permission)
     await project.save_changes()
+    await invalidate_cache_tags(CacheTag.PROJECTS)
     return UUIDOutput.make(permission.id)
 
 
@@ -824,6 +848,7 @@ async def revoke_permission(
         perm for perm in project.permissions if perm.id != permission_id
     ]
     await project.replace()
+    await invalidate_cache_tags(CacheTag.PROJECTS)
     return UUIDOutput.make(permission_id)
 
 
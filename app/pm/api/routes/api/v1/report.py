@@ -33,6 +33,7 @@ from pm.api.views.permission import (
     UpdatePermissionBody,
 )
 from pm.api.views.user import UserOutput
+from pm.services.custom_field_catalog import get_custom_field_catalog
 from pm.utils.pydantic_uuid import UUIDStr
 
 if TYPE_CHECKING:
@@ -289,9 +290,8 @@ async def _validate_axis(axis: AxisInput) -> m.Axis:
                 'custom_field_gid must be provided for custom field axis',
             )
 
-        field = await m.CustomField.find_one(
-            m.CustomField.gid == axis.custom_field_gid, with_children=True
-        )
+        catalog = await get_custom_field_catalog()
+        field = catalog.group_field(axis.custom_field_gid)
         if not field:
             raise HTTPException(
                 HTTPStatus.BAD_REQUEST,
@@ -683,9 +683,8 @@ async def generate_single_axis_report_data(
     # Custom field axis
     field_gid = report.axis_1.custom_field.gid
 
-    field = await m.CustomField.find_one(
-        m.CustomField.gid == field_gid, with_children=True
-    )
+    catalog = await get_custom_field_catalog()
+    field = catalog.group_field(field_gid)
     if not field:
         raise HTTPException(HTTPStatus.BAD_REQUEST, f'Field {field_gid} not found')
 
@@ -792,9 +791,8 @@ async def generate_project_custom_field_report_data(
     # axis_1 is project, axis_2 is custom field
     custom_field_gid = report.axis_2.custom_field.gid
 
-    custom_field = await m.CustomField.find_one(
-        m.CustomField.gid == custom_field_gid, with_children=True
-    )
+    catalog = await get_custom_field_catalog()
+    custom_field = catalog.group_field(custom_field_gid)
     if not custom_field:
         raise HTTPException(
             HTTPStatus.BAD_REQUEST, f'Field {custom_field_gid} not found'
@@ -944,9 +942,8 @@ async def generate_custom_field_project_report_data(
     # axis_1 is custom field, axis_2 is project
     custom_field_gid = report.axis_1.custom_field.gid
 
-    custom_field = await m.CustomField.find_one(
-        m.CustomField.gid == custom_field_gid, with_children=True
-    )
+    catalog = await get_custom_field_catalog()
+    custom_field = catalog.group_field(custom_field_gid)
     if not custom_field:
         raise HTTPException(
             HTTPStatus.BAD_REQUEST, f'Field {custom_field_gid} not found'
@@ -1092,12 +1089,9 @@ async def generate_two_axis_report_data(
     primary_field_gid = report.axis_1.custom_field.gid
     secondary_field_gid = report.axis_2.custom_field.gid
 
-    primary_field = await m.CustomField.find_one(
-        m.CustomField.gid == primary_field_gid, with_children=True
-    )
-    secondary_field = await m.CustomField.find_one(
-        m.CustomField.gid == secondary_field_gid, with_children=True
-    )
+    catalog = await get_custom_field_catalog()
+    primary_field = catalog.group_field(primary_field_gid)
+    secondary_field = catalog.group_field(secondary_field_gid)
 
     if not primary_field or not secondary_field:
         raise HTTPException(HTTPStatus.BAD_REQUEST, 'Field not found')
@@ -19,6 +19,7 @@ from pm.api.views.output import (
 )
 from pm.api.views.params import ListParams
 from pm.api.views.role import RoleOutput
+from pm.cache import CacheTag, invalidate_cache_tags
 from pm.permissions import ProjectPermissions
 
 __all__ = ('router',)
@@ -144,6 +145,7 @@ async def delete_role(
 
     await obj.delete()
     await m.Project.remove_role_embedded_links(role_id)
+    await invalidate_cache_tags(CacheTag.PERMISSIONS)
     return ModelIdOutput.make(role_id)
 
 
@@ -176,6 +178,7 @@ async def grant_permission(
     obj.permissions.append(permission_key)
     await obj.save_changes()
     await m.Project.update_role_embedded_links(obj)
+    await invalidate_cache_tags(CacheTag.PERMISSIONS)
     return SuccessPayloadOutput(payload=RoleOutput.from_obj(obj))
 
 
@@ -205,4 +208,5 @@ async def revoke_permission(
     obj.permissions.remove(permission_key)
     await obj.replace()
     await m.Project.update_role_embedded_links(obj)
+    await invalidate_cache_tags(CacheTag.PERMISSIONS)
     return SuccessPayloadOutput(payload=RoleOutput.from_obj(obj))
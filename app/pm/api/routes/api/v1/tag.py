@@ -27,6 +27,7 @@ from pm.api.views.permission import (
     UpdatePermissionBody,
 )
 from pm.api.views.user import UserOutput
+from pm.cache import CacheTag, invalidate_cache_tags
 
 __all__ = ('router',)
 
@@ -149,6 +150,7 @@ async def create_tag(
         permissions=[creator_permission],
     )
     await tag.insert()
+    await invalidate_cache_tags(CacheTag.TAGS)
     return SuccessPayloadOutput(payload=TagOutput.from_obj(tag))
 
 
@@ -193,6 +195,7 @@ async def delete_tag(
             status_code=HTTPStatus.FORBIDDEN, detail='No permission to modify this tag'
         )
     await tag.delete()
+    await invalidate_cache_tags(CacheTag.TAGS)
     await m.Issue.remove_tag_embedded_links(tag_id)
     return ModelIdOutput.make(tag_id)
 
@@ -235,6 +238,7 @@ async def grant_permission(
     )
     tag.permissions.append(p)
     await tag.save_changes()
+    await invalidate_cache_tags(CacheTag.TAGS)
     return UUIDOutput.make(p.id)
 
 
@@ -300,6 +304,7 @@ async def revoke_permission(
         raise HTTPException(HTTPStatus.FORBIDDEN, 'Tag must have at least one admin')
     tag.permissions.remove(perm)
     await tag.save_changes()
+    await invalidate_cache_tags(CacheTag.TAGS)
     return UUIDOutput.make(perm.id)
 
 
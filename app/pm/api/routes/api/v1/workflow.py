@@ -17,6 +17,7 @@ from pm.api.views.output import (
     SuccessPayloadOutput,
 )
 from pm.api.views.params import ListParams
+from pm.workflows import evict_compiled_script
 
 __all__ = ('router',)
 
@@ -136,6 +137,7 @@ async def delete_workflow(workflow_id: PydanticObjectId) -> ModelIdOutput:
     if not obj:
         raise HTTPException(HTTPStatus.NOT_FOUND, 'Workflow not found')
     await obj.delete()
+    evict_compiled_script(str(obj.id))
     return ModelIdOutput.from_obj(obj)
 
 
@@ -202,4 +204,5 @@ async def update_workflow(
         setattr(obj, k, v)
     if obj.is_changed:
         await obj.save_changes()
+        evict_compiled_script(str(obj.id))
     return SuccessPayloadOutput(payload=output_from_obj(obj))
@@ -3,7 +3,7 @@ from collections.abc import AsyncGenerator, Callable
 from enum import StrEnum
 from typing import Any, ParamSpec
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 __all__ = (
     'SentEventOutput',
@@ -20,14 +20,19 @@ class SentEventType(StrEnum):
     ISSUE_UPDATE = 'issue_update'
     ISSUE_CREATE = 'issue_create'
     ISSUE_DELETE = 'issue_delete'
+    RESYNC = 'resync'
 
 
 class SentEventOutput(BaseModel):
     type: SentEventType
     data: dict | None = None
+    id: str | None = Field(default=None, exclude=True)
 
     def to_msg(self) -> str:
-        return f'data: {self.model_dump_json(exclude_unset=True)}\n\n'
+        msg = f'data: {self.model_dump_json(exclude_unset=True)}\n\n'
+        if self.id:
+            return f'id: {self.id}\n{msg}'
+        return msg
 
 
 P = ParamSpec('P')
@@ -1,22 +1,29 @@
-from collections.abc import AsyncGenerator
+import asyncio
+from collections.abc import AsyncGenerator, Callable
 from http import HTTPStatus
 from typing import Any
 
 import beanie.operators as bo
-import redis.asyncio as aioredis
 from beanie import PydanticObjectId
-from fastapi import Depends, HTTPException
+from fastapi import Depends, Header, HTTPException, Query
 from fastapi.responses import StreamingResponse
 
 import pm.models as m
-from pm.api.context import current_user_context_dependency
+from pm.api.context import current_user, current_user_context_dependency
+from pm.api.events_hub import (
+    RESYNC,
+    EventsHub,
+    EventSubscription,
+    ResyncT,
+    get_events_hub,
+)
 from pm.api.utils.query_params import (
     pydantic_object_id_validator,
     query_comma_separated_list_param,
 )
 from pm.api.utils.router import APIRouter
 from pm.config import CONFIG
-from pm.utils.events_bus import Event, EventType
+from pm.utils.events_bus import Event, EventType, stream_id_key
 
 from ._base import SentEventOutput, SentEventType, with_ping
 
@@ -36,49 +43,137 @@ MAP_SENT_EVENT_TYPE = {
 }
 
 
-def _check_issue_filters(
-    issue_id: str,
-    project_id: str | None,
-    issue_ids: set[str] | None,
-    project_ids: set[str] | None,
-) -> bool:
-    if not issue_ids and not project_ids:
-        return True
-    if issue_ids and issue_id in issue_ids:
-        return True
-    return bool(project_ids and project_id in project_ids)
+COALESCE_MAX_MS = 10_000
+
+
+class _IssueEventsBatch:
+    """Per-issue dedupe of events received within a coalescing window."""
+
+    def __init__(self) -> None:
+        self._issues: dict[str, EventType] = {}
+        self.last_id: str | None = None
+
+    def add(self, event: Event) -> None:
+        self.last_id = event.id or self.last_id
+        issue_id = event.data['issue_id']
+        prev = self._issues.get(issue_id)
+        if prev in (EventType.ISSUE_CREATE, EventType.ISSUE_DELETE) and (
+            event.type == EventType.ISSUE_UPDATE
+        ):
+            return
+        self._issues[issue_id] = event.type
+
+    def to_outputs(self) -> list[SentEventOutput]:
+        grouped: dict[EventType, list[str]] = {}
+        for issue_id, type_ in self._issues.items():
+            grouped.setdefault(type_, []).append(issue_id)
+        return [
+            SentEventOutput(
+                type=MAP_SENT_EVENT_TYPE[type_],
+                data={'issue_ids': issue_ids},
+                id=self.last_id,
+            )
+            for type_, issue_ids in grouped.items()
+        ]
+
+
+async def _collect_window(
+    sub: EventSubscription,
+    first: Event,
+    window: float,
+) -> _IssueEventsBatch | ResyncT:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + window
+    batch = _IssueEventsBatch()
+    batch.add(first)
+    while (timeout := deadline - loop.time()) > 0:
+        try:
+            event = await asyncio.wait_for(sub.get(), timeout)
+        except TimeoutError:
+            break
+        if event is RESYNC:
+            return RESYNC
+        if _is_issue_event(event):
+            batch.add(event)
+    return batch
+
+
+def _is_issue_event(event: Event) -> bool:
+    return event.type in MAP_SENT_EVENT_TYPE and bool(event.data.get('issue_id'))
+
+
+def _event_output(event: Event) -> SentEventOutput:
+    return SentEventOutput(
+        type=MAP_SENT_EVENT_TYPE[event.type],
+        data={'issue_id': event.data['issue_id']},
+        id=event.id,
+    )
+
+
+def _resync_output(hub: EventsHub) -> SentEventOutput:
+    return SentEventOutput(type=SentEventType.RESYNC, id=hub.last_id)
+
+
+def _replay_outputs(
+    sub: EventSubscription,
+    events: list[Event],
+    coalesce: bool,
+) -> list[SentEventOutput]:
+    events = [ev for ev in events if _is_issue_event(ev) and sub.matches(ev)]
+    if not coalesce:
+        return [_event_output(ev) for ev in events]
+    batch = _IssueEventsBatch()
+    for event in events:
+        batch.add(event)
+    return batch.to_outputs()
 
 
 @with_ping
 async def issues_event_generator(
     issue_ids: list[PydanticObjectId] | None,
     project_ids: list[PydanticObjectId] | None,
+    can_read: Callable[[dict], bool],
+    coalesce_ms: int | None = None,
+    last_event_id: str | None = None,
 ) -> AsyncGenerator[SentEventOutput, Any]:
     issue_ids_ = {str(issue_id) for issue_id in issue_ids} if issue_ids else None
     project_ids_ = (
         {str(project_id) for project_id in project_ids} if project_ids else None
     )
-    client = aioredis.from_url(CONFIG.REDIS_EVENT_BUS_URL).pubsub()
-    await client.subscribe('events')
-    try:
-        async for msg in client.listen():
-            if msg['type'] != 'message':
+    hub = get_events_hub()
+    async with hub.subscribe(
+        issue_ids_,
+        project_ids_,
+        predicate=lambda event: can_read(event.data),
+    ) as sub:
+        replayed_until: tuple[int, int] | None = None
+        if last_event_id:
+            replayed = await hub.replay(last_event_id, CONFIG.EVENTS_REPLAY_MAX)
+            if replayed is None:
+                yield _resync_output(hub)
+            else:
+                if replayed:
+                    replayed_until = stream_id_key(replayed[-1].id)
+                for output in _replay_outputs(sub, replayed, bool(coalesce_ms)):
+                    yield output
+        while True:
+            event = await sub.get()
+            if event is RESYNC:
+                yield _resync_output(hub)
                 continue
-            event = Event.from_bus_msg(msg['data'])
-            if event.type not in MAP_SENT_EVENT_TYPE:
+            if not _is_issue_event(event):
                 continue
-            if not (issue_id := event.data.get('issue_id')):
+            if replayed_until and stream_id_key(event.id) <= replayed_until:
                 continue
-            project_id = event.data.get('project_id')
-            if not _check_issue_filters(issue_id, project_id, issue_ids_, project_ids_):
+            if not coalesce_ms:
+                yield _event_output(event)
                 continue
-            yield SentEventOutput(
-                type=MAP_SENT_EVENT_TYPE[event.type],
-                data={'issue_id': issue_id},
-            )
-    finally:
-        await client.unsubscribe('events')
-        await client.close()
+            batch = await _collect_window(sub, event, coalesce_ms / 1000)
+            if batch is RESYNC:
+                yield _resync_output(hub)
+                continue
+            for output in batch.to_outputs():
+                yield output
 
 
 @router.get('')
@@ -98,12 +193,24 @@ async def get_issue_events(
         required=False,
         single_value_validator=pydantic_object_id_validator,
     ),
+    coalesce_ms: int | None = Query(
+        None,
+        ge=0,
+        le=COALESCE_MAX_MS,
+        description='Merge events received within this window (ms) into frames with a list of issue ids',
+    ),
+    last_event_id: str | None = Header(
+        None,
+        alias='Last-Event-ID',
+        description='Replay events stored after this id',
+    ),
 ) -> StreamingResponse:
     if not CONFIG.REDIS_EVENT_BUS_URL:
         raise HTTPException(
             status_code=HTTPStatus.NOT_IMPLEMENTED,
             detail='Redis event bus is not configured',
         )
+    user_ctx = current_user()
     if boards_ids:
         boards = await m.Board.find(bo.In(m.Board.id, set(boards_ids))).to_list()
         issue_ids = issue_ids or []
@@ -115,6 +222,12 @@ async def get_issue_events(
                 break
             project_ids.extend([pr.id for pr in board.projects])
     return StreamingResponse(
-        issues_event_generator(issue_ids, project_ids),
+        issues_event_generator(
+            issue_ids,
+            project_ids,
+            user_ctx.get_issue_event_read_filter(),
+            coalesce_ms=coalesce_ms,
+            last_event_id=last_event_id,
+        ),
         media_type='text/event-stream',
     )
@@ -0,0 +1,186 @@
+import asyncio
+import base64
+import binascii
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, Self
+
+import bson
+from beanie.odm.utils.projection import get_projection
+from bson.errors import BSONError
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from beanie.odm.queries.find import FindMany
+
+__all__ = (
+    'COUNT_MODE_PATTERN',
+    'CountMode',
+    'InvalidCursorError',
+    'count_documents',
+    'decode_cursor',
+    'encode_cursor',
+    'fetch_page',
+    'keyset_pipeline',
+    'next_cursor',
+)
+
+
+COUNT_MODE_PATTERN = r'^(exact|estimated|none|capped:[1-9][0-9]*)$'
+ESTIMATED_COUNT_CAP = 10_000
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class CountMode:
+    kind: Literal['exact', 'estimated', 'none', 'capped']
+    cap: int | None = None
+
+    @classmethod
+    def parse(cls, value: str) -> Self:
+        if not re.match(COUNT_MODE_PATTERN, value):
+            raise ValueError(f'Invalid count mode: {value}')
+        kind, _, cap = value.partition(':')
+        return cls(kind=kind, cap=int(cap) if cap else None)  # type: ignore[arg-type]
+
+
+async def count_documents(q: 'FindMany', mode: CountMode) -> tuple[int | None, bool]:
+    """Count documents matched by the query according to the count mode.
+
+    Returns the count (``None`` when not counted) and whether it is exact.
+    Capped counts stop scanning at the cap, so a result equal to the cap
+    means "cap or more". An estimate is only available for unfiltered
+    queries, other queries fall back to a capped count.
+    """
+    if mode.kind == 'none':
+        return None, False
+    if mode.kind == 'exact':
+        return await q.count(), True
+    collection = q.document_model.get_motor_collection()
+    flt = q.get_filter_query()
+    if mode.kind == 'estimated' and not flt:
+        return await collection.estimated_document_count(), False
+    cap = mode.cap or ESTIMATED_COUNT_CAP
+    count = await collection.count_documents(flt, limit=cap)
+    return count, count < cap
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """Encode sort key values of the last returned document into an opaque cursor."""
+    return base64.urlsafe_b64encode(bson.encode({'v': values})).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = bson.decode(raw)['v']
+    except (ValueError, binascii.Error, BSONError, KeyError) as err:
+        raise InvalidCursorError('Invalid cursor') from err
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError('Cursor does not match the sort order')
+    return values
+
+
+def _get_path(doc: Mapping[str, Any], path: str) -> Any:
+    value: Any = doc
+    for part in path.split('.'):
+        if not isinstance(value, Mapping):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _after(field: str, value: Any, direction: int) -> dict | None:
+    # nulls (and missing values) sort before any other value
+    if value is None:
+        return {field: {'$ne': None}} if direction == 1 else None
+    if direction == 1:
+        return {field: {'$gt': value}}
+    return {'$or': [{field: {'$lt': value}}, {field: None}]}
+
+
+def _keyset_match(sort: dict[str, int], values: list[Any]) -> dict:
+    branches = []
+    fields = list(sort)
+    for idx, field in enumerate(fields):
+        if not (after := _after(field, values[idx], sort[field])):
+            continue
+        equals = [{f: v} for f, v in zip(fields[:idx], values[:idx], strict=True)]
+        branches.append({'$and': [*equals, after]} if equals else after)
+    return {'$or': branches}
+
+
+def _projection(model: type[BaseModel], sort: dict[str, int]) -> dict[str, int]:
+    projection = dict(get_projection(model) or {})
+    for field in sort:
+        if field.split('.', 1)[0] not in projection:
+            projection[field] = 1
+    return projection
+
+
+def keyset_pipeline(
+    sort_pipeline: list[dict],
+    projection_model: type[BaseModel],
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+) -> tuple[list[dict], dict[str, int]]:
+    """Turn a sort pipeline into a page pipeline.
+
+    ``_id`` is appended to the sort so the order is total. With a cursor the
+    page starts right after the document it was built from instead of
+    skipping ``offset`` documents, so deep pages cost the same as the first
+    one when the sort is backed by an index. Sort keys are kept in the
+    projection so ``next_cursor`` can be built from the last document.
+    """
+    stages = [stage for stage in sort_pipeline if '$project' not in stage]
+    sort_idx = next(
+        (idx for idx, stage in enumerate(stages) if '$sort' in stage), len(stages)
+    )
+    sort = dict(stages[sort_idx]['$sort']) if sort_idx < len(stages) else {}
+    if '_id' not in sort:
+        sort['_id'] = next(reversed(sort.values()), -1)
+    pipeline = stages[:sort_idx]
+    if cursor:
+        pipeline.append(
+            {'$match': _keyset_match(sort, decode_cursor(cursor, len(sort)))}
+        )
+    pipeline.append({'$sort': sort})
+    if offset and not cursor:
+        pipeline.append({'$skip': offset})
+    pipeline += [
+        {'$limit': limit},
+        {'$project': _projection(projection_model, sort)},
+    ]
+    return pipeline, sort
+
+
+def next_cursor(
+    docs: list[Mapping[str, Any]], sort: dict[str, int], limit: int
+) -> str | None:
+    if not docs or len(docs) < limit:
+        return None
+    return encode_cursor([_get_path(docs[-1], field) for field in sort])
+
+
+async def fetch_page(
+    q: 'FindMany',
+    page_pipeline: list[dict],
+    count_mode: CountMode,
+) -> tuple[list[dict], int | None, bool]:
+    """Fetch a page of raw documents together with the total count.
+
+    The page query and the count run concurrently as separate queries, so
+    the page keeps using indexes for its sort and limit. Running the page
+    inside a ``$facet`` with the count would save a round trip, but facet
+    sub-pipelines cannot use indexes and would sort every match in memory.
+    """
+    (count, count_exact), docs = await asyncio.gather(
+        count_documents(q, count_mode),
+        q.aggregate(page_pipeline).to_list(),
+    )
+    return docs, count, count_exact
@@ -18,6 +18,7 @@ __all__ = (
     'BatchFailureItem',
     'BatchOperationOutput',
     'BatchSuccessItem',
+    'CursorListOutput',
     'ErrorOutput',
     'ErrorPayloadOutput',
     'MFARequiredOutput',
@@ -194,6 +195,42 @@ class BaseListOutput(SuccessPayloadOutput, Generic[T]):
         )
 
 
+class CursorListPayload(BaseListPayload[T], Generic[T]):
+    next_cursor: str | None = Field(
+        None,
+        description='Pass as cursor to get the next page, null on the last page',
+    )
+    count_exact: bool = Field(
+        True,
+        description='False when count is an estimate or a lower bound (e.g. 10000+)',
+    )
+
+
+class CursorListOutput(SuccessPayloadOutput, Generic[T]):
+    payload: CursorListPayload[T]
+
+    @classmethod
+    def make(
+        cls,
+        items: list[T],
+        count: int,
+        limit: int,
+        offset: int,
+        next_cursor: str | None = None,
+        count_exact: bool = True,
+    ) -> 'CursorListOutput[T]':
+        return cls(
+            payload=CursorListPayload(
+                count=count,
+                limit=limit,
+                offset=offset,
+                items=items,
+                next_cursor=next_cursor,
+                count_exact=count_exact,
+            ),
+        )
+
+
 class BatchSuccessItem(BaseModel, Generic[T]):
     payload: T
 
@@ -1,12 +1,14 @@
 import logging
 from collections.abc import Awaitable, Callable
 from datetime import timedelta
+from enum import StrEnum
 from typing import Any, ParamSpec, TypeVar
 
 from pm.config import CONFIG
 from pm.utils.cache import (
     CacheConfig,
     CacheRegistry,
+    LocalCache,
     RedisCache,
 )
 from pm.utils.cache import (
@@ -21,22 +23,40 @@ T = TypeVar('T')
 __all__ = (
     'CacheConfig',
     'CacheRegistry',
+    'CacheTag',
+    'LocalCache',
     'RedisCache',
     'cached',
     'clear_cache_provider',
     'get_cache_provider',
+    'get_local_cache',
     'init_cache',
     'init_cache_system',
+    'invalidate_cache_tags',
     'shutdown_cache_system',
 )
 
+
+class CacheTag(StrEnum):
+    """Tags of cached entries which must be invalidated on related writes."""
+
+    GROUPS = 'groups:all'
+    PROJECTS = 'projects:all'
+    PERMISSIONS = 'permissions:all'
+    GLOBAL_PERMISSIONS = 'global_permissions:all'
+    TAGS = 'tags:all'
+    CUSTOM_FIELDS = 'custom_fields:all'
+
+
 # Module-level registry instance
 _registry = CacheRegistry()
 
 
-async def init_cache(config: CacheConfig) -> RedisCache:
+async def init_cache(
+    config: CacheConfig, local: LocalCache | None = None
+) -> RedisCache:
     """Initialize and register a cache provider."""
-    provider = RedisCache(config)
+    provider = RedisCache(config, local=local)
     await provider.init()
     _registry.set_provider(provider)
     return provider
@@ -47,12 +67,18 @@ def get_cache_provider() -> RedisCache | None:
     return _registry.get_provider()  # type: ignore[return-value]
 
 
+def get_local_cache() -> LocalCache | None:
+    """Get the in-process tier of the current cache provider, if any."""
+    provider = get_cache_provider()
+    return provider.local if provider else None
+
+
 def clear_cache_provider() -> None:
     """Clear the cache provider instance (useful for testing)."""
     _registry.clear()
 
 
-async def init_cache_system() -> None:
+async def init_cache_system(use_local: bool = True) -> None:
     """Initialize the application cache system."""
     if not CONFIG.CACHE_REDIS_URL:
         logger.info('Cache Redis URL not configured, cache system disabled')
@@ -65,7 +91,12 @@ async def init_cache_system() -> None:
             max_connections=CONFIG.CACHE_MAX_CONNECTIONS,
             key_prefix=CONFIG.CACHE_KEY_PREFIX,
         )
-        await init_cache(cache_config)
+        local = (
+            LocalCache(max_size=CONFIG.CACHE_LOCAL_MAX_SIZE)
+            if use_local and CONFIG.CACHE_LOCAL_ENABLED
+            else None
+        )
+        await init_cache(cache_config, local=local)
         logger.info('Cache system initialized successfully')
     except (ConnectionError, OSError, ValueError) as e:
         logger.warning('Failed to initialize cache system', exc_info=e)
@@ -80,6 +111,15 @@ async def shutdown_cache_system() -> None:
         logger.info('Cache system shutdown completed')
 
 
+async def invalidate_cache_tags(*tags: CacheTag) -> None:
+    """Invalidate cached entries by tags in Redis and in every worker's local tier."""
+    cache_provider = get_cache_provider()
+    if not cache_provider or not tags:
+        return
+    deleted = await cache_provider.invalidate_by_tags([str(tag) for tag in tags])
+    logger.debug('Cache invalidated', extra={'tags': tags, 'deleted': deleted})
+
+
 def cached(
     ttl: int | timedelta | None = None,
     tags: list[str] | None = None,
@@ -89,6 +129,7 @@ def cached(
     deserializer: Callable[[Any], T] | None = None,
     key_builder: Callable[[Callable[..., Any], tuple[Any, ...], dict[str, Any]], str]
     | None = None,
+    local_ttl: int | timedelta | None = None,
 ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
     """Pre-configured cached decorator with app registry."""
     return _cached(
@@ -100,4 +141,5 @@ def cached(
         deserializer=deserializer,
         key_builder=key_builder,
         registry=_registry,
+        local_ttl=local_ttl,
     )
@@ -90,6 +90,13 @@ def migration_status(_args: argparse.Namespace) -> None:
             print(f'  {status} {revision}: {name}')
 
 
+async def rebuild_search_index(args: argparse.Namespace) -> None:
+    """Rebuild the full-text search index from issues."""
+    from pm.cli.search import reindex
+
+    await reindex(args)
+
+
 def add_db_args(parser: argparse.ArgumentParser) -> None:
     """Add database migration subcommands to parser."""
     subparsers = parser.add_subparsers(required=True)
@@ -130,3 +137,10 @@ def add_db_args(parser: argparse.ArgumentParser) -> None:
     # db migrate status
     status_parser = subparsers.add_parser('status', help='Show migration status')
     status_parser.set_defaults(func=migration_status)
+
+    # db search-index
+    search_index_parser = subparsers.add_parser(
+        'search-index',
+        help='Rebuild the full-text search index from scratch',
+    )
+    search_index_parser.set_defaults(func=rebuild_search_index)
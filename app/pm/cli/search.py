@@ -0,0 +1,77 @@
+# pylint: disable=import-outside-toplevel
+import argparse
+
+__all__ = ('add_search_args',)
+
+
+async def init_db() -> None:
+    from beanie import init_beanie
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from pm.config import CONFIG
+    from pm.models import __beanie_models__
+
+    client = AsyncIOMotorClient(CONFIG.DB_URI)
+    db = client.get_default_database()
+    await init_beanie(db, document_models=__beanie_models__)
+
+
+# pylint: disable=unused-argument
+# ruff: noqa: ARG001
+async def run_indexer(args: argparse.Namespace) -> None:
+    from pm.config import CONFIG
+    from pm.services.text_search import SEARCH_BACKEND, SearchIndexer
+
+    if not SEARCH_BACKEND.is_indexed:
+        print(f'Search backend {CONFIG.SEARCH_BACKEND} does not need an indexer')
+        return
+    if not CONFIG.REDIS_EVENT_BUS_URL:
+        print('REDIS_EVENT_BUS_URL is not configured')
+        return
+    await init_db()
+    indexer = SearchIndexer(
+        CONFIG.REDIS_EVENT_BUS_URL,
+        consumer=args.consumer,
+        batch_size=CONFIG.SEARCH_INDEXER_BATCH_SIZE,
+    )
+    print(f'Search indexer {indexer.consumer} started')
+    try:
+        await indexer.run()
+    finally:
+        await SEARCH_BACKEND.close()
+
+
+async def reindex(args: argparse.Namespace) -> None:
+    from pm.config import CONFIG
+    from pm.services.text_search import SEARCH_BACKEND, reindex_issues
+
+    if not SEARCH_BACKEND.is_indexed:
+        print(f'Search backend {CONFIG.SEARCH_BACKEND} does not need reindexing')
+        return
+    await init_db()
+    try:
+        count = await reindex_issues()
+    finally:
+        await SEARCH_BACKEND.close()
+    print(f'Indexed {count} issues')
+
+
+def add_search_args(parser: argparse.ArgumentParser) -> None:
+    subparsers = parser.add_subparsers(required=True)
+
+    indexer_parser = subparsers.add_parser(
+        'indexer',
+        help='Keep the search index up to date with issue events',
+    )
+    indexer_parser.add_argument(
+        '--consumer',
+        type=str,
+        help='Consumer name, must be stable across restarts (default: hostname)',
+    )
+    indexer_parser.set_defaults(func=run_indexer)
+
+    reindex_parser = subparsers.add_parser(
+        'reindex',
+        help='Rebuild the search index from scratch',
+    )
+    reindex_parser.set_defaults(func=reindex)
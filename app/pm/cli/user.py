@@ -67,6 +67,7 @@ async def change_user_email(args: argparse.Namespace) -> None:
     from beanie import PydanticObjectId
 
     import pm.models as m
+    from pm.cache import init_cache_system, shutdown_cache_system
 
     await init_db()
     user = await m.User.find_one(m.User.id == PydanticObjectId(args.user_id))
@@ -75,14 +76,19 @@ async def change_user_email(args: argparse.Namespace) -> None:
         return
     user.email = args.new_email
     await user.save_changes()
-    await asyncio.gather(
-        m.Project.update_user_embedded_links(user),
-        m.Issue.update_user_embedded_links(user),
-        m.IssueDraft.update_user_embedded_links(user),
-        m.UserMultiCustomField.update_user_embedded_links(user),
-        m.UserCustomField.update_user_embedded_links(user),
-        m.Tag.update_user_embedded_links(user),
-    )
+    # custom fields invalidate cached user options of API workers
+    await init_cache_system(use_local=False)
+    try:
+        await asyncio.gather(
+            m.Project.update_user_embedded_links(user),
+            m.Issue.update_user_embedded_links(user),
+            m.IssueDraft.update_user_embedded_links(user),
+            m.UserMultiCustomField.update_user_embedded_links(user),
+            m.UserCustomField.update_user_embedded_links(user),
+            m.Tag.update_user_embedded_links(user),
+        )
+    finally:
+        await shutdown_cache_system()
     print(f'User email changed to {args.new_email}')
 
 
@@ -19,7 +19,9 @@ __all__ = (
     'LOG_FORMAT',
     'LOG_LEVEL',
     'APIServiceTokenKeyT',
+    'AuditWriteModeT',
     'FileStorageModeT',
+    'SearchBackendT',
 )
 
 
@@ -28,6 +30,19 @@ class FileStorageModeT(StrEnum):
     S3 = 's3'
 
 
+class AuditWriteModeT(StrEnum):
+    SYNC = 'sync'
+    ASYNC = 'async'
+    ASYNC_FSYNC = 'async_fsync'
+
+
+class SearchBackendT(StrEnum):
+    MONGO = 'mongo'
+    ELASTICSEARCH = 'elasticsearch'
+    SQLITE = 'sqlite'
+    MEMORY = 'memory'
+
+
 @dataclass
 class APIServiceTokenKeyT:
     kid: str
@@ -175,6 +190,27 @@ CONFIG = Dynaconf(
             'REDIS_EVENT_BUS_URL',
             default='',
         ),
+        Validator(
+            'EVENTS_STREAM_MAXLEN',
+            cast=int,
+            default=10_000,
+            gte=1,
+            description='Approximate number of events kept in the Redis stream for replay on reconnect',
+        ),
+        Validator(
+            'EVENTS_REPLAY_MAX',
+            cast=int,
+            default=1000,
+            gte=0,
+            description='Max events replayed for Last-Event-ID, larger gaps request a resync',
+        ),
+        Validator(
+            'EVENTS_SUBSCRIPTION_QUEUE_SIZE',
+            cast=int,
+            default=1000,
+            gte=1,
+            description='Max queued events per SSE connection before dropping the oldest and requesting resync',
+        ),
         Validator(
             'OIDC_ENABLED',
             cast=bool,
@@ -241,6 +277,25 @@ CONFIG = Dynaconf(
             cast=str,
             default='snail_orbit_cache',
         ),
+        Validator(
+            'CACHE_ACL_TTL_SECONDS',
+            cast=int,
+            default=int(datetime.timedelta(hours=4).total_seconds()),
+            description='TTL of cached user ACL data, writes invalidate it explicitly',
+        ),
+        Validator(
+            'CACHE_LOCAL_ENABLED',
+            cast=bool,
+            default=True,
+            description='Keep hot cache entries (ACL) in process memory, invalidated via Redis pub/sub',
+        ),
+        Validator(
+            'CACHE_LOCAL_MAX_SIZE',
+            cast=int,
+            default=10_000,
+            gte=1,
+            description='Max number of entries in the in-process cache tier',
+        ),
         Validator(
             'WB_SYNC_ENABLED',
             cast=bool,
@@ -285,6 +340,143 @@ CONFIG = Dynaconf(
             must_exist=True,
             when=Validator('WB_SYNC_ENABLED', condition=bool),
         ),
+        Validator(
+            'WORKFLOW_SCRIPT_TIMEOUT_SECONDS',
+            is_type_of=float | int,
+            default=5.0,
+            gt=0,
+            cast=float,
+            description='Time budget of a single on-change workflow script per issue write',
+        ),
+        Validator(
+            'ISSUE_SORT_KEY_INDEXED_FIELDS',
+            is_type_of=list,
+            default=[],
+            description='Custom field names whose issue sort keys are indexed',
+        ),
+        Validator(
+            'SEARCH_BACKEND',
+            cast=SearchBackendT,
+            default=SearchBackendT.MONGO,
+            description='Issue text search backend (mongo, elasticsearch, sqlite or memory)',
+        ),
+        Validator(
+            'SEARCH_MAX_HITS',
+            cast=int,
+            default=1_000,
+            gte=1,
+            lte=5_000,
+            description='Max number of issues (comments with mongo) a text search may match, broader searches are rejected',
+        ),
+        Validator(
+            'ELASTICSEARCH_URL',
+            is_type_of=str,
+            must_exist=True,
+            description='Elasticsearch URL for issue text search',
+            when=Validator(
+                'SEARCH_BACKEND',
+                condition=lambda v: v == SearchBackendT.ELASTICSEARCH,
+            ),
+        ),
+        Validator(
+            'ELASTICSEARCH_API_KEY',
+            is_type_of=str,
+            default='',
+        ),
+        Validator(
+            'ELASTICSEARCH_VERIFY_CERTS',
+            cast=bool,
+            default=True,
+        ),
+        Validator(
+            'ELASTICSEARCH_INDEX',
+            is_type_of=str,
+            default='snail_orbit_issues',
+        ),
+        Validator(
+            'SEARCH_SQLITE_PATH',
+            is_type_of=str,
+            default='/data/search/issues.db',
+            description='SQLite full-text index file, local to the node',
+            when=Validator(
+                'SEARCH_BACKEND',
+                condition=lambda v: v == SearchBackendT.SQLITE,
+            ),
+        ),
+        Validator(
+            'SEARCH_INDEXER_EMBEDDED',
+            cast=bool,
+            default=False,
+            description='Run the search indexer in API workers instead of a separate process',
+        ),
+        Validator(
+            'SEARCH_INDEXER_BATCH_SIZE',
+            cast=int,
+            default=100,
+            gte=1,
+            description='Max number of issue events indexed at once by the search indexer',
+        ),
+        Validator(
+            'SLOW_QUERY_THRESHOLD_MS',
+            is_type_of=float | int,
+            default=500.0,
+            gte=0,
+            cast=float,
+            description='Issue searches slower than this are captured with their query plan, 0 disables capture',
+        ),
+        Validator(
+            'SLOW_QUERY_SAMPLE_RATE',
+            is_type_of=float | int,
+            default=1.0,
+            gte=0,
+            lte=1,
+            cast=float,
+            description='Fraction of slow issue searches which are explained and captured',
+        ),
+        Validator(
+            'SLOW_QUERY_LOG_SIZE',
+            cast=int,
+            default=100,
+            gte=1,
+            description='Max number of captured slow queries kept per worker',
+        ),
+        Validator(
+            'INDEX_ADVISOR_SAMPLE_RATE',
+            is_type_of=float | int,
+            default=0.05,
+            gte=0,
+            lte=1,
+            cast=float,
+            description='Fraction of issue searches whose custom field filters are counted, 0 disables sampling',
+        ),
+        Validator(
+            'INDEX_ADVISOR_ENABLED',
+            cast=bool,
+            default=False,
+            description='Periodically recommend custom field indexes from sampled searches',
+        ),
+        Validator(
+            'INDEX_ADVISOR_MIN_USES',
+            cast=int,
+            default=100,
+            gte=1,
+            description='Sampled searches on a custom field needed to consider indexing it',
+        ),
+        Validator(
+            'INDEX_ADVISOR_MAX_SELECTIVITY',
+            is_type_of=float | int,
+            default=0.05,
+            gt=0,
+            lte=1,
+            cast=float,
+            description='Max expected fraction of issues matched by a filter on a field worth indexing',
+        ),
+        Validator(
+            'INDEX_ADVISOR_AUTO_CREATE',
+            cast=bool,
+            default=False,
+            description='Create recommended indexes instead of only reporting them',
+        ),
         Validator(
             'AVATAR_EXTERNAL_URL',
             is_type_of=str,
@@ -297,6 +489,27 @@ CONFIG = Dynaconf(
             default='/data/audit',
             description='Directory for audit logs',
         ),
+        Validator(
+            'AUDIT_WRITE_MODE',
+            cast=AuditWriteModeT,
+            default=AuditWriteModeT.ASYNC,
+            description='Audit records of API writes are written inline (sync), in background batches (async) or in batches synced to disk (async_fsync)',
+        ),
+        Validator(
+            'AUDIT_FLUSH_INTERVAL',
+            is_type_of=float | int,
+            default=1.0,
+            gt=0,
+            cast=float,
+            description='Max seconds an audit record is queued, bounds the records lost on a crash',
+        ),
+        Validator(
+            'AUDIT_BATCH_SIZE',
+            cast=int,
+            default=500,
+            gte=1,
+            description='Max number of audit records written at once',
+        ),
         Validator(
             'PARARAM_NOTIFICATION_BOT_TOKEN',
             is_type_of=str,
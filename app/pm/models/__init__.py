@@ -10,6 +10,7 @@ from .group import rebuild_models as group_rebuild_models
 from .issue import *
 from .permission import *
 from .project import *
+from .query_stats import *
 from .report import *
 from .role import *
 from .search import *
@@ -30,6 +31,9 @@ __beanie_models__ = [
     User,
     Project,
     Issue,
+    IssueCommentEntry,
+    IssueHistoryEntry,
+    IssueActivity,
     IssueDraft,
     Board,
     Dashboard,
@@ -59,4 +63,5 @@ __beanie_models__ = [
     OnChangeWorkflow,
     Tag,
     Search,
+    QueryFieldUsage,
 ]
@@ -1,7 +1,12 @@
+import asyncio
+import contextlib
+import logging
+import os
+from collections.abc import Sequence
 from datetime import datetime
 from enum import StrEnum
 from pathlib import Path
-from typing import ClassVar, Self, TypeVar
+from typing import Annotated, ClassVar, Self, TypeVar
 from uuid import UUID
 
 import aiofiles
@@ -19,20 +24,36 @@ from beanie import (
     after_event,
     before_event,
 )
+from beanie.odm.utils.dump import get_dict
 from pydantic import BaseModel
+from pymongo import WriteConcern
+from pymongo.errors import BulkWriteError, PyMongoError
 from starlette_context import context
 from starlette_context.errors import ContextDoesNotExistError
 
-from pm.config import CONFIG
+from pm.config import CONFIG, AuditWriteModeT
 from pm.utils.dateutils import utcnow
 
 __all__ = (
+    'AuditActionT',
     'AuditAuthorField',
     'AuditRecord',
+    'AuditWriter',
+    'audit_update',
     'audited_model',
+    'flush_audit',
+    'queue_audit_records',
+    'start_audit_writer',
+    'stop_audit_writer',
+    'write_audit_records',
 )
 
+logger = logging.getLogger(__name__)
+
 _DB_AUDIT = True
+# queued records above this many batches make writers wait for a flush
+MAX_PENDING_BATCHES = 10
+_DUPLICATE_KEY_ERROR = 11000
 
 
 class AuditActionT(StrEnum):
@@ -67,7 +88,8 @@ class AuditRecord(Document):
         ]
 
     collection: str = Indexed(str)
-    object_id: PydanticObjectId = Indexed(PydanticObjectId)
+    # comments are identified by an uuid
+    object_id: Annotated[PydanticObjectId | UUID, Indexed()]
     action: str
     next_revision: UUID | None
     revision: UUID | None
@@ -84,7 +106,7 @@ class AuditRecord(Document):
     def create_record(
         cls,
         collection: str,
-        object_id: PydanticObjectId,
+        object_id: PydanticObjectId | UUID,
         next_revision: UUID | None,
         revision: UUID | None,
         action: AuditActionT,
@@ -112,20 +134,16 @@ class AuditRecord(Document):
         obj.__data = data  # pylint: disable=unused-private-member
         return obj
 
+    def encode_data(self) -> bytes:
+        return bson.encode({**self.model_dump(mode='json'), 'data': self.__data})
+
     async def _save_data(self, path: str) -> None:
         await aio_os.makedirs(Path(path).parent, exist_ok=True)
         async with aiofiles.open(path, 'wb') as f:
-            await f.write(
-                bson.encode(
-                    {
-                        **self.model_dump(mode='json'),
-                        'data': self.__data,
-                    },
-                ),
-            )
+            await f.write(self.encode_data())
 
     async def save_data(self) -> None:
-        await self._save_data(self._data_path)
+        await self._save_data(self.data_path)
 
     async def _load_data(self, path: str) -> None:
         async with aiofiles.open(path, 'rb') as f:
@@ -135,10 +153,10 @@ class AuditRecord(Document):
         self.__data = data
 
     async def load_data(self) -> None:
-        await self._load_data(self._data_path)
+        await self._load_data(self.data_path)
 
     @property
-    def _data_path(self) -> str:
+    def data_path(self) -> str:
         return str(
             Path(CONFIG.AUDIT_STORAGE_DIR)
             / self.collection
@@ -147,6 +165,182 @@ class AuditRecord(Document):
         )
 
 
+def _write_data_files(files: Sequence[tuple[str, bytes]], fsync: bool) -> None:
+    dirs: set[Path] = set()
+    for path, content in files:
+        parent = Path(path).parent
+        if parent not in dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            dirs.add(parent)
+        with open(path, 'wb') as f:  # noqa: PTH123
+            f.write(content)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    if not fsync:
+        return
+    # new file names are durable once their directory is synced
+    for parent in dirs:
+        fd = os.open(parent, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+async def write_audit_records(
+    records: Sequence[AuditRecord],
+    fsync: bool = False,
+) -> None:
+    """Write data files of audit records in a thread, then insert the records.
+
+    Records get their id before the insert, so a batch retried after a
+    partial failure skips the records already stored.
+    """
+    if not records:
+        return
+    for record in records:
+        if record.id is None:
+            record.id = PydanticObjectId()
+    await asyncio.to_thread(
+        _write_data_files,
+        [(record.data_path, record.encode_data()) for record in records],
+        fsync,
+    )
+    collection = AuditRecord.get_motor_collection()
+    if fsync:
+        collection = collection.with_options(write_concern=WriteConcern(j=True))
+    try:
+        await collection.insert_many(
+            [get_dict(record, to_db=True) for record in records],
+            ordered=False,
+        )
+    except BulkWriteError as err:
+        if err.details.get('writeConcernErrors') or any(
+            e['code'] != _DUPLICATE_KEY_ERROR for e in err.details['writeErrors']
+        ):
+            raise
+
+
+class AuditWriter:
+    """Per worker queue of audit records, written in batches by a background task.
+
+    Until started, records are written as soon as they are queued. Records
+    wait at most ``flush_interval`` seconds, a full batch is flushed right
+    away and writers wait for a flush when the writer falls behind.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float,
+        batch_size: int,
+        fsync: bool = False,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.fsync = fsync
+        self.pending: list[AuditRecord] = []
+        self._wakeup = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None
+
+    async def submit(self, records: Sequence[AuditRecord]) -> None:
+        if not self.is_running:
+            await write_audit_records(records, self.fsync)
+            return
+        self.pending.extend(records)
+        if len(self.pending) >= self.batch_size:
+            self._wakeup.set()
+        if len(self.pending) >= self.batch_size * MAX_PENDING_BATCHES:
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write queued records, returns the number of records written."""
+        written = 0
+        async with self._lock:
+            while self.pending:
+                batch = self.pending[: self.batch_size]
+                self.pending = self.pending[self.batch_size :]
+                try:
+                    await write_audit_records(batch, self.fsync)
+                except (PyMongoError, OSError) as err:
+                    logger.warning(
+                        'Failed to write audit records',
+                        exc_info=err,
+                        extra={'pending': len(self.pending) + len(batch)},
+                    )
+                    self.pending[:0] = batch
+                    break
+                except BaseException:
+                    # cancelled or failed unexpectedly, the batch is retried
+                    self.pending[:0] = batch
+                    raise
+                written += len(batch)
+        return written
+
+    async def _run(self) -> int:
+        written = 0
+        while not self._stopping:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            self._wakeup.clear()
+            try:
+                written = await self.flush()
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception('Audit writer flush failed')
+        return written
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> int:
+        """Stop the background task and drain the queue.
+
+        The task is not cancelled, a batch being written when stopping is
+        written to the end. Returns the number of records written meanwhile.
+        """
+        written = 0
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            written = await self._task
+            self._task = None
+        return written + await self.flush()
+
+
+_WRITER = AuditWriter(
+    flush_interval=CONFIG.AUDIT_FLUSH_INTERVAL,
+    batch_size=CONFIG.AUDIT_BATCH_SIZE,
+    fsync=CONFIG.AUDIT_WRITE_MODE == AuditWriteModeT.ASYNC_FSYNC,
+)
+
+
+async def queue_audit_records(records: Sequence[AuditRecord]) -> None:
+    """Write audit records with the worker writer, in the background once started."""
+    await _WRITER.submit(records)
+
+
+def start_audit_writer() -> None:
+    """Write audit records in the background, unless ``AUDIT_WRITE_MODE`` is sync."""
+    if CONFIG.AUDIT_WRITE_MODE != AuditWriteModeT.SYNC:
+        _WRITER.start()
+
+
+async def flush_audit() -> int:
+    return await _WRITER.flush()
+
+
+async def stop_audit_writer() -> int:
+    return await _WRITER.stop()
+
+
 @after_event(Insert)
 async def _after_insert_callback(self: Document) -> None:
     obj = AuditRecord.create_record(
@@ -157,8 +351,7 @@ async def _after_insert_callback(self: Document) -> None:
         action=AuditActionT.INSERT,
         data={},
     )
-    await AuditRecord.insert_one(obj)
-    await obj.save_data()
+    await _WRITER.submit([obj])
 
 
 @before_event(Delete)
@@ -171,8 +364,7 @@ async def _before_delete_callback(self: Document) -> None:
         action=AuditActionT.DELETE,
         data=self.get_saved_state(),
     )
-    await AuditRecord.insert_one(obj)
-    await obj.save_data()
+    await _WRITER.submit([obj])
 
 
 @before_event(SaveChanges)
@@ -181,19 +373,28 @@ async def _before_update_callback(self: Document) -> None:
     self.__prev_revision_id = self.revision_id
 
 
-@after_event(SaveChanges)
-async def _after_update_callback(self: Document) -> None:
-    # pylint: disable=protected-access
+async def _audit_update(doc: Document, revision: UUID | None) -> None:
     obj = AuditRecord.create_record(
-        collection=self.__class__.Settings.name,
-        object_id=self.id,
-        next_revision=self.revision_id,
-        revision=self.__prev_revision_id,
+        collection=doc.__class__.Settings.name,
+        object_id=doc.id,
+        next_revision=doc.revision_id,
+        revision=revision,
         action=AuditActionT.UPDATE,
-        data=self.get_previous_saved_state(),
+        data=doc.get_previous_saved_state(),
     )
-    await AuditRecord.insert_one(obj)
-    await obj.save_data()
+    await _WRITER.submit([obj])
+
+
+async def audit_update(doc: Document, revision: UUID | None) -> None:
+    """Record an update of an audited document written without document events."""
+    if _DB_AUDIT:
+        await _audit_update(doc, revision)
+
+
+@after_event(SaveChanges)
+async def _after_update_callback(self: Document) -> None:
+    # pylint: disable=protected-access
+    await _audit_update(self, self.__prev_revision_id)
 
 
 @before_event(Replace)
@@ -205,16 +406,7 @@ async def _before_replace_callback(self: Document) -> None:
 @after_event(Replace)
 async def _after_replace_callback(self: Document) -> None:
     # pylint: disable=protected-access
-    obj = AuditRecord.create_record(
-        collection=self.__class__.Settings.name,
-        object_id=self.id,
-        next_revision=self.revision_id,
-        revision=self.__prev_revision_id,
-        action=AuditActionT.UPDATE,
-        data=self.get_previous_saved_state(),
-    )
-    await AuditRecord.insert_one(obj)
-    await obj.save_data()
+    await _audit_update(self, self.__prev_revision_id)
 
 
 AuditedTypeVar = TypeVar('AuditedTypeVar', bound=Document)
@@ -4,9 +4,20 @@ from typing import TYPE_CHECKING, Any, ClassVar, Self
 
 import beanie.operators as bo
 import pymongo
-from beanie import BackLink, Document, PydanticObjectId
+from beanie import (
+    BackLink,
+    Delete,
+    Document,
+    Insert,
+    PydanticObjectId,
+    Replace,
+    SaveChanges,
+    after_event,
+)
 from pydantic import BaseModel, Field
+from pymongo.results import UpdateResult
 
+from pm.cache import CacheTag, invalidate_cache_tags
 from pm.models._audit import audited_model
 
 if TYPE_CHECKING:
@@ -130,6 +141,16 @@ class CustomField(Document):
             raise CustomFieldCanBeNoneError(field=self)
         return value
 
+    @after_event(Insert, Replace, SaveChanges, Delete)
+    async def _invalidate_catalog(self) -> None:
+        await invalidate_cache_tags(CacheTag.CUSTOM_FIELDS)
+
+    @staticmethod
+    async def invalidate_catalog_if_modified(*results: UpdateResult | None) -> None:
+        """Invalidate the catalog after bulk updates, which bypass document events."""
+        if any(result and result.modified_count for result in results):
+            await invalidate_cache_tags(CacheTag.CUSTOM_FIELDS)
+
     def __hash__(self) -> int:
         return hash(self.id)
 
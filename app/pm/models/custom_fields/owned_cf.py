@@ -61,17 +61,18 @@ class OwnedCustomField(CustomField):
 
     @classmethod
     async def update_user_embedded_links(cls, user: User) -> None:
-        await cls.find(
+        options = await cls.find(
             cls.options.owner.id == user.id,
         ).update(
             {'$set': {'options.$[o].owner': UserLinkField.from_obj(user)}},
             array_filters=[{'o.owner.id': user.id}],
         )
-        await cls.find(
+        default = await cls.find(
             {'default_value.owner.id': user.id},
         ).update(
             {'$set': {'default_value.owner': UserLinkField.from_obj(user)}},
         )
+        await cls.invalidate_catalog_if_modified(options, default)
 
     async def validate_value(self, value: Any) -> Any:
         value = await super().validate_value(value)
@@ -116,18 +117,19 @@ class OwnedMultiCustomField(CustomField):
 
     @classmethod
     async def update_user_embedded_links(cls, user: User) -> None:
-        await cls.find(
+        options = await cls.find(
             cls.options.owner.id == user.id,
         ).update(
             {'$set': {'options.$[o].owner': UserLinkField.from_obj(user)}},
             array_filters=[{'o.owner.id': user.id}],
         )
-        await cls.find(
+        default = await cls.find(
             {'default_value.owner.id': user.id},
         ).update(
             {'$set': {'default_value.$[d].owner': UserLinkField.from_obj(user)}},
             array_filters=[{'d.owner.id': user.id}],
         )
+        await cls.invalidate_catalog_if_modified(options, default)
 
     @staticmethod
     def __transform_single_value(value: Any) -> Any:
@@ -70,25 +70,26 @@ class UserCustomFieldMixin:
         cls,
         user: User,
     ) -> None:
-        await cls.find(
+        options = await cls.find(
             cls.options.type == UserOptionType.USER,
             cls.options.value.id == user.id,
         ).update(
             {'$set': {'options.$[o].value': UserLinkField.from_obj(user)}},
             array_filters=[{'o.value.id': user.id}],
         )
-        await cls.find(
+        default = await cls.find(
             {'default_value.id': user.id},
         ).update(
             {'$set': {'default_value': UserLinkField.from_obj(user)}},
         )
+        await cls.invalidate_catalog_if_modified(options, default)
 
     @classmethod
     async def update_group_embedded_links(
         cls,
         group: 'Group',
     ) -> None:
-        await cls.find(
+        result = await cls.find(
             cls.options.type == UserOptionType.GROUP,
             cls.options.value.group.id == group.id,
         ).update(
@@ -97,13 +98,14 @@ class UserCustomFieldMixin:
                 {'o.value.group.id': group.id, 'o.type': UserOptionType.GROUP},
             ],
         )
+        await cls.invalidate_catalog_if_modified(result)
 
     @classmethod
     async def remove_group_embedded_links(
         cls,
         group_id: PydanticObjectId,
     ) -> None:
-        await cls.find(
+        result = await cls.find(
             cls.options.type == UserOptionType.GROUP,
             cls.options.value.group.id == group_id,
         ).update(
@@ -116,6 +118,7 @@ class UserCustomFieldMixin:
                 },
             },
         )
+        await cls.invalidate_catalog_if_modified(result)
 
 
 class UserCustomField(CustomField, UserCustomFieldMixin):
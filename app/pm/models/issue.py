@@ -1,18 +1,33 @@
 import re
 from datetime import datetime
 from enum import StrEnum
-from typing import Annotated, ClassVar, Literal, Self
+from typing import Annotated, Any, ClassVar, Literal, Self
 from uuid import UUID, uuid4
 
 import beanie.operators as bo
 import pymongo
-from beanie import Document, PydanticObjectId
+from beanie import (
+    Delete,
+    Document,
+    Insert,
+    PydanticObjectId,
+    Replace,
+    Save,
+    SaveChanges,
+    after_event,
+    before_event,
+)
+from beanie.exceptions import RevisionIdWasChanged
+from beanie.odm.queries.find import FindMany
+from beanie.odm.utils.dump import get_dict
+from beanie.odm.utils.encoder import Encoder
 from pydantic import BaseModel, Extra, Field
 
 from pm.permissions import ProjectPermissions
 from pm.utils.dateutils import utcnow
+from pm.utils.document import diff_update
 
-from ._audit import audited_model
+from ._audit import audit_update, audited_model
 from ._encryption import EncryptionMeta
 from .custom_fields import (
     CustomField,
@@ -33,19 +48,24 @@ from .user import User, UserLinkField
 
 __all__ = (
     'Issue',
+    'IssueActivity',
+    'IssueActivityT',
     'IssueAttachment',
     'IssueAttachmentSchema',
     'IssueBaseSchema',
     'IssueComment',
+    'IssueCommentEntry',
     'IssueCommentSchema',
     'IssueDraft',
     'IssueFieldChange',
+    'IssueHistoryEntry',
     'IssueHistoryRecord',
     'IssueHistorySchema',
     'IssueInterlink',
     'IssueInterlinkTypeT',
     'IssueLinkField',
     'IssueRO',
+    'sort_key_value_path',
 )
 
 
@@ -242,14 +262,128 @@ class IssueBaseSchema(BaseModel):
         return results
 
 
+SORT_KEY_VALUE_PATHS: dict[CustomFieldTypeT, str] = {
+    CustomFieldTypeT.USER: 'value.email',
+    CustomFieldTypeT.USER_MULTI: 'value.email',
+    CustomFieldTypeT.ENUM: 'value.value',
+    CustomFieldTypeT.ENUM_MULTI: 'value.value',
+    CustomFieldTypeT.STATE: 'value.value',
+    CustomFieldTypeT.VERSION: 'value.value',
+    CustomFieldTypeT.VERSION_MULTI: 'value.value',
+}
+UNSORTABLE_FIELD_NAME = re.compile(r'[.$]')
+
+_MULTI_OPTION_FIELD_TYPES = (
+    CustomFieldTypeT.ENUM_MULTI,
+    CustomFieldTypeT.VERSION_MULTI,
+    CustomFieldTypeT.OWNED_MULTI,
+    CustomFieldTypeT.SPRINT_MULTI,
+)
+
+
+def sort_key_value_path(field_type: CustomFieldTypeT) -> str:
+    """Path of the value a custom field of the given type is sorted by."""
+    return SORT_KEY_VALUE_PATHS.get(field_type, 'value')
+
+
+def _get_sort_value(value: Any, path: list[str]) -> Any:
+    if not path:
+        return value
+    if isinstance(value, list):
+        return [
+            item_value
+            for item in value
+            if (item_value := _get_sort_value(item, path)) is not None
+        ]
+    if not isinstance(value, dict):
+        return None
+    return _get_sort_value(value.get(path[0]), path[1:])
+
+
+def _id_sort_keys(aliases: list[str]) -> dict[str, Any]:
+    if not aliases:
+        return {'slug': None, 'num': None}
+    parts = aliases[-1].split('-')
+    try:
+        num = int(parts[-1])
+    except ValueError:
+        num = None
+    return {'slug': parts[0], 'num': num}
+
+
+def _fields_sort_keys_expr() -> dict:
+    types_by_path: dict[str, list[str]] = {}
+    for field_type, path in SORT_KEY_VALUE_PATHS.items():
+        types_by_path.setdefault(path, []).append(str(field_type))
+    value = {
+        '$switch': {
+            'branches': [
+                {'case': {'$in': ['$$f.type', types]}, 'then': f'$$f.{path}'}
+                for path, types in types_by_path.items()
+            ],
+            'default': '$$f.value',
+        },
+    }
+    return {
+        '$arrayToObject': {
+            '$map': {
+                'input': {
+                    '$filter': {
+                        'input': {'$ifNull': ['$fields', []]},
+                        'as': 'f',
+                        'cond': {
+                            '$not': [
+                                {
+                                    '$regexMatch': {
+                                        'input': '$$f.name',
+                                        'regex': UNSORTABLE_FIELD_NAME.pattern,
+                                    },
+                                },
+                            ],
+                        },
+                    },
+                },
+                'as': 'f',
+                'in': {'k': {'$toLower': '$$f.name'}, 'v': {'$ifNull': [value, None]}},
+            },
+        },
+    }
+
+
+# server-side equivalent of Issue.update_sort_keys for bulk updates
+SORT_KEYS_EXPR = {
+    'id': {
+        '$let': {
+            'vars': {'parts': {'$split': [{'$arrayElemAt': ['$aliases', -1]}, '-']}},
+            'in': {
+                'slug': {'$arrayElemAt': ['$$parts', 0]},
+                'num': {
+                    '$convert': {
+                        'input': {'$arrayElemAt': ['$$parts', -1]},
+                        'to': 'int',
+                        'onError': None,
+                        'onNull': None,
+                    },
+                },
+            },
+        },
+    },
+    'fields': _fields_sort_keys_expr(),
+}
+
+
 @audited_model
 class Issue(
     Document,
     IssueBaseSchema,
-    IssueHistorySchema,
     IssueAttachmentSchema,
-    IssueCommentSchema,
 ):
+    """Issue, its comments and history are kept in their own collections.
+
+    The issue only keeps counters and the time of the last comment and
+    history record, so its size does not grow with its age.
+    """
+
     class Settings:
         name = 'issues'
         use_revision = True
@@ -262,6 +396,8 @@ class Issue(
                     ('text', pymongo.TEXT),
                     ('aliases', pymongo.TEXT),
                     ('attachments.ocr_text', pymongo.TEXT),
+                    # comments moved to issue_comments, the key is kept so
+                    # existing installs do not have to rebuild the index
                     ('comments.text', pymongo.TEXT),
                 ],
                 name='text_index',
@@ -278,6 +414,10 @@ class Issue(
                 [('project.id', 1), ('updated_at', -1)],
                 name='project_updated_at_index',
             ),
+            pymongo.IndexModel(
+                [('updated_at', -1), ('_id', -1)],
+                name='updated_at_id_index',
+            ),
             pymongo.IndexModel(
                 [('project.id', 1), ('resolved_at', 1)],
                 name='project_resolved_at_index',
@@ -319,11 +459,56 @@ class Issue(
                 [('disable_project_permissions_inheritance', 1)],
                 name='inheritance_flag_index',
             ),
+            pymongo.IndexModel(
+                [('sort_keys.id.slug', 1), ('sort_keys.id.num', 1), ('_id', 1)],
+                name='sort_keys_id_index',
+            ),
         ]
 
     class Config:
         extra = Extra.allow
 
+    sort_keys: Annotated[dict[str, Any], Field(default_factory=dict)]
+
+    comments_count: int = 0
+    last_comment_at: datetime | None = None
+    history_count: int = 0
+    last_history_at: datetime | None = None
+
+    @before_event(Insert, Replace, Save, SaveChanges)
+    def update_sort_keys(self) -> None:
+        """Materialize values the issue list is sorted by, so sorts can use indexes."""
+        encoder = Encoder()
+        fields_keys = {}
+        for field in self.fields:
+            if UNSORTABLE_FIELD_NAME.search(field.name):
+                continue
+            fields_keys[field.name.lower()] = _get_sort_value(
+                encoder.encode(field),
+                sort_key_value_path(field.type).split('.'),
+            )
+        self.sort_keys = {'id': _id_sort_keys(self.aliases), 'fields': fields_keys}
+
+    @classmethod
+    async def refresh_sort_keys(cls, flt: dict) -> None:
+        """Recompute sort keys of issues changed by a bulk update."""
+        await cls.get_motor_collection().update_many(
+            flt,
+            [{'$set': {'sort_keys': SORT_KEYS_EXPR}}],
+        )
+
+    @classmethod
+    async def ensure_sort_key_indexes(cls, field_names: list[str]) -> None:
+        """Index sort keys of custom fields commonly used to sort issue lists."""
+        collection = cls.get_motor_collection()
+        for name in {name.lower() for name in field_names}:
+            if UNSORTABLE_FIELD_NAME.search(name):
+                continue
+            await collection.create_index(
+                [(f'sort_keys.fields.{name}', 1), ('_id', 1)],
+                name=f'sort_keys_field_{name.replace(" ", "_")}_index',
+            )
+
     def _fields_diff(
         self,
     ) -> dict[PydanticObjectId, tuple[CustomFieldValueT, CustomFieldValueT]]:
@@ -350,13 +535,22 @@ class Issue(
                 diff[param] = (old_params[param], new_params[param])
         return diff
 
-    def gen_history_record(self, author: 'User', time: datetime | None = None) -> None:
+    def gen_history_record(
+        self,
+        author: 'User',
+        time: datetime | None = None,
+    ) -> IssueHistoryRecord | None:
+        """Record changes of subject, text and fields since the issue was loaded.
+
+        Counters of the issue are updated, the record itself is stored with
+        ``IssueHistoryEntry.append`` once the issue is written.
+        """
         time = time or utcnow()
         fields = {field.id: field for field in self.fields}
         fields_diff = self._fields_diff()
         params_diff = self._params_diff()
         if not fields_diff and not params_diff:
-            return
+            return None
         changes = [
             IssueFieldChange(
                 field=CustomFieldLink.from_obj(fields[field_id]),
@@ -377,7 +571,74 @@ class Issue(
             time=time,
             changes=changes,
         )
-        self.history.append(record)
+        self.history_count += 1
+        self.last_history_at = time
+        return record
+
+    def changes_update(self) -> dict[str, dict]:
+        """Targeted update of the fields changed since the issue was loaded."""
+        return diff_update(
+            self.get_saved_state(),
+            get_dict(self, to_db=True, exclude={'revision_id'}),
+        )
+
+    async def write_changes(self) -> bool:
+        """Write changed fields only, unlike ``replace`` sending the whole issue.
+
+        Values are ``$set`` at their path and items appended to arrays are
+        ``$push``-ed, guarded by the revision the issue was loaded with.
+        Raises ``RevisionIdWasChanged`` when the issue was modified meanwhile.
+        Returns whether there was anything to write.
+        """
+        if not self.is_changed:
+            return False
+        # document events are not triggered by a raw update
+        self.update_sort_keys()
+        update = self.changes_update()
+        prev_revision = self.revision_id
+        encoder = Encoder()
+        self.revision_id = uuid4()
+        update.setdefault('$set', {})['revision_id'] = encoder.encode(self.revision_id)
+        result = await self.get_motor_collection().update_one(
+            {'_id': self.id, 'revision_id': encoder.encode(prev_revision)},
+            update,
+        )
+        if not result.matched_count:
+            self.revision_id = prev_revision
+            raise RevisionIdWasChanged
+        self._save_state()
+        await audit_update(self, prev_revision)
+        return True
+
+    def comment_added(self, comment: IssueComment) -> None:
+        self.comments_count += 1
+        self.last_comment_at = comment.created_at
+
+    def comment_deleted(self) -> None:
+        self.comments_count = max(self.comments_count - 1, 0)
+
+    @after_event(Insert)
+    async def log_created(self) -> None:
+        await IssueActivity.log(IssueActivity.issue_created(self))
+
+    @after_event(Delete)
+    async def delete_comments_and_history(self) -> None:
+        await IssueCommentEntry.delete_for_issues([self.id])
+        await IssueHistoryEntry.delete_for_issues([self.id])
+        await IssueActivity.delete_for_issues([self.id])
+
+    @classmethod
+    async def delete_project_issues(cls, project_id: PydanticObjectId) -> None:
+        ids = [
+            doc['_id']
+            async for doc in cls.get_motor_collection().find(
+                {'project.id': project_id}, {'_id': 1}
+            )
+        ]
+        await IssueCommentEntry.delete_for_issues(ids)
+        await IssueHistoryEntry.delete_for_issues(ids)
+        await IssueActivity.delete_for_issues(ids)
+        await cls.find(cls.project.id == project_id).delete()
 
     @classmethod
     async def find_one_by_id_or_alias(cls, id_or_alias: PydanticObjectId | str) -> Self:
@@ -412,9 +673,8 @@ class Issue(
     ) -> None:
         if isinstance(user, User):
             user = UserLinkField.from_obj(user)
-        await cls.find(cls.comments.author.id == user.id).update(
-            {'$set': {'comments.$[c].author': user}},
-            array_filters=[{'c.author.id': user.id}],
+        await IssueCommentEntry.find(IssueCommentEntry.author.id == user.id).update(
+            {'$set': {'author': user}},
         )
         await cls.find(cls.attachments.author.id == user.id).update(
             {'$set': {'attachments.$[a].author': user}},
@@ -426,9 +686,11 @@ class Issue(
         await cls.find(cls.updated_by.id == user.id).update(
             {'$set': {'updated_by': user}},
         )
-        await cls.find(cls.history.author.id == user.id).update(
-            {'$set': {'history.$[h].author': user}},
-            array_filters=[{'h.author.id': user.id}],
+        await IssueHistoryEntry.find(IssueHistoryEntry.author.id == user.id).update(
+            {'$set': {'author': user}},
+        )
+        await IssueActivity.find(IssueActivity.author.id == user.id).update(
+            {'$set': {'author': user}},
         )
         await cls.find(
             {
@@ -461,6 +723,21 @@ class Issue(
                 {'v.owner.id': user.id},
             ],
         )
+        await cls.refresh_sort_keys(
+            {
+                'fields': {
+                    '$elemMatch': {
+                        'type': {
+                            '$in': [
+                                CustomFieldTypeT.OWNED,
+                                CustomFieldTypeT.OWNED_MULTI,
+                            ],
+                        },
+                        'value.owner.id': user.id,
+                    },
+                },
+            },
+        )
 
         await cls.find(
             {
@@ -491,12 +768,14 @@ class Issue(
             {'$set': {'fields.$[f].name': field.name}},
             array_filters=[{'f.id': field.id}],
         )
-        await cls.find(
-            cls.history.changes.field.id == field.id,
-        ).update(
-            {'$set': {'history.$[].changes.$[c].field': field}},
-            array_filters=[{'c.field.id': field.id}],
-        )
+        await cls.refresh_sort_keys({'fields.id': field.id})
+        for model in (IssueHistoryEntry, IssueActivity):
+            await model.find(
+                model.changes.field.id == field.id,
+            ).update(
+                {'$set': {'changes.$[c].field': field}},
+                array_filters=[{'c.field.id': field.id}],
+            )
 
     @classmethod
     async def remove_field_embedded_links(
@@ -507,7 +786,24 @@ class Issue(
         q = cls.find({'fields': {'$elemMatch': {'id': field_id}}})
         if flt:
             q = q.find(flt)
-        await q.update({'$pull': {'fields': {'id': field_id}}})
+        # a pipeline update, so sort keys are recomputed without the field
+        await cls.get_motor_collection().update_many(
+            q.get_filter_query(),
+            [
+                {
+                    '$set': {
+                        'fields': {
+                            '$filter': {
+                                'input': '$fields',
+                                'as': 'f',
+                                'cond': {'$ne': ['$$f.id', field_id]},
+                            },
+                        },
+                    },
+                },
+                {'$set': {'sort_keys': SORT_KEYS_EXPR}},
+            ],
+        )
 
     @classmethod
     async def update_field_option_embedded_links(
@@ -515,25 +811,51 @@ class Issue(
         field: CustomField | CustomFieldLink,
         option: VersionOption | StateOption | EnumOption | OwnedOption,
     ) -> None:
-        if field.type in (
-            CustomFieldTypeT.ENUM_MULTI,
-            CustomFieldTypeT.VERSION_MULTI,
-            CustomFieldTypeT.OWNED_MULTI,
-            CustomFieldTypeT.SPRINT_MULTI,
-        ):
+        if field.type in _MULTI_OPTION_FIELD_TYPES:
             await cls.find(
                 {'fields': {'$elemMatch': {'id': field.id, 'value.id': option.id}}},
             ).update(
                 {'$set': {'fields.$[f].value.$[val]': option}},
                 array_filters=[{'f.id': field.id}, {'val.id': option.id}],
             )
-            return
-        await cls.find(
+        else:
+            await cls.find(
+                {'fields': {'$elemMatch': {'id': field.id, 'value.id': option.id}}},
+            ).update(
+                {'$set': {'fields.$[f].value': option}},
+                array_filters=[{'f.id': field.id, 'f.value.id': option.id}],
+            )
+        await cls.refresh_sort_keys(
             {'fields': {'$elemMatch': {'id': field.id, 'value.id': option.id}}},
-        ).update(
-            {'$set': {'fields.$[f].value': option}},
-            array_filters=[{'f.id': field.id, 'f.value.id': option.id}],
         )
+        # old and new values of recorded changes
+        multi = '.$[v]' if field.type in _MULTI_OPTION_FIELD_TYPES else ''
+        for model in (IssueHistoryEntry, IssueActivity):
+            await model.find(
+                {
+                    'changes': {
+                        '$elemMatch': {
+                            'field.id': field.id,
+                            '$or': [
+                                {'old_value.id': option.id},
+                                {'new_value.id': option.id},
+                            ],
+                        },
+                    },
+                },
+            ).update(
+                {
+                    '$set': {
+                        f'changes.$[o].old_value{multi}': option,
+                        f'changes.$[n].new_value{multi}': option,
+                    },
+                },
+                array_filters=[
+                    {'o.field.id': field.id, 'o.old_value.id': option.id},
+                    {'n.field.id': field.id, 'n.new_value.id': option.id},
+                    *([{'v.id': option.id}] if multi else []),
+                ],
+            )
 
     @classmethod
     async def update_issue_embedded_links(
@@ -629,8 +951,10 @@ class Issue(
         project_id: PydanticObjectId,
         old_slug: str,
         new_slug: str,
-    ) -> None:
+    ) -> list[Self]:
+        """Add aliases with the new slug to issues of the project, returns them."""
         slug_pattern = re.compile(rf'^{old_slug}-\d+$')
+        updated = []
         async for issue in cls.find(
             cls.project.id == project_id,
             bo.RegEx(cls.aliases, rf'^{old_slug}-\d+$'),
@@ -643,24 +967,9 @@ class Issue(
                 continue
             current_number = current_alias.split('-')[-1]
             issue.aliases.append(f'{new_slug}-{current_number}')
-            await issue.save()
-
-    def _get_latest_comment_or_history(
-        self,
-    ) -> tuple[IssueComment | IssueHistoryRecord, datetime | None]:
-        latest_comment = max(self.comments, key=lambda c: c.created_at, default=None)
-        latest_history = max(self.history, key=lambda h: h.time, default=None)
-
-        if not latest_comment:
-            return latest_history, latest_history.time if latest_history else None
-        if not latest_history:
-            return latest_comment, latest_comment.created_at if latest_comment else None
-
-        return (
-            (latest_comment, latest_comment.created_at)
-            if latest_comment.created_at > latest_history.time
-            else (latest_history, latest_history.time)
-        )
+            await issue.write_changes()
+            updated.append(issue)
+        return updated
 
     def update_state(self, now: datetime | None = None) -> None:
         now = now or utcnow()
@@ -684,6 +993,218 @@ class Issue(
             self.closed_at = now
 
 
+@audited_model
+class IssueCommentEntry(Document, IssueComment):
+    """Comment of an issue."""
+
+    class Settings:
+        name = 'issue_comments'
+        use_revision = True
+        use_state_management = True
+        state_management_save_previous = True
+        indexes: ClassVar = [
+            pymongo.IndexModel(
+                [('issue_id', 1), ('created_at', 1)],
+                name='issue_id_created_at_index',
+            ),
+            pymongo.IndexModel(
+                [('author.id', 1), ('created_at', -1)],
+                name='author_created_at_index',
+            ),
+            pymongo.IndexModel([('created_at', -1)], name='created_at_index'),
+            pymongo.IndexModel([('text', pymongo.TEXT)], name='text_index'),
+        ]
+
+    id: Annotated[UUID, Field(default_factory=uuid4)]
+    issue_id: PydanticObjectId
+
+    @classmethod
+    def of_issue(cls, issue_id: PydanticObjectId) -> FindMany[Self]:
+        return cls.find(cls.issue_id == issue_id)
+
+    @classmethod
+    async def get_for_issue(
+        cls,
+        issue_id: PydanticObjectId,
+        comment_id: UUID,
+    ) -> Self | None:
+        return await cls.find_one(cls.id == comment_id, cls.issue_id == issue_id)
+
+    @classmethod
+    async def delete_for_issues(cls, issue_ids: list[PydanticObjectId]) -> None:
+        if issue_ids:
+            await cls.find(bo.In(cls.issue_id, issue_ids)).delete()
+
+
+class IssueHistoryEntry(Document, IssueHistoryRecord):
+    """History record of an issue.
+
+    Records are only appended and hidden or restored, so they are not audited.
+    """
+
+    class Settings:
+        name = 'issue_history'
+        use_revision = False
+        use_state_management = True
+        indexes: ClassVar = [
+            pymongo.IndexModel(
+                [('issue_id', 1), ('time', 1)],
+                name='issue_id_time_index',
+            ),
+            pymongo.IndexModel(
+                [('author.id', 1), ('time', -1)],
+                name='author_time_index',
+            ),
+            pymongo.IndexModel([('time', -1)], name='time_index'),
+            pymongo.IndexModel(
+                [('changes.field.id', 1)],
+                name='changes_field_id_index',
+            ),
+        ]
+
+    id: Annotated[UUID, Field(default_factory=uuid4)]
+    issue_id: PydanticObjectId
+
+    @classmethod
+    def of_issue(cls, issue_id: PydanticObjectId) -> FindMany[Self]:
+        return cls.find(cls.issue_id == issue_id)
+
+    @classmethod
+    async def get_for_issue(
+        cls,
+        issue_id: PydanticObjectId,
+        record_id: UUID,
+    ) -> Self | None:
+        return await cls.find_one(cls.id == record_id, cls.issue_id == issue_id)
+
+    @classmethod
+    def from_record(
+        cls, issue_id: PydanticObjectId, record: IssueHistoryRecord
+    ) -> Self:
+        return cls(
+            issue_id=issue_id,
+            **{name: getattr(record, name) for name in IssueHistoryRecord.model_fields},
+        )
+
+    @classmethod
+    async def append(
+        cls,
+        issue: Issue,
+        *records: IssueHistoryRecord | None,
+    ) -> None:
+        """Store records of ``Issue.gen_history_record``, skipping missing ones."""
+        records_ = [r for r in records if r is not None]
+        if not records_:
+            return
+        await cls.insert_many([cls.from_record(issue.id, r) for r in records_])
+        await IssueActivity.log(
+            *(IssueActivity.issue_updated(issue, r) for r in records_)
+        )
+
+    @classmethod
+    async def delete_for_issues(cls, issue_ids: list[PydanticObjectId]) -> None:
+        if issue_ids:
+            await cls.find(bo.In(cls.issue_id, issue_ids)).delete()
+
+
+class IssueActivityT(StrEnum):
+    ISSUE_CREATED = 'issue_created'
+    ISSUE_UPDATED = 'issue_updated'
+    ISSUE_COMMENTED = 'issue_commented'
+
+
+class IssueActivity(Document):
+    """Activity log entry, appended when an issue is created, changed or commented.
+
+    Entries carry the project of the issue for permission filtering. They
+    follow the issue to another project and are removed with the issue or
+    the comment.
+    """
+
+    class Settings:
+        name = 'activities'
+        use_revision = False
+        use_state_management = False
+        indexes: ClassVar = [
+            pymongo.IndexModel([('time', 1), ('_id', 1)], name='time_index'),
+            pymongo.IndexModel(
+                [('author.id', 1), ('time', 1), ('_id', 1)],
+                name='author_time_index',
+            ),
+            pymongo.IndexModel(
+                [('project_id', 1), ('time', 1), ('_id', 1)],
+                name='project_time_index',
+            ),
+            pymongo.IndexModel([('issue_id', 1)], name='issue_id_index'),
+            pymongo.IndexModel([('record_id', 1)], name='record_id_index'),
+        ]
+
+    time: datetime
+    author: UserLinkField
+    action: IssueActivityT
+    issue_id: PydanticObjectId
+    project_id: PydanticObjectId
+    record_id: UUID | None = None
+    changes: list[IssueFieldChange] | None = None
+
+    @classmethod
+    def issue_created(cls, issue: Issue) -> Self:
+        return cls(
+            time=issue.created_at,
+            author=issue.created_by,
+            action=IssueActivityT.ISSUE_CREATED,
+            issue_id=issue.id,
+            project_id=issue.project.id,
+        )
+
+    @classmethod
+    def issue_updated(cls, issue: Issue, record: IssueHistoryRecord) -> Self:
+        return cls(
+            time=record.time,
+            author=record.author,
+            action=IssueActivityT.ISSUE_UPDATED,
+            issue_id=issue.id,
+            project_id=issue.project.id,
+            record_id=record.id,
+            changes=record.changes,
+        )
+
+    @classmethod
+    def issue_commented(cls, issue: Issue, comment: IssueComment) -> Self:
+        return cls(
+            time=comment.created_at,
+            author=comment.author,
+            action=IssueActivityT.ISSUE_COMMENTED,
+            issue_id=issue.id,
+            project_id=issue.project.id,
+            record_id=comment.id,
+        )
+
+    @classmethod
+    async def log(cls, *activities: Self) -> None:
+        if activities:
+            await cls.insert_many(list(activities))
+
+    @classmethod
+    async def move_issues(
+        cls,
+        issue_ids: list[PydanticObjectId],
+        project_id: PydanticObjectId,
+    ) -> None:
+        await cls.find(bo.In(cls.issue_id, issue_ids)).update(
+            {'$set': {'project_id': project_id}},
+        )
+
+    @classmethod
+    async def delete_record(cls, record_id: UUID) -> None:
+        await cls.find(cls.record_id == record_id).delete()
+
+    @classmethod
+    async def delete_for_issues(cls, issue_ids: list[PydanticObjectId]) -> None:
+        if issue_ids:
+            await cls.find(bo.In(cls.issue_id, issue_ids)).delete()
+
+
 class IssueRO(IssueBaseSchema):
     id: Annotated[PydanticObjectId, Field(alias='_id')]
 
@@ -809,12 +1330,7 @@ class IssueDraft(Document):
         field: CustomField | CustomFieldLink,
         option: VersionOption | StateOption | EnumOption | OwnedOption,
     ) -> None:
-        if field.type in (
-            CustomFieldTypeT.ENUM_MULTI,
-            CustomFieldTypeT.VERSION_MULTI,
-            CustomFieldTypeT.OWNED_MULTI,
-            CustomFieldTypeT.SPRINT_MULTI,
-        ):
+        if field.type in _MULTI_OPTION_FIELD_TYPES:
             await cls.find(
                 {'fields': {'$elemMatch': {'id': field.id, 'value.id': option.id}}},
             ).update(
@@ -1,6 +1,6 @@
 from collections.abc import Mapping
 from enum import StrEnum
-from typing import Annotated, Any, ClassVar, Self
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Self
 from uuid import UUID, uuid4
 
 import beanie.operators as bo
@@ -19,6 +19,9 @@ from .role import ProjectRole, ProjectRoleLinkField
 from .user import User, UserLinkField
 from .workflow import Workflow
 
+if TYPE_CHECKING:
+    from beanie.odm.queries.find import FindMany
+
 __all__ = (
     'PermissionTargetType',
     'Project',
@@ -118,6 +121,35 @@ class Project(DocumentWithReadOnlyProjection):
         )
         return f'{self.slug}-{self.issue_counter}'
 
+    @classmethod
+    def find_by_permission_targets(
+        cls,
+        user_id: PydanticObjectId,
+        group_ids: set[PydanticObjectId] | None = None,
+    ) -> 'FindMany[Self]':
+        """Find projects granting a role to the user or any of the groups.
+
+        Served by ``permissions_target_index``, so only projects mentioning
+        the user or their groups are read instead of the whole collection.
+        """
+        targets = [
+            bo.ElemMatch(
+                cls.permissions,
+                {'target_type': PermissionTargetType.USER, 'target.id': user_id},
+            ),
+        ]
+        if group_ids:
+            targets.append(
+                bo.ElemMatch(
+                    cls.permissions,
+                    {
+                        'target_type': PermissionTargetType.GROUP,
+                        'target.id': {'$in': list(group_ids)},
+                    },
+                ),
+            )
+        return cls.find(bo.Or(*targets))
+
     def get_user_permissions(
         self,
         user: User,
@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import ClassVar
+
+import pymongo
+from beanie import Document
+
+__all__ = ('QueryFieldUsage',)
+
+
+class QueryFieldUsage(Document):
+    """How often issue searches filter on a custom field, sampled.
+
+    One record per field group, value path and operator, ``uses`` is the
+    number of sampled searches, not the number of searches.
+    """
+
+    class Settings:
+        name = 'query_field_usage'
+        indexes: ClassVar = [
+            pymongo.IndexModel(
+                [('gid', 1), ('path', 1), ('operator', 1)],
+                name='gid_path_operator_index',
+                unique=True,
+            ),
+            pymongo.IndexModel([('uses', -1)], name='uses_index'),
+        ]
+
+    gid: str
+    name: str
+    path: str
+    operator: str
+    uses: int = 0
+    last_seen_at: datetime
@@ -8,7 +8,7 @@ import beanie.operators as bo
 import pymongo
 from beanie import Document, Indexed
 
-from pm.workflows import get_on_change_script_from_string
+from pm.workflows import OnChangeWorkflowScript, get_on_change_script_from_string
 
 from ._audit import audited_model
 
@@ -62,8 +62,17 @@ class ScheduledWorkflow(Workflow):
 class OnChangeWorkflow(Workflow):
     type: WorkflowType = WorkflowType.ON_CHANGE
 
-    async def run(self, issue: 'Issue', user_ctx: 'UserContext') -> None:
-        script = get_on_change_script_from_string(self.script)
+    def get_script(self) -> OnChangeWorkflowScript | None:
+        return get_on_change_script_from_string(self.script, str(self.id))
+
+    async def run(
+        self,
+        issue: 'Issue',
+        user_ctx: 'UserContext',
+        script: OnChangeWorkflowScript | None = None,
+    ) -> None:
+        if script is None:
+            script = self.get_script()
         if script:
             sig = inspect.signature(script.run)
 
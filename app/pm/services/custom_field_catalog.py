@@ -0,0 +1,100 @@
+import asyncio
+import time
+from collections.abc import Iterable
+
+from beanie import PydanticObjectId
+
+import pm.models as m
+from pm.cache import CacheTag, get_local_cache
+from pm.utils.cache.local import MISSING
+
+__all__ = (
+    'CustomFieldCatalog',
+    'get_custom_field_catalog',
+)
+
+CATALOG_KEY = 'custom_fields:catalog'
+CATALOG_TTL = 600  # seconds
+# without invalidations, writes are seen by other workers after this delay
+FALLBACK_TTL = 5  # seconds
+
+_BUILD_LOCK = asyncio.Lock()
+_FALLBACK: tuple['CustomFieldCatalog', float] | None = None
+
+
+class CustomFieldCatalog:
+    """Snapshot of all custom fields indexed by id, group id and name.
+
+    The snapshot is shared by every request of the worker until a custom field
+    write invalidates ``CacheTag.CUSTOM_FIELDS``, so fields must not be modified.
+    """
+
+    def __init__(self, fields: Iterable[m.CustomField]) -> None:
+        self.fields = list(fields)
+        self.by_id: dict[PydanticObjectId, m.CustomField] = {}
+        self.by_gid: dict[str, list[m.CustomField]] = {}
+        self.by_name: dict[str, list[m.CustomField]] = {}
+        for field in self.fields:
+            self.by_id[field.id] = field
+            self.by_gid.setdefault(field.gid, []).append(field)
+            self.by_name.setdefault(field.name.lower(), []).append(field)
+        self.types: dict[str, m.CustomFieldTypeT] = {
+            name: fields_[0].type for name, fields_ in self.by_name.items()
+        }
+
+    def get(self, field_id: PydanticObjectId) -> m.CustomField | None:
+        return self.by_id.get(field_id)
+
+    def group(self, gid: str) -> list[m.CustomField]:
+        return self.by_gid.get(gid, [])
+
+    def group_field(self, gid: str) -> m.CustomField | None:
+        """First field of a group, representing the group name and type."""
+        fields = self.by_gid.get(gid)
+        return fields[0] if fields else None
+
+    def groups(self) -> dict[str, m.CustomField]:
+        return {gid: fields[0] for gid, fields in self.by_gid.items()}
+
+
+async def _load() -> CustomFieldCatalog:
+    return CustomFieldCatalog(await m.CustomField.find(with_children=True).to_list())
+
+
+async def _get_fallback_catalog() -> CustomFieldCatalog:
+    global _FALLBACK  # pylint: disable=global-statement  # noqa: PLW0603
+    if _FALLBACK and _FALLBACK[1] > time.monotonic():
+        return _FALLBACK[0]
+    async with _BUILD_LOCK:
+        if _FALLBACK and _FALLBACK[1] > time.monotonic():
+            return _FALLBACK[0]
+        catalog = await _load()
+        _FALLBACK = (catalog, time.monotonic() + FALLBACK_TTL)
+    return catalog
+
+
+async def get_custom_field_catalog() -> CustomFieldCatalog:
+    """Get the custom field catalog of this worker.
+
+    The catalog lives in the local cache tier, so it is dropped in every
+    worker when a custom field write invalidates ``CacheTag.CUSTOM_FIELDS``. Without a local tier receiving
+    invalidations the worker keeps the catalog for ``FALLBACK_TTL`` seconds.
+    """
+    local = get_local_cache()
+    if local is None or not local.active:
+        return await _get_fallback_catalog()
+    if (catalog := local.get(CATALOG_KEY)) is not MISSING:
+        return catalog
+    async with _BUILD_LOCK:
+        if (catalog := local.get(CATALOG_KEY)) is not MISSING:
+            return catalog
+        version = local.version()
+        catalog = await _load()
+        local.set(
+            CATALOG_KEY,
+            catalog,
+            CATALOG_TTL,
+            tags=(CacheTag.CUSTOM_FIELDS,),
+            version=version,
+        )
+    return catalog
@@ -0,0 +1,309 @@
+import asyncio
+import logging
+import random
+import re
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
+
+import pm.models as m
+from pm.config import CONFIG
+from pm.services.custom_field_catalog import get_custom_field_catalog
+from pm.utils.dateutils import utcnow
+
+__all__ = (
+    'FieldPredicate',
+    'FieldStats',
+    'IndexAdvice',
+    'UsageRecorder',
+    'advise_indexes',
+    'create_advised_indexes',
+    'estimate_selectivity',
+    'extract_field_predicates',
+    'flush_usage',
+    'observe_search',
+)
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL = 60  # seconds
+SELECTIVITY_SAMPLE_SIZE = 10_000
+RANGE_OPERATORS = frozenset(('$gt', '$gte', '$lt', '$lte'))
+
+_NAME_RE = re.compile(r'^\^(.*)\$$')
+
+
+@dataclass(frozen=True, slots=True)
+class FieldPredicate:
+    """Custom field filter of a search: field name, value path and operator."""
+
+    name: str
+    path: str
+    operator: str
+
+
+@dataclass(frozen=True, slots=True)
+class FieldStats:
+    gid: str
+    name: str
+    path: str
+    operators: list[str]
+    uses: int
+    issues: int
+    distinct_values: int
+    selectivity: float | None
+
+
+@dataclass(frozen=True, slots=True)
+class IndexAdvice:
+    name: str
+    keys: list[tuple[str, int]]
+    fields: list[FieldStats]
+    exists: bool
+
+
+def _operator(value: Any) -> str:
+    if not isinstance(value, Mapping) or not value:
+        return '$eq'
+    operators = set(value)
+    if not all(op.startswith('$') for op in operators):
+        return '$eq'
+    if operators <= RANGE_OPERATORS:
+        return 'range'
+    return ','.join(sorted(operators))
+
+
+def _field_name(name: Any) -> str | None:
+    if isinstance(name, Mapping):
+        name = name.get('$regex')
+    if not isinstance(name, str):
+        return None
+    if match := _NAME_RE.match(name):
+        name = match.group(1)
+    return name.lower()
+
+
+def _iter_predicates(node: Any) -> Iterator[FieldPredicate]:
+    if isinstance(node, list):
+        for item in node:
+            yield from _iter_predicates(item)
+        return
+    if not isinstance(node, Mapping):
+        return
+    for key, value in node.items():
+        if key == 'fields' and isinstance(value, Mapping) and '$elemMatch' in value:
+            cond = value['$elemMatch']
+            if not (name := _field_name(cond.get('name'))):
+                continue
+            for path, path_value in cond.items():
+                if path != 'name':
+                    yield FieldPredicate(name, path, _operator(path_value))
+        else:
+            yield from _iter_predicates(value)
+
+
+def extract_field_predicates(query: Mapping[str, Any]) -> set[FieldPredicate]:
+    """Custom field filters of a transformed issue search query."""
+    return set(_iter_predicates(query))
+
+
+class UsageRecorder:
+    """Per worker counts of sampled custom field filters, flushed periodically."""
+
+    def __init__(self, flush_interval: float = FLUSH_INTERVAL) -> None:
+        self.flush_interval = flush_interval
+        self.counts: Counter[FieldPredicate] = Counter()
+        self.last_flush = time.monotonic()
+        self._task: asyncio.Task | None = None
+
+    def record(self, predicates: set[FieldPredicate]) -> None:
+        self.counts.update(predicates)
+        if self._task is not None:
+            return
+        if time.monotonic() - self.last_flush < self.flush_interval:
+            return
+        self._task = asyncio.create_task(self.flush())
+        self._task.add_done_callback(self._flushed)
+
+    def _flushed(self, _: asyncio.Task) -> None:
+        self._task = None
+
+    async def flush(self) -> int:
+        """Add counts to ``QueryFieldUsage``, returns the number of records updated."""
+        self.last_flush = time.monotonic()
+        if not self.counts:
+            return 0
+        counts, self.counts = self.counts, Counter()
+        try:
+            catalog = await get_custom_field_catalog()
+            now = utcnow()
+            updates = []
+            for predicate, count in counts.items():
+                gids = {f.gid for f in catalog.by_name.get(predicate.name, [])}
+                updates.extend(
+                    UpdateOne(
+                        {
+                            'gid': gid,
+                            'path': predicate.path,
+                            'operator': predicate.operator,
+                        },
+                        {
+                            '$inc': {'uses': count},
+                            '$set': {'name': predicate.name, 'last_seen_at': now},
+                        },
+                        upsert=True,
+                    )
+                    for gid in sorted(gids)
+                )
+            if updates:
+                await m.QueryFieldUsage.get_motor_collection().bulk_write(
+                    updates, ordered=False
+                )
+        except PyMongoError as err:
+            logger.warning('Failed to store custom field usage', exc_info=err)
+            self.counts.update(counts)
+            return 0
+        return len(updates)
+
+
+_RECORDER = UsageRecorder()
+
+
+def observe_search(query: Mapping[str, Any]) -> None:
+    """Count custom field filters of a search, sampled with ``INDEX_ADVISOR_SAMPLE_RATE``."""
+    rate = CONFIG.INDEX_ADVISOR_SAMPLE_RATE
+    if not rate or random.random() >= rate:  # noqa: S311
+        return
+    if predicates := extract_field_predicates(query):
+        _RECORDER.record(predicates)
+
+
+async def flush_usage() -> int:
+    return await _RECORDER.flush()
+
+
+def _index_name(path: str) -> str:
+    return f'fields_{path.replace(".", "_")}_name_index'
+
+
+def _index_keys(path: str) -> list[tuple[str, int]]:
+    # the name is matched with a case insensitive regex, which cannot bound an
+    # index scan, but is checked on index keys before fetching documents
+    return [(f'fields.{path}', 1), ('fields.name', 1)]
+
+
+async def estimate_selectivity(
+    gid: str,
+    path: str,
+    sample_size: int = SELECTIVITY_SAMPLE_SIZE,
+) -> tuple[int, int, float | None]:
+    """Estimate how selective an equality filter on a field value is.
+
+    Values are counted over a random sample of issues. Returns the number of
+    sampled issues having the field, the number of distinct values and the
+    expected fraction of issues matched by a filter on a value, the value
+    being as frequent in filters as in issues.
+    """
+    collection = m.Issue.get_motor_collection()
+    sampled = min(sample_size, await collection.estimated_document_count())
+    if not sampled:
+        return 0, 0, None
+    pipeline = [
+        {'$sample': {'size': sample_size}},
+        {
+            '$project': {
+                '_id': 0,
+                'field': {
+                    '$filter': {
+                        'input': '$fields',
+                        'cond': {'$eq': ['$$this.gid', gid]},
+                    },
+                },
+            },
+        },
+        {'$unwind': '$field'},
+        {'$group': {'_id': f'$field.{path}', 'n': {'$sum': 1}}},
+    ]
+    counts = [
+        doc['n'] async for doc in collection.aggregate(pipeline, allowDiskUse=True)
+    ]
+    total = sum(counts)
+    if not total:
+        return 0, 0, 0.0
+    matched = sum(n * n for n in counts) / total
+    return total, len(counts), min(matched / sampled, 1.0)
+
+
+async def advise_indexes(
+    min_uses: int | None = None,
+    max_selectivity: float | None = None,
+    sample_size: int = SELECTIVITY_SAMPLE_SIZE,
+) -> list[IndexAdvice]:
+    """Recommend indexes on custom field values for often and selectively filtered fields.
+
+    Transformed searches match fields by name, so an index per value path
+    (``fields.value.value`` for enums, states, versions...) serves every
+    field stored under that path. The advice lists the fields justifying it.
+    """
+    if min_uses is None:
+        min_uses = CONFIG.INDEX_ADVISOR_MIN_USES
+    if max_selectivity is None:
+        max_selectivity = CONFIG.INDEX_ADVISOR_MAX_SELECTIVITY
+    usage: dict[tuple[str, str], list[m.QueryFieldUsage]] = defaultdict(list)
+    async for record in m.QueryFieldUsage.find_all():
+        usage[record.gid, record.path].append(record)
+
+    by_path: dict[str, list[FieldStats]] = defaultdict(list)
+    for (gid, path), records in usage.items():
+        if (uses := sum(r.uses for r in records)) < min_uses:
+            continue
+        issues, distinct_values, selectivity = await estimate_selectivity(
+            gid, path, sample_size
+        )
+        if selectivity is None or selectivity > max_selectivity:
+            continue
+        by_path[path].append(
+            FieldStats(
+                gid=gid,
+                name=records[0].name,
+                path=path,
+                operators=sorted(r.operator for r in records),
+                uses=uses,
+                issues=issues,
+                distinct_values=distinct_values,
+                selectivity=round(selectivity, 6),
+            ),
+        )
+
+    existing = {
+        tuple(info['key'])
+        for info in (await m.Issue.get_motor_collection().index_information()).values()
+    }
+    advice = [
+        IndexAdvice(
+            name=_index_name(path),
+            keys=_index_keys(path),
+            fields=sorted(fields, key=lambda f: f.uses, reverse=True),
+            exists=tuple(_index_keys(path)) in existing,
+        )
+        for path, fields in by_path.items()
+    ]
+    return sorted(advice, key=lambda a: sum(f.uses for f in a.fields), reverse=True)
+
+
+async def create_advised_indexes(advice: list[IndexAdvice]) -> list[str]:
+    """Create indexes of the advice which do not exist yet, returns their names."""
+    collection = m.Issue.get_motor_collection()
+    created = []
+    for item in advice:
+        if item.exists:
+            continue
+        await collection.create_index(item.keys, name=item.name)
+        logger.info('Created advised index', extra={'index': item.name})
+        created.append(item.name)
+    return created
@@ -0,0 +1,202 @@
+import asyncio
+import json
+import logging
+import random
+from collections import deque
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from bson import UuidRepresentation, json_util
+from pymongo.errors import PyMongoError
+
+from pm.config import CONFIG
+from pm.utils.dateutils import utcnow
+
+if TYPE_CHECKING:
+    from beanie import Document
+    from beanie.odm.queries.find import FindMany
+
+__all__ = (
+    'QueryPlan',
+    'SlowQuery',
+    'clear_slow_queries',
+    'explain_query',
+    'get_slow_queries',
+    'observe_query',
+    'summarize_plan',
+    'to_json_compatible',
+)
+
+logger = logging.getLogger(__name__)
+
+MAX_PENDING_EXPLAINS = 4
+
+_JSON_OPTIONS = json_util.RELAXED_JSON_OPTIONS.with_options(
+    uuid_representation=UuidRepresentation.STANDARD,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class QueryPlan:
+    indexes: list[str]
+    collection_scan: bool
+    docs_examined: int
+    keys_examined: int
+    returned: int
+    execution_time_ms: int
+
+
+@dataclass(frozen=True, slots=True)
+class SlowQuery:
+    source: str
+    query: str
+    duration_ms: float
+    captured_at: datetime
+    filter: dict[str, Any]
+    pipeline: list[dict[str, Any]]
+    plan: QueryPlan | None
+    error: str | None = None
+
+
+_SLOW_QUERIES: deque[SlowQuery] = deque(maxlen=CONFIG.SLOW_QUERY_LOG_SIZE)
+_PENDING: set[asyncio.Task] = set()
+
+
+def to_json_compatible(value: Any) -> Any:
+    """Convert BSON values (ObjectId, datetime, regex...) to relaxed extended JSON."""
+    return json.loads(json_util.dumps(value, json_options=_JSON_OPTIONS))
+
+
+def _iter_values(doc: Any, key: str) -> Iterator[Any]:
+    if isinstance(doc, Mapping):
+        for k, v in doc.items():
+            if k == key:
+                yield v
+            else:
+                yield from _iter_values(v, key)
+    elif isinstance(doc, list):
+        for item in doc:
+            yield from _iter_values(item, key)
+
+
+def summarize_plan(explain: Mapping[str, Any]) -> QueryPlan:
+    """Extract indexes used and execution stats from an ``explain`` result.
+
+    Handles find and aggregate explains of both the classic and the slot based
+    engine; stats of a sharded explain are the totals reported by mongos.
+    """
+    winning_plans = list(_iter_values(explain, 'winningPlan'))
+    stats = [
+        s for s in _iter_values(explain, 'executionStats') if isinstance(s, Mapping)
+    ]
+    return QueryPlan(
+        indexes=sorted(
+            {name for plan in winning_plans for name in _iter_values(plan, 'indexName')}
+        ),
+        collection_scan=any(
+            stage == 'COLLSCAN'
+            for plan in winning_plans
+            for stage in _iter_values(plan, 'stage')
+        ),
+        docs_examined=sum(s.get('totalDocsExamined', 0) for s in stats),
+        keys_examined=sum(s.get('totalKeysExamined', 0) for s in stats),
+        returned=sum(s.get('nReturned', 0) for s in stats),
+        execution_time_ms=max(
+            (s.get('executionTimeMillis', 0) for s in stats), default=0
+        ),
+    )
+
+
+async def explain_query(
+    model: type['Document'],
+    flt: Mapping[str, Any],
+    pipeline: list[dict] | None = None,
+) -> dict[str, Any]:
+    """Run a query as an aggregation under ``explain`` with execution stats.
+
+    The query is really executed, so this costs as much as the query itself.
+    """
+    collection = model.get_motor_collection()
+    stages = [{'$match': dict(flt)}] if flt else []
+    stages += pipeline or []
+    return await collection.database.command(
+        'explain',
+        {'aggregate': collection.name, 'pipeline': stages, 'cursor': {}},
+        verbosity='executionStats',
+    )
+
+
+async def _capture(
+    source: str,
+    query: str,
+    q: 'FindMany',
+    pipeline: list[dict],
+    duration_ms: float,
+) -> None:
+    flt = q.get_filter_query()
+    plan, error = None, None
+    try:
+        plan = summarize_plan(await explain_query(q.document_model, flt, pipeline))
+    except PyMongoError as err:
+        logger.warning('Failed to explain slow query', exc_info=err)
+        error = str(err)
+    logger.warning(
+        'Slow query',
+        extra={
+            'source': source,
+            'query': query,
+            'duration_ms': round(duration_ms, 3),
+            'indexes': plan.indexes if plan else None,
+            'docs_examined': plan.docs_examined if plan else None,
+        },
+    )
+    _SLOW_QUERIES.append(
+        SlowQuery(
+            source=source,
+            query=query,
+            duration_ms=round(duration_ms, 3),
+            captured_at=utcnow(),
+            filter=to_json_compatible(flt),
+            pipeline=to_json_compatible(pipeline),
+            plan=plan,
+            error=error,
+        ),
+    )
+
+
+def observe_query(
+    source: str,
+    query: str,
+    q: 'FindMany',
+    pipeline: list[dict],
+    duration_ms: float,
+) -> None:
+    """Capture a query with its plan if it took ``SLOW_QUERY_THRESHOLD_MS`` or more.
+
+    Explaining runs the query again, so it is sampled with
+    ``SLOW_QUERY_SAMPLE_RATE``, done in the background and limited to
+    ``MAX_PENDING_EXPLAINS`` at a time. Captured queries are kept per worker.
+    """
+    threshold = CONFIG.SLOW_QUERY_THRESHOLD_MS
+    if not threshold or duration_ms < threshold:
+        return
+    if len(_PENDING) >= MAX_PENDING_EXPLAINS:
+        return
+    if random.random() >= CONFIG.SLOW_QUERY_SAMPLE_RATE:  # noqa: S311
+        return
+    task = asyncio.create_task(_capture(source, query, q, pipeline, duration_ms))
+    _PENDING.add(task)
+    task.add_done_callback(_PENDING.discard)
+
+
+def get_slow_queries() -> list[SlowQuery]:
+    """Captured slow queries of this worker, newest first."""
+    return list(reversed(_SLOW_QUERIES))
+
+
+def clear_slow_queries() -> int:
+    count = len(_SLOW_QUERIES)
+    _SLOW_QUERIES.clear()
+    return count
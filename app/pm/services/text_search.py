@@ -0,0 +1,306 @@
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+from collections import defaultdict
+from collections.abc import Iterable
+
+import beanie.operators as bo
+import redis.asyncio as aioredis
+import redis.exceptions as redis_exc
+from beanie import PydanticObjectId
+from elasticsearch import ApiError, TransportError
+from pymongo.errors import PyMongoError
+
+import pm.models as m
+from pm.config import CONFIG, SearchBackendT
+from pm.utils.events_bus import EVENTS_STREAM, Event
+from pm.utils.text_search import BaseSearchBackend, SearchDocument, TooManyHitsError
+from pm.utils.text_search.elastic import ElasticsearchBackend
+from pm.utils.text_search.memory import InMemorySearchBackend
+from pm.utils.text_search.mongo import MongoSearchBackend
+from pm.utils.text_search.sqlite import SQLiteSearchBackend
+
+__all__ = (
+    'SEARCH_BACKEND',
+    'SearchIndexer',
+    'index_issues',
+    'issue_search_document',
+    'reindex_issues',
+    'start_embedded_indexer',
+    'stop_embedded_indexer',
+)
+
+logger = logging.getLogger(__name__)
+
+INDEXER_GROUP = 'search-indexer'
+REINDEX_BATCH_SIZE = 500
+RECONNECT_DELAY = 1  # seconds
+RECONNECT_MAX_DELAY = 30  # seconds
+READ_BLOCK_MS = 5000
+CLAIM_MIN_IDLE_MS = 60_000
+CONSUMER_MAX_IDLE_MS = 3_600_000
+
+
+async def _search_comments(text: str) -> list[PydanticObjectId]:
+    cursor = (
+        m.IssueCommentEntry.get_motor_collection()
+        .find({'$text': {'$search': text}}, {'issue_id': 1})
+        .limit(CONFIG.SEARCH_MAX_HITS + 1)
+    )
+    docs = await cursor.to_list(None)
+    if len(docs) > CONFIG.SEARCH_MAX_HITS:
+        raise TooManyHitsError(CONFIG.SEARCH_MAX_HITS)
+    return list({doc['issue_id'] for doc in docs})
+
+
+def _get_search_backend() -> BaseSearchBackend:
+    if CONFIG.SEARCH_BACKEND == SearchBackendT.ELASTICSEARCH:
+        return ElasticsearchBackend(
+            url=CONFIG.ELASTICSEARCH_URL,
+            index=CONFIG.ELASTICSEARCH_INDEX,
+            api_key=CONFIG.ELASTICSEARCH_API_KEY,
+            verify_certs=CONFIG.ELASTICSEARCH_VERIFY_CERTS,
+            max_hits=CONFIG.SEARCH_MAX_HITS,
+        )
+    if CONFIG.SEARCH_BACKEND == SearchBackendT.SQLITE:
+        return SQLiteSearchBackend(
+            path=CONFIG.SEARCH_SQLITE_PATH,
+            max_hits=CONFIG.SEARCH_MAX_HITS,
+        )
+    if CONFIG.SEARCH_BACKEND == SearchBackendT.MEMORY:
+        return InMemorySearchBackend(max_hits=CONFIG.SEARCH_MAX_HITS)
+    return MongoSearchBackend(related_search=_search_comments)
+
+
+SEARCH_BACKEND = _get_search_backend()
+
+
+def issue_search_document(
+    issue: m.Issue,
+    comments: Iterable[m.IssueComment] = (),
+) -> SearchDocument:
+    """Searchable text of an issue and its comments, same as in ``text_index``.
+
+    Encrypted texts cannot be searched and are left out.
+    """
+    return SearchDocument(
+        id=str(issue.id),
+        subject=issue.subject,
+        text=issue.text if not issue.encryption else None,
+        aliases=list(issue.aliases),
+        comments=[c.text for c in comments if c.text and not c.encryption],
+        attachments=[a.ocr_text for a in issue.attachments if a.ocr_text],
+    )
+
+
+async def _search_documents(issues: list[m.Issue]) -> list[SearchDocument]:
+    if not issues:
+        return []
+    comments: dict[PydanticObjectId, list[m.IssueCommentEntry]] = defaultdict(list)
+    async for comment in m.IssueCommentEntry.find(
+        bo.In(m.IssueCommentEntry.issue_id, [issue.id for issue in issues]),
+    ):
+        comments[comment.issue_id].append(comment)
+    return [issue_search_document(issue, comments[issue.id]) for issue in issues]
+
+
+async def index_issues(
+    issue_ids: Iterable[PydanticObjectId | str],
+    backend: BaseSearchBackend | None = None,
+) -> None:
+    """Bring the index in line with the current state of issues, deleted ones included."""
+    if backend is None:
+        backend = SEARCH_BACKEND
+    if not backend.is_indexed:
+        return
+    ids = {PydanticObjectId(id_) for id_ in issue_ids}
+    if not ids:
+        return
+    issues = await m.Issue.find(bo.In(m.Issue.id, list(ids))).to_list()
+    await backend.index(await _search_documents(issues))
+    await backend.delete([str(id_) for id_ in ids - {issue.id for issue in issues}])
+
+
+async def reindex_issues(
+    backend: BaseSearchBackend | None = None,
+    batch_size: int = REINDEX_BATCH_SIZE,
+) -> int:
+    """Rebuild the index from scratch, returns the number of indexed issues."""
+    if backend is None:
+        backend = SEARCH_BACKEND
+    if not backend.is_indexed:
+        return 0
+    await backend.clear()
+    count = 0
+    batch: list[m.Issue] = []
+    async for issue in m.Issue.find().sort(+m.Issue.id).batch_size(batch_size):
+        batch.append(issue)
+        if len(batch) >= batch_size:
+            await backend.index(await _search_documents(batch))
+            count += len(batch)
+            batch = []
+    await backend.index(await _search_documents(batch))
+    return count + len(batch)
+
+
+class SearchIndexer:
+    """Feed the search index with issue events of the events stream.
+
+    Indexers share a Redis consumer group, so every event is handled by one
+    of them. Events are acknowledged once indexed and events left pending by
+    a failure are handled again by the same consumer, or claimed by another
+    one once idle for long. Consumers idle for longer than
+    ``CONSUMER_MAX_IDLE_MS`` without pending events are removed from the
+    group, as worker consumer names change on restart. Events trimmed from the stream while no indexer
+    was running are lost, run ``reindex_issues`` then.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        backend: BaseSearchBackend | None = None,
+        consumer: str | None = None,
+        batch_size: int = 100,
+    ) -> None:
+        self.redis_url = redis_url
+        self.backend = SEARCH_BACKEND if backend is None else backend
+        self.consumer = consumer or socket.gethostname()
+        self.batch_size = batch_size
+
+    async def ensure_group(self, client: aioredis.Redis) -> None:
+        try:
+            await client.xgroup_create(
+                EVENTS_STREAM, INDEXER_GROUP, id='$', mkstream=True
+            )
+        except redis_exc.ResponseError as err:
+            if 'BUSYGROUP' not in str(err):
+                raise
+
+    async def process(
+        self,
+        client: aioredis.Redis,
+        entries: list[tuple[bytes, dict[bytes, bytes] | None]],
+    ) -> None:
+        issue_ids = set()
+        for entry_id, fields in entries:
+            # entries trimmed from the stream while pending have no fields
+            if fields and (
+                issue_id := Event.from_stream_entry(entry_id, fields).data.get(
+                    'issue_id'
+                )
+            ):
+                issue_ids.add(issue_id)
+        await index_issues(issue_ids, backend=self.backend)
+        await client.xack(
+            EVENTS_STREAM, INDEXER_GROUP, *(entry_id for entry_id, _ in entries)
+        )
+
+    async def claim_stale(self, client: aioredis.Redis) -> None:
+        """Take over entries left pending by consumers that went away, then drop them."""
+        cursor = '0-0'
+        while True:
+            cursor, *_ = await client.xautoclaim(
+                EVENTS_STREAM,
+                INDEXER_GROUP,
+                self.consumer,
+                min_idle_time=CLAIM_MIN_IDLE_MS,
+                start_id=cursor,
+                count=self.batch_size,
+                justid=True,
+            )
+            if cursor in (b'0-0', '0-0'):
+                break
+        for info in await client.xinfo_consumers(EVENTS_STREAM, INDEXER_GROUP):
+            name = info['name']
+            if isinstance(name, bytes):
+                name = name.decode()
+            if (
+                name != self.consumer
+                and not info['pending']
+                and info['idle'] > CONSUMER_MAX_IDLE_MS
+            ):
+                await client.xgroup_delconsumer(EVENTS_STREAM, INDEXER_GROUP, name)
+
+    async def _consume(self, client: aioredis.Redis) -> None:
+        # pending entries of this consumer first, then new ones
+        await self.claim_stale(client)
+        start_id = '0'
+        while True:
+            response = await client.xreadgroup(
+                INDEXER_GROUP,
+                self.consumer,
+                {EVENTS_STREAM: start_id},
+                count=self.batch_size,
+                block=READ_BLOCK_MS,
+            )
+            entries = [entry for _, entries_ in response for entry in entries_]
+            if entries:
+                await self.process(client, entries)
+            elif start_id == '0':
+                start_id = '>'
+
+    async def run(self) -> None:
+        delay = RECONNECT_DELAY
+        while True:
+            client = aioredis.from_url(self.redis_url)
+            try:
+                await self.ensure_group(client)
+                delay = RECONNECT_DELAY
+                await self._consume(client)
+            except (
+                redis_exc.RedisError,
+                ConnectionError,
+                OSError,
+                ApiError,
+                TransportError,
+                PyMongoError,
+            ) as err:
+                logger.warning(
+                    'Search indexer failed, restarting',
+                    exc_info=err,
+                    extra={'delay': delay},
+                )
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception(
+                    'Unexpected search indexer error, restarting',
+                    extra={'delay': delay},
+                )
+            finally:
+                with contextlib.suppress(
+                    redis_exc.RedisError, ConnectionError, OSError
+                ):
+                    await client.aclose()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+
+_EMBEDDED_INDEXER: asyncio.Task | None = None
+
+
+def start_embedded_indexer() -> None:
+    """Run the indexer in the current process, for single node deployments.
+
+    Every worker joins the consumer group under its own name, so events are
+    still indexed once.
+    """
+    global _EMBEDDED_INDEXER  # pylint: disable=global-statement  # noqa: PLW0603
+    if _EMBEDDED_INDEXER is not None:
+        return
+    indexer = SearchIndexer(
+        CONFIG.REDIS_EVENT_BUS_URL,
+        consumer=f'{socket.gethostname()}-{os.getpid()}',
+        batch_size=CONFIG.SEARCH_INDEXER_BATCH_SIZE,
+    )
+    _EMBEDDED_INDEXER = asyncio.create_task(indexer.run())
+
+
+async def stop_embedded_indexer() -> None:
+    global _EMBEDDED_INDEXER  # pylint: disable=global-statement  # noqa: PLW0603
+    if _EMBEDDED_INDEXER is None:
+        return
+    _EMBEDDED_INDEXER.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _EMBEDDED_INDEXER
+    _EMBEDDED_INDEXER = None
@@ -0,0 +1,328 @@
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+from uuid import UUID, uuid4
+
+import beanie.operators as bo
+from beanie import PydanticObjectId
+from beanie.odm.utils.encoder import Encoder
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+import pm.models as m
+from pm.api.events_bus import issue_event_data, send_events
+from pm.config import CONFIG
+from pm.constants import BOT_USER_DOMAIN
+from pm.services.issue import update_tags_on_close_resolve
+from pm.utils.dateutils import utcnow
+from pm.utils.events_bus import Event, EventType
+from pm.workflows import OnChangeWorkflowScript, WorkflowError
+
+if TYPE_CHECKING:
+    from beanie.odm.queries.find import FindMany
+
+    from pm.api.context import UserContext
+
+__all__ = (
+    'LatencyHistogram',
+    'ScheduledWorkflowBatch',
+    'get_workflow_author',
+    'get_workflow_latency_stats',
+    'run_on_change_workflows',
+)
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class LatencyHistogram:
+    """Cumulative latency histogram with fixed millisecond buckets."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        self.counts[bisect_left(self.buckets, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def to_dict(self) -> dict[str, Any]:
+        bounds = [str(b) for b in self.buckets] + ['+Inf']
+        return {
+            'buckets': dict(zip(bounds, self.counts, strict=True)),
+            'count': self.count,
+            'total_ms': round(self.total_ms, 3),
+            'max_ms': round(self.max_ms, 3),
+        }
+
+
+_LATENCY: dict[str, LatencyHistogram] = {}
+_WORKFLOW_NAMES: dict[str, str] = {}
+
+
+def get_workflow_latency_stats() -> dict[str, dict[str, Any]]:
+    """Per-workflow script latency histograms of this process."""
+    return {
+        wf_id: {'name': _WORKFLOW_NAMES.get(wf_id), **hist.to_dict()}
+        for wf_id, hist in _LATENCY.items()
+    }
+
+
+def _observe(wf: m.OnChangeWorkflow, value_ms: float) -> None:
+    wf_id = str(wf.id)
+    _WORKFLOW_NAMES[wf_id] = wf.name
+    if wf_id not in _LATENCY:
+        _LATENCY[wf_id] = LatencyHistogram()
+    _LATENCY[wf_id].observe(value_ms)
+
+
+async def _run_with_budget(
+    wf: m.OnChangeWorkflow,
+    script: OnChangeWorkflowScript,
+    issue: m.Issue,
+    user_ctx: 'UserContext',
+    budget: float,
+) -> None:
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(wf.run(issue, user_ctx, script=script), budget)
+    except TimeoutError as err:
+        logger.warning(
+            'Workflow script exceeded time budget',
+            extra={'workflow_id': str(wf.id), 'budget': budget},
+        )
+        raise WorkflowError(
+            f'Workflow {wf.name} did not finish in {budget:g}s',
+        ) from err
+    finally:
+        _observe(wf, (time.perf_counter() - start) * 1000)
+
+
+async def _run_batch(
+    batch: list[tuple[m.OnChangeWorkflow, OnChangeWorkflowScript]],
+    issue: m.Issue,
+    user_ctx: 'UserContext',
+    budget: float,
+) -> None:
+    if len(batch) == 1:
+        wf, script = batch[0]
+        await _run_with_budget(wf, script, issue, user_ctx, budget)
+        return
+    results = await asyncio.gather(
+        *(
+            _run_with_budget(wf, script, issue, user_ctx, budget)
+            for wf, script in batch
+        ),
+        return_exceptions=True,
+    )
+    # report the first failure in project order, as sequential execution would
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+async def run_on_change_workflows(
+    workflows: Iterable[m.Workflow],
+    issue: m.Issue,
+    user_ctx: 'UserContext',
+    budget: float | None = None,
+) -> None:
+    """Run on-change workflows of a project against an issue being written.
+
+    Scripts keep the project order, except that adjacent scripts declared
+    ``read_only`` run concurrently. Every script gets a time budget of
+    ``WORKFLOW_SCRIPT_TIMEOUT_SECONDS``; exceeding it raises ``WorkflowError``.
+    The budget can only interrupt a script while it awaits, not a blocking
+    computation.
+    """
+    if budget is None:
+        budget = CONFIG.WORKFLOW_SCRIPT_TIMEOUT_SECONDS
+    batch: list[tuple[m.OnChangeWorkflow, OnChangeWorkflowScript]] = []
+    for wf in workflows:
+        if not isinstance(wf, m.OnChangeWorkflow):
+            continue
+        if not (script := wf.get_script()):
+            continue
+        if script.read_only:
+            batch.append((wf, script))
+            continue
+        if batch:
+            await _run_batch(batch, issue, user_ctx, budget)
+            batch = []
+        await _run_with_budget(wf, script, issue, user_ctx, budget)
+    if batch:
+        await _run_batch(batch, issue, user_ctx, budget)
+
+
+ISSUE_CURSOR_BATCH_SIZE = 500
+ISSUE_BULK_WRITE_SIZE = 500
+WORKFLOW_BOT_EMAIL = f'workflows{BOT_USER_DOMAIN}'
+WORKFLOW_BOT_NAME = 'Workflows'
+
+
+async def get_workflow_author() -> m.User:
+    """Bot user credited with changes of scheduled workflows, created on first use."""
+    if user := await m.User.find_one(m.User.email == WORKFLOW_BOT_EMAIL):
+        return user
+    user = m.User(name=WORKFLOW_BOT_NAME, email=WORKFLOW_BOT_EMAIL)
+    try:
+        await user.insert()
+    except DuplicateKeyError:
+        # created concurrently by another worker
+        return await m.User.find_one(m.User.email == WORKFLOW_BOT_EMAIL)
+    return user
+
+
+class ScheduledWorkflowBatch:
+    """Issues of all projects a scheduled workflow runs on, with bulk writes.
+
+    Issues staged with ``save`` get the same bookkeeping as an interactive
+    update (state, tags, history when an author is known) and are written
+    with an unordered ``bulk_write`` every ``flush_size`` issues. Written
+    issues are audited and announced on the events bus; an issue modified
+    concurrently since it was read is skipped and counted in ``conflicts``.
+    """
+
+    def __init__(
+        self,
+        projects: list[m.Project],
+        author: m.User | None = None,
+        flush_size: int = ISSUE_BULK_WRITE_SIZE,
+    ) -> None:
+        self.projects = projects
+        self.author = author
+        self.flush_size = flush_size
+        self.written = 0
+        self.conflicts = 0
+        self._pending: dict[PydanticObjectId, m.Issue] = {}
+        self._history: dict[PydanticObjectId, list[m.IssueHistoryRecord]] = {}
+
+    def issues(
+        self,
+        *filters: Any,
+        batch_size: int = ISSUE_CURSOR_BATCH_SIZE,
+    ) -> 'FindMany[m.Issue]':
+        """Cursor over issues of all target projects, in ``_id`` order."""
+        return (
+            m.Issue.find(
+                bo.In(m.Issue.project.id, [pr.id for pr in self.projects]),
+                *filters,
+            )
+            .sort(+m.Issue.id)
+            .batch_size(batch_size)
+        )
+
+    async def save(self, issue: m.Issue, author: m.User | None = None) -> None:
+        if not issue.is_changed:
+            return
+        author = author or self.author
+        now = utcnow()
+        issue.update_state(now=now)
+        await update_tags_on_close_resolve(issue)
+        if author:
+            if record := issue.gen_history_record(author, time=now):
+                self._history.setdefault(issue.id, []).append(record)
+            issue.updated_by = m.UserLinkField.from_obj(author)
+        issue.updated_at = now
+        # bulk writes bypass document events
+        issue.update_sort_keys()
+        self._pending[issue.id] = issue
+        if len(self._pending) >= self.flush_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        issues = list(self._pending.values())
+        history = dict(self._history)
+        self._pending.clear()
+        self._history.clear()
+
+        encoder = Encoder()
+        prev_revisions: dict[PydanticObjectId, UUID | None] = {}
+        operations = []
+        for issue in issues:
+            update = issue.changes_update()
+            prev_revisions[issue.id] = issue.revision_id
+            issue.revision_id = uuid4()
+            update.setdefault('$set', {})['revision_id'] = encoder.encode(
+                issue.revision_id
+            )
+            operations.append(
+                UpdateOne(
+                    {
+                        '_id': issue.id,
+                        'revision_id': encoder.encode(prev_revisions[issue.id]),
+                    },
+                    update,
+                ),
+            )
+        collection = m.Issue.get_motor_collection()
+        result = await collection.bulk_write(operations, ordered=False)
+        if result.matched_count < len(issues):
+            stored = {
+                doc['_id']
+                async for doc in collection.find(
+                    {
+                        '_id': {'$in': [issue.id for issue in issues]},
+                        'revision_id': {
+                            '$in': [
+                                encoder.encode(issue.revision_id) for issue in issues
+                            ]
+                        },
+                    },
+                    {'_id': 1},
+                )
+            }
+            conflicts = len(issues) - len(stored)
+            self.conflicts += conflicts
+            logger.warning(
+                'Skipped issues modified concurrently',
+                extra={'conflicts': conflicts},
+            )
+            issues = [issue for issue in issues if issue.id in stored]
+        self.written += len(issues)
+
+        records = [
+            m.AuditRecord.create_record(
+                collection=m.Issue.Settings.name,
+                object_id=issue.id,
+                next_revision=issue.revision_id,
+                revision=prev_revisions[issue.id],
+                action=m.AuditActionT.UPDATE,
+                data=issue.get_saved_state(),
+            )
+            for issue in issues
+        ]
+        for issue in issues:
+            issue._save_state()  # pylint: disable=protected-access
+        await m.queue_audit_records(records)
+        entries = [
+            m.IssueHistoryEntry.from_record(issue.id, record)
+            for issue in issues
+            for record in history.get(issue.id, [])
+        ]
+        if entries:
+            await m.IssueHistoryEntry.insert_many(entries)
+            await m.IssueActivity.log(
+                *(
+                    m.IssueActivity.issue_updated(issue, record)
+                    for issue in issues
+                    for record in history.get(issue.id, [])
+                ),
+            )
+        await send_events(
+            [
+                Event(type=EventType.ISSUE_UPDATE, data=issue_event_data(issue))
+                for issue in issues
+            ],
+        )
@@ -1,8 +1,9 @@
 from collections.abc import Coroutine
 
-__all__ = ('run_task', 'setup_database')
+__all__ = ('run_task', 'setup_cache', 'setup_database')
 
 _DB_INITIALIZED = False
+_CACHE_INITIALIZED = False
 
 
 async def setup_database() -> None:
@@ -24,6 +25,22 @@ async def setup_database() -> None:
     _DB_INITIALIZED = True
 
 
+async def setup_cache() -> None:
+    """Initialize cache connection for the worker process.
+
+    Workers only invalidate entries, so the in-process tier is not used.
+    """
+    global _CACHE_INITIALIZED  # pylint: disable=global-statement  # noqa: PLW0603
+    if _CACHE_INITIALIZED:
+        return
+
+    # pylint: disable=import-outside-toplevel
+    from pm.cache import init_cache_system
+
+    await init_cache_system(use_local=False)
+    _CACHE_INITIALIZED = True
+
+
 def run_task(task: Coroutine) -> None:
     """Run an async task with proper database initialization."""
     # pylint: disable=import-outside-toplevel
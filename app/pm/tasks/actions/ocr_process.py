@@ -4,9 +4,11 @@ from uuid import UUID
 from beanie import PydanticObjectId
 
 import pm.models as m
+from pm.api.events_bus import issue_event_data, send_event
 from pm.config import CONFIG
 from pm.tasks._base import setup_database
 from pm.tasks.app import broker
+from pm.utils.events_bus import Event, EventType
 from pm.utils.ocr_client import OCRClient
 
 __all__ = ('process_attachments_ocr',)
@@ -15,19 +17,11 @@ logger = logging.getLogger(__name__)
 
 
 def get_attachment_obj(
-    issue: m.Issue, attachment_id: UUID, comment_id: UUID | None = None
+    obj: m.Issue | m.IssueCommentEntry, attachment_id: UUID
 ) -> m.IssueAttachment | None:
-    if not comment_id:
-        for attachment in issue.attachments:
-            if attachment.id == attachment_id:
-                return attachment
-        return None
-    for comment in issue.comments:
-        if comment.id != comment_id:
-            continue
-        for attachment in comment.attachments:
-            if attachment.id == attachment_id:
-                return attachment
+    for attachment in obj.attachments:
+        if attachment.id == attachment_id:
+            return attachment
     return None
 
 
@@ -50,6 +44,11 @@ async def process_attachments_ocr(
 
     if not issue:
         return
+    owner: m.Issue | m.IssueCommentEntry | None = issue
+    if comment_uuid:
+        owner = await m.IssueCommentEntry.get_for_issue(issue.id, comment_uuid)
+    if not owner:
+        return
 
     async with OCRClient(
         servers=CONFIG.OCR.NATS_SERVERS,
@@ -57,9 +56,7 @@ async def process_attachments_ocr(
         results_bucket=CONFIG.OCR.NATS_RESULTS_BUCKET,
     ) as ocr_client:
         for attachment_id in attachment_uuids:
-            attachment = get_attachment_obj(
-                issue, attachment_id, comment_id=comment_uuid
-            )
+            attachment = get_attachment_obj(owner, attachment_id)
             if not attachment or attachment.encryption:
                 continue
             file_path = f'storage/{attachment_id}'
@@ -68,4 +65,9 @@ async def process_attachments_ocr(
             if not ocr_text:
                 continue
             attachment.ocr_text = ocr_text
-    await issue.save_changes()
+    if not owner.is_changed:
+        return
+    await owner.save_changes()
+    await send_event(
+        Event(type=EventType.ISSUE_UPDATE, data=issue_event_data(issue)),
+    )
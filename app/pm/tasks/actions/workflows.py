@@ -2,6 +2,7 @@ import beanie.operators as bo
 from beanie import PydanticObjectId
 
 import pm.models as m
+from pm.services.workflows import ScheduledWorkflowBatch, get_workflow_author
 from pm.tasks._base import setup_database
 from pm.tasks.app import broker
 from pm.workflows import get_scheduled_script_from_string
@@ -15,9 +16,14 @@ async def run_workflows(
 ) -> None:
     project_ids_ = [PydanticObjectId(pid) for pid in project_ids]
     script = get_scheduled_script_from_string(workflow_script)
-    if script:
-        async for project in m.Project.find(bo.In(m.Project.id, project_ids_)):
-            await script.run(project)
+    if not script:
+        return
+    batch = ScheduledWorkflowBatch(
+        await m.Project.find(bo.In(m.Project.id, project_ids_)).to_list(),
+        author=await get_workflow_author(),
+    )
+    await script.run_batch(batch)
+    await batch.flush()
 
 
 @broker.task(
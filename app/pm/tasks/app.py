@@ -41,6 +41,7 @@ TASK_MODULES = [
     'pm.tasks.actions.send_email',
     'pm.tasks.actions.send_pararam_message',
     'pm.tasks.actions.workflows',
+    'pm.tasks.scheduled.index_advisor',
     'pm.tasks.scheduled.wb_sync',
     'pm.tasks.scheduled.workflows',
 ]
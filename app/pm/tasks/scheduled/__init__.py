@@ -1,4 +1,5 @@
+from .index_advisor import index_advisor
 from .wb_sync import wb_sync
 from .workflows import workflow_scheduler
 
-__all__ = ('wb_sync', 'workflow_scheduler')
+__all__ = ('index_advisor', 'wb_sync', 'workflow_scheduler')
@@ -0,0 +1,42 @@
+import logging
+
+from pm.config import CONFIG
+from pm.services.index_advisor import advise_indexes, create_advised_indexes
+from pm.tasks._base import setup_database
+from pm.tasks.app import broker
+
+__all__ = ('index_advisor',)
+
+logger = logging.getLogger(__name__)
+
+
+async def _index_advisor() -> None:
+    advice = await advise_indexes()
+    for item in advice:
+        logger.info(
+            'Index advice',
+            extra={
+                'index': item.name,
+                'exists': item.exists,
+                'fields': [
+                    {
+                        'name': f.name,
+                        'gid': f.gid,
+                        'uses': f.uses,
+                        'selectivity': f.selectivity,
+                    }
+                    for f in item.fields
+                ],
+            },
+        )
+    if CONFIG.INDEX_ADVISOR_AUTO_CREATE:
+        await create_advised_indexes(advice)
+
+
+@broker.task(
+    schedule=[{'cron': '30 3 * * *'}] if CONFIG.INDEX_ADVISOR_ENABLED else [],
+    task_name='index_advisor',
+)
+async def index_advisor() -> None:
+    await setup_database()
+    await _index_advisor()
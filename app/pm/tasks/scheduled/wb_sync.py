@@ -1,9 +1,10 @@
 import asyncio
 
 import pm.models as m
+from pm.cache import CacheTag, invalidate_cache_tags
 from pm.config import CONFIG
 from pm.services.avatars import generate_default_avatar
-from pm.tasks._base import setup_database
+from pm.tasks._base import setup_cache, setup_database
 from pm.tasks.app import broker
 from pm.utils.wb import WbAPIClient
 
@@ -57,7 +58,8 @@ async def wb_user_sync() -> None:
             await generate_default_avatar(users[user.email])
 
 
-async def wb_team_sync() -> None:
+async def wb_team_sync() -> bool:
+    """Sync WB teams and their members, return whether any membership changed."""
     wb_client = WbAPIClient(
         CONFIG.WB_URL,
         (CONFIG.WB_API_TOKEN_KID, CONFIG.WB_API_TOKEN_SECRET),
@@ -83,6 +85,7 @@ async def wb_team_sync() -> None:
         await new_group.insert()
         groups_by_wb_id[new_group.wb_id] = new_group
     users = await m.User.all().to_list()
+    membership_changed = False
     for group in groups_by_wb_id.values():
         members = {
             member.email for member in await wb_client.get_team_members(group.wb_id)
@@ -95,14 +98,17 @@ async def wb_team_sync() -> None:
             elif any(gr.id == group.id for gr in user.groups):
                 user.groups = [gr for gr in user.groups if gr.id != group.id]
             if user.is_changed:
+                membership_changed = True
                 await user.save_changes()
                 if user.is_changed:
                     await user.save_changes()
+    return membership_changed
 
 
 async def _wb_sync() -> None:
     await wb_user_sync()
-    await wb_team_sync()
+    if await wb_team_sync():
+        await invalidate_cache_tags(CacheTag.GROUPS)
 
 
 @broker.task(
@@ -112,4 +118,5 @@ async def _wb_sync() -> None:
 async def wb_sync() -> None:
     if CONFIG.WB_SYNC_ENABLED:
         await setup_database()
+        await setup_cache()
         await _wb_sync()
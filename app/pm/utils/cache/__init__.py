@@ -5,6 +5,7 @@ from .config import (
     CacheConfig,
 )
 from .decorators import cached
+from .local import LocalCache
 from .provider import CacheProvider
 from .redis import RedisCache
 from .registry import CacheRegistry
@@ -16,6 +17,7 @@ __all__ = (
     'CacheConfig',
     'CacheProvider',
     'CacheRegistry',
+    'LocalCache',
     'RedisCache',
     'cached',
 )
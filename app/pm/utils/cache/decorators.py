@@ -7,6 +7,7 @@ from typing import Any, ParamSpec, TypeVar
 
 import redis.exceptions as redis_exc
 
+from .local import MISSING
 from .registry import CacheRegistry
 
 logger = logging.getLogger(__name__)
@@ -35,9 +36,18 @@ def cached(
     deserializer: Callable[[Any], T] | None = None,
     key_builder: Callable[[Callable[..., Any], tuple[Any, ...], dict[str, Any]], str]
     | None = None,
+    *,
     registry: CacheRegistry | None = None,
+    local_ttl: int | timedelta | None = None,
 ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Cache coroutine results in the registry provider.
+
+    With ``local_ttl`` results are also kept deserialized in the provider's
+    in-process tier (if any), so hits skip the Redis round trip entirely.
+    Such results are shared, so sets and dicts are returned frozen.
+    """
     key_builder = key_builder or _default_key_builder
+    local_ttl_seconds = _convert_ttl_to_seconds(local_ttl)
 
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
         @functools.wraps(func)
@@ -62,13 +72,29 @@ def cached(
 
             cache_key = f'{prefix}:{namespace}:{cache_key}'
 
+            local = (
+                getattr(cache_provider, 'local', None) if local_ttl_seconds else None
+            )
+            version = 0
+            if local is not None:
+                version = local.version()
+                local_value = local.get(cache_key)
+                if local_value is not MISSING:
+                    logger.debug('Local cache hit for key: %s', cache_key)
+                    return local_value
+
             try:
                 cached_value = await cache_provider.get(cache_key)
                 if cached_value is not None:
                     logger.debug('Cache hit for key: %s', cache_key)
-                    if deserializer:
-                        return deserializer(cached_value)
-                    return cached_value
+                    result = (
+                        deserializer(cached_value) if deserializer else cached_value
+                    )
+                    if local is not None:
+                        result = local.set(
+                            cache_key, result, local_ttl_seconds, tags or (), version
+                        )
+                    return result
 
                 logger.debug('Cache miss for key: %s', cache_key)
                 result = await func(*args, **kwargs)
@@ -77,6 +103,10 @@ def cached(
                 await cache_provider.set(
                     cache_key, cache_value, ttl=_convert_ttl_to_seconds(ttl), tags=tags
                 )
+                if local is not None:
+                    result = local.set(
+                        cache_key, result, local_ttl_seconds, tags or (), version
+                    )
 
                 return result
 
@@ -0,0 +1,148 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Collection
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+__all__ = (
+    'MISSING',
+    'LocalCache',
+)
+
+MISSING: Any = object()
+
+
+class _Entry(NamedTuple):
+    value: Any
+    expires_at: float
+    tags: frozenset[str]
+
+
+def _freeze(value: Any) -> Any:
+    """Make cached sets and dicts read-only, they are shared by all callers."""
+    if isinstance(value, set | frozenset):
+        return frozenset(value)
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+class LocalCache:
+    """In-process TTL + LRU cache tier holding ready-to-use (deserialized) values.
+
+    Entries carry the cache tags they depend on. Invalidating a tag (on
+    invalidation broadcast from any worker) evicts only the entries carrying
+    it, and values computed concurrently with the invalidation are not stored:
+    callers take a ``version()`` before computing and pass it to ``set()``.
+    ``generation`` mirrors the global invalidation counter, a gap in it (e.g.
+    after reconnecting) drops every entry. The tier is bypassed while
+    ``active`` is false (e.g. invalidation broadcasts cannot be received).
+
+    Sets and dicts are stored frozen (``frozenset``/``MappingProxyType``).
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.generation = 0
+        self.active = True
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._version = 0
+        self._cleared_at = 0
+        self._tag_versions: dict[str, int] = {}
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def version(self) -> int:
+        """Version to pass to ``set()`` for a value computed from now on."""
+        return self._version
+
+    def get(self, key: str) -> Any:
+        if not self.active:
+            return MISSING
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats['misses'] += 1
+            return MISSING
+        if entry.expires_at <= self._clock():
+            del self._entries[key]
+            self._stats['misses'] += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self._stats['hits'] += 1
+        return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int,
+        tags: Collection[str] = (),
+        version: int | None = None,
+    ) -> Any:
+        """Store the value and return its frozen copy."""
+        value = _freeze(value)
+        if not self.active:
+            return value
+        if version is not None and (
+            self._cleared_at > version
+            or any(self._tag_versions.get(tag, 0) > version for tag in tags)
+        ):
+            # computed before an invalidation, never serve it
+            return value
+        self._entries[key] = _Entry(value, self._clock() + ttl, frozenset(tags))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+        return value
+
+    def invalidate_tags(
+        self, tags: Collection[str], generation: int | None = None
+    ) -> int:
+        """Evict entries carrying any of the tags.
+
+        ``generation`` is the global counter of the invalidation; unless it
+        directly follows the last one seen (e.g. messages were missed or the
+        counter was reset), every entry is dropped.
+        """
+        if generation is not None:
+            if generation == self.generation:
+                return 0
+            if generation != self.generation + 1:
+                return self.set_generation(generation)
+            self.generation = generation
+        self._version += 1
+        tags = frozenset(tags)
+        for tag in tags:
+            self._tag_versions[tag] = self._version
+        stale = [key for key, entry in self._entries.items() if entry.tags & tags]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def set_generation(self, generation: int) -> int:
+        if generation == self.generation:
+            return 0
+        self.generation = generation
+        return self.clear()
+
+    def clear(self) -> int:
+        count = len(self._entries)
+        self._version += 1
+        self._cleared_at = self._version
+        self._entries.clear()
+        return count
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            **self._stats,
+            'size': len(self._entries),
+            'generation': self.generation,
+        }
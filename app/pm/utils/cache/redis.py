@@ -1,3 +1,6 @@
+import asyncio
+import contextlib
+import json
 import logging
 from typing import TypedDict, TypeVar
 
@@ -5,6 +8,7 @@ import redis.asyncio as aioredis
 import redis.exceptions as redis_exc
 
 from .config import CacheConfig
+from .local import LocalCache
 from .provider import CacheProvider
 
 logger = logging.getLogger(__name__)
@@ -13,6 +17,8 @@ __all__ = ('RedisCache',)
 
 T = TypeVar('T')
 
+INVALIDATION_RECONNECT_DELAY = 5  # seconds
+
 
 class CacheStats(TypedDict):
     """Type definition for basic cache statistics."""
@@ -30,12 +36,15 @@ class RedisStats(CacheStats, total=False):
     redis_memory_used: int
     redis_memory_used_human: str
     connected: bool
+    local: dict[str, int]
 
 
 class RedisCache(CacheProvider):
-    def __init__(self, config: CacheConfig) -> None:
+    def __init__(self, config: CacheConfig, local: LocalCache | None = None) -> None:
         self.config = config
+        self.local = local
         self._pool: aioredis.ConnectionPool | None = None
+        self._listener_task: asyncio.Task | None = None
         self._stats: CacheStats = {
             'hits': 0,
             'misses': 0,
@@ -57,6 +66,9 @@ class RedisCache(CacheProvider):
             )
 
             await self.health_check()
+            if self.local is not None:
+                self.local.active = False
+                self._listener_task = asyncio.create_task(self._listen_invalidations())
             logger.info(
                 'Redis cache initialized',
                 extra={'redis_url': self.config.redis_url},
@@ -109,7 +121,7 @@ class RedisCache(CacheProvider):
                 await client.setex(key, ttl, serialized_data)
 
                 if tags:
-                    await self._set_tags(client, key, tags)
+                    await self._set_tags(client, key, tags, ttl)
 
                 self._stats['sets'] += 1
 
@@ -206,12 +218,13 @@ class RedisCache(CacheProvider):
 
                     await client.delete(tag_key)
 
+                deleted = 0
                 if keys_to_delete:
                     deleted = await client.delete(*keys_to_delete)
                     self._stats['deletes'] += deleted
-                    return deleted
 
-                return 0
+                await self._broadcast_invalidation(client, tags)
+                return deleted
 
         except (redis_exc.RedisError, redis_exc.ConnectionError, OSError) as e:
             self._stats['errors'] += 1
@@ -242,6 +255,9 @@ class RedisCache(CacheProvider):
         else:
             stats['connected'] = False
 
+        if self.local is not None:
+            stats['local'] = self.local.get_stats()
+
         return stats
 
     async def health_check(self) -> bool:
@@ -257,14 +273,69 @@ class RedisCache(CacheProvider):
             return False
 
     async def close(self) -> None:
+        if self._listener_task:
+            self._listener_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener_task
+            self._listener_task = None
         if self._pool:
             await self._pool.disconnect()
             self._pool = None
 
     async def _set_tags(
-        self, client: aioredis.Redis, key: str, tags: list[str]
+        self, client: aioredis.Redis, key: str, tags: list[str], ttl: int
     ) -> None:
+        # tag sets must outlive the longest-lived entry they reference
+        tag_ttl = max(ttl, self.config.default_ttl_seconds) * 2
         for tag in tags:
             tag_key = f'{self.config.key_prefix}:tag:{tag}'
             await client.sadd(tag_key, key)
-            await client.expire(tag_key, self.config.default_ttl_seconds * 2)
+            if await client.ttl(tag_key) < tag_ttl:
+                await client.expire(tag_key, tag_ttl)
+
+    @property
+    def _generation_key(self) -> str:
+        return f'{self.config.key_prefix}:generation'
+
+    @property
+    def _invalidation_channel(self) -> str:
+        return f'{self.config.key_prefix}:invalidations'
+
+    async def _broadcast_invalidation(
+        self, client: aioredis.Redis, tags: list[str]
+    ) -> None:
+        """Bump the cache generation and notify all workers to drop local entries."""
+        generation = await client.incr(self._generation_key)
+        if self.local is not None:
+            self.local.invalidate_tags(tags, generation)
+        await client.publish(
+            self._invalidation_channel,
+            json.dumps({'generation': generation, 'tags': tags}),
+        )
+
+    async def _listen_invalidations(self) -> None:
+        while True:
+            client = aioredis.from_url(self.config.redis_url)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(self._invalidation_channel)
+                # messages may have been missed while disconnected
+                generation = await client.get(self._generation_key)
+                self.local.set_generation(int(generation or 0))
+                self.local.active = True
+                async for msg in pubsub.listen():
+                    if msg['type'] != 'message':
+                        continue
+                    data = json.loads(msg['data'])
+                    self.local.invalidate_tags(data['tags'], data['generation'])
+            except (redis_exc.RedisError, ConnectionError, OSError) as e:
+                logger.warning('Cache invalidation listener disconnected', exc_info=e)
+            finally:
+                self.local.active = False
+                self.local.clear()
+                with contextlib.suppress(
+                    redis_exc.RedisError, ConnectionError, OSError
+                ):
+                    await pubsub.aclose()
+                    await client.aclose()
+            await asyncio.sleep(INVALIDATION_RECONNECT_DELAY)
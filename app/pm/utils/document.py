@@ -1,5 +1,5 @@
-from collections.abc import Collection
-from typing import Annotated, ClassVar, Self, Unpack
+from collections.abc import Collection, Mapping
+from typing import Annotated, Any, ClassVar, Self, Unpack
 
 from beanie import Document, PydanticObjectId
 from pydantic import BaseModel, Field
@@ -8,6 +8,7 @@ from pydantic.config import ConfigDict
 __all__ = (
     'DocumentIdRO',
     'DocumentWithReadOnlyProjection',
+    'diff_update',
     'init_read_only_projection_models',
 )
 
@@ -68,3 +69,58 @@ def init_read_only_projection_models(models: Collection[type[Document]]) -> None
         if not issubclass(model, DocumentWithReadOnlyProjection):
             continue
         model.init_ro_projection_model()
+
+
+def _is_path_key(key: Any) -> bool:
+    return isinstance(key, str) and bool(key) and '.' not in key and key[0] != '$'
+
+
+def _diff_value(
+    path: str,
+    old: Any,
+    new: Any,
+    set_: dict[str, Any],
+    push: dict[str, Any],
+) -> None:
+    if old == new:
+        return
+    if isinstance(old, Mapping) and isinstance(new, Mapping):
+        if old.keys() <= new.keys() and all(_is_path_key(k) for k in new):
+            for key, value in new.items():
+                if key not in old:
+                    set_[f'{path}.{key}'] = value
+                else:
+                    _diff_value(f'{path}.{key}', old[key], value, set_, push)
+            return
+    elif isinstance(old, list) and isinstance(new, list):
+        if len(new) > len(old) and new[: len(old)] == old:
+            push[path] = {'$each': new[len(old) :]}
+            return
+        if len(new) == len(old):
+            for idx, (old_item, new_item) in enumerate(zip(old, new, strict=True)):
+                _diff_value(f'{path}.{idx}', old_item, new_item, set_, push)
+            return
+    set_[path] = new
+
+
+def diff_update(old: Mapping[str, Any], new: Mapping[str, Any]) -> dict[str, dict]:
+    """Build a targeted update turning the stored document ``old`` into ``new``.
+
+    Both are documents as stored (encoded). Changed values are ``$set`` at
+    the deepest path still present in both, items appended to an array are
+    ``$push``-ed, anything else (removed keys, shrunk or reordered arrays)
+    replaces its parent value. Top level keys missing from ``new`` are kept.
+    """
+    set_: dict[str, Any] = {}
+    push: dict[str, Any] = {}
+    for key, value in new.items():
+        if key not in old:
+            set_[key] = value
+        else:
+            _diff_value(key, old[key], value, set_, push)
+    update: dict[str, dict] = {}
+    if set_:
+        update['$set'] = set_
+    if push:
+        update['$push'] = push
+    return update
@@ -8,10 +8,15 @@ if TYPE_CHECKING:
 
 
 __all__ = (
+    'EVENTS_STREAM',
     'Event',
     'EventType',
+    'stream_id_key',
 )
 
+EVENTS_STREAM = 'events:stream'
+DEFAULT_STREAM_MAXLEN = 10_000
+
 
 class EventType(IntEnum):
     ISSUE_UPDATE = 0
@@ -19,10 +24,19 @@ class EventType(IntEnum):
     ISSUE_DELETE = 2
 
 
+def stream_id_key(stream_id: str | bytes) -> tuple[int, int]:
+    """Sortable key of a Redis stream entry id (``<ms>-<seq>``)."""
+    if isinstance(stream_id, bytes):
+        stream_id = stream_id.decode()
+    ms, _, seq = stream_id.partition('-')
+    return int(ms), int(seq or 0)
+
+
 @dataclass
 class Event:
     type: EventType
     data: dict
+    id: str | None = None
 
     def _to_bus_msg(self) -> bytes:
         return json.dumps(
@@ -32,13 +46,33 @@ class Event:
             },
         ).encode()
 
-    async def send(self, client: 'Redis') -> None:
-        await client.publish('events', self._to_bus_msg())
+    async def send(
+        self,
+        client: 'Redis',
+        maxlen: int = DEFAULT_STREAM_MAXLEN,
+    ) -> None:
+        await client.xadd(
+            EVENTS_STREAM,
+            {'msg': self._to_bus_msg()},
+            maxlen=maxlen,
+            approximate=True,
+        )
 
     @classmethod
-    def from_bus_msg(cls, msg: bytes) -> Self:
+    def from_bus_msg(cls, msg: bytes, id_: str | None = None) -> Self:
         data = json.loads(msg)
         return cls(
             type=EventType(data['type']),
             data=data['data'],
+            id=id_,
         )
+
+    @classmethod
+    def from_stream_entry(
+        cls,
+        entry_id: str | bytes,
+        fields: dict[bytes, bytes],
+    ) -> Self:
+        if isinstance(entry_id, bytes):
+            entry_id = entry_id.decode()
+        return cls.from_bus_msg(fields[b'msg'], id_=entry_id)
@@ -0,0 +1 @@
+from ._base import *
@@ -0,0 +1,104 @@
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+
+from bson import ObjectId
+
+__all__ = (
+    'BaseSearchBackend',
+    'IndexedSearchBackend',
+    'SearchDocument',
+    'TooManyHitsError',
+    'tokenize',
+)
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class TooManyHitsError(ValueError):
+    def __init__(self, max_hits: int) -> None:
+        self.max_hits = max_hits
+        super().__init__(f'Text search matches more than {max_hits} issues')
+
+
+@dataclass
+class SearchDocument:
+    """Searchable text of an issue."""
+
+    id: str
+    subject: str
+    text: str | None = None
+    aliases: list[str] = field(default_factory=list)
+    comments: list[str] = field(default_factory=list)
+    attachments: list[str] = field(default_factory=list)
+
+    def contents(self) -> Iterator[str]:
+        yield self.subject
+        if self.text:
+            yield self.text
+        yield from self.aliases
+        yield from self.comments
+        yield from self.attachments
+
+
+class BaseSearchBackend(ABC):
+    """Serves the text part of issue queries.
+
+    ``match`` turns a text search into a Mongo filter clause, raising
+    ``TooManyHitsError`` if it cannot match every issue. Backends keeping
+    their own index are fed with ``index`` and ``delete``.
+    """
+
+    text_clause_limit: int | None = None
+    """Max number of text clauses per query, ``None`` if unlimited."""
+
+    is_indexed: bool = False
+    """Whether the backend keeps its own index which must be fed."""
+
+    @abstractmethod
+    async def match(self, text: str) -> dict:
+        pass
+
+    @abstractmethod
+    async def index(self, docs: Sequence[SearchDocument]) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, ids: Sequence[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
+
+
+class IndexedSearchBackend(BaseSearchBackend, ABC):
+    """Backend searching its own index and matching issues by id.
+
+    Matched ids are sent to Mongo, so a search matching more than ``max_hits``
+    issues is rejected rather than silently truncated.
+    """
+
+    is_indexed = True
+
+    def __init__(self, max_hits: int = 1_000) -> None:
+        self.max_hits = max_hits
+
+    @abstractmethod
+    async def search(self, text: str, limit: int) -> list[str]:
+        """Ids of issues matching the text, best ranked first."""
+
+    async def match(self, text: str) -> dict:
+        ids = await self.search(text, self.max_hits + 1)
+        if len(ids) > self.max_hits:
+            raise TooManyHitsError(self.max_hits)
+        return {'_id': {'$in': [ObjectId(id_) for id_ in ids]}}
@@ -0,0 +1,120 @@
+from collections.abc import Sequence
+from dataclasses import asdict
+
+from elasticsearch import AsyncElasticsearch, BadRequestError, NotFoundError
+from elasticsearch.helpers import async_bulk
+
+from ._base import IndexedSearchBackend, SearchDocument
+
+__all__ = ('ElasticsearchBackend',)
+
+INDEX_MAPPINGS = {
+    'dynamic': 'strict',
+    'properties': {
+        'subject': {'type': 'text'},
+        'text': {'type': 'text'},
+        'aliases': {'type': 'text'},
+        'comments': {'type': 'text'},
+        'attachments': {'type': 'text'},
+    },
+}
+SEARCH_FIELDS = ['aliases^5', 'subject^3', 'text', 'comments', 'attachments']
+
+
+class ElasticsearchBackend(IndexedSearchBackend):
+    """Search with an Elasticsearch index of issue texts.
+
+    Terms are matched with typo tolerance, the last term also as a prefix.
+    ``max_hits`` must be below ``index.max_result_window`` (10000 by default).
+    """
+
+    def __init__(
+        self,
+        url: str,
+        index: str,
+        api_key: str | None = None,
+        verify_certs: bool = True,
+        max_hits: int = 1_000,
+    ) -> None:
+        super().__init__(max_hits=max_hits)
+        self.index_name = index
+        self._client = AsyncElasticsearch(
+            url,
+            api_key=api_key or None,
+            verify_certs=verify_certs,
+        )
+        self._index_ready = False
+
+    async def _ensure_index(self) -> None:
+        if self._index_ready:
+            return
+        if not await self._client.indices.exists(index=self.index_name):
+            try:
+                await self._client.indices.create(
+                    index=self.index_name,
+                    mappings=INDEX_MAPPINGS,
+                )
+            except BadRequestError as err:
+                if err.error != 'resource_already_exists_exception':
+                    raise
+        self._index_ready = True
+
+    async def search(self, text: str, limit: int) -> list[str]:
+        try:
+            response = await self._client.search(
+                index=self.index_name,
+                query={
+                    'multi_match': {
+                        'query': text,
+                        'type': 'bool_prefix',
+                        'fields': SEARCH_FIELDS,
+                        'operator': 'and',
+                        'fuzziness': 'AUTO',
+                    },
+                },
+                size=limit,
+                source=False,
+                track_total_hits=False,
+            )
+        except NotFoundError:
+            return []
+        return [hit['_id'] for hit in response['hits']['hits']]
+
+    async def index(self, docs: Sequence[SearchDocument]) -> None:
+        if not docs:
+            return
+        await self._ensure_index()
+        await async_bulk(
+            self._client,
+            (
+                {
+                    '_index': self.index_name,
+                    '_id': doc.id,
+                    '_source': {k: v for k, v in asdict(doc).items() if k != 'id'},
+                }
+                for doc in docs
+            ),
+        )
+
+    async def delete(self, ids: Sequence[str]) -> None:
+        if not ids:
+            return
+        # missing documents are reported as errors, nothing to delete then
+        await async_bulk(
+            self._client,
+            (
+                {'_op_type': 'delete', '_index': self.index_name, '_id': id_}
+                for id_ in ids
+            ),
+            raise_on_error=False,
+        )
+
+    async def clear(self) -> None:
+        await self._client.indices.delete(
+            index=self.index_name,
+            ignore_unavailable=True,
+        )
+        self._index_ready = False
+
+    async def close(self) -> None:
+        await self._client.close()
@@ -0,0 +1,50 @@
+from collections.abc import Sequence
+
+from ._base import IndexedSearchBackend, SearchDocument, tokenize
+
+__all__ = ('InMemorySearchBackend',)
+
+
+class InMemorySearchBackend(IndexedSearchBackend):
+    """Index kept in process memory, a stand-in for an external index in tests.
+
+    Every term of the search must be a prefix of a word of the issue; issues
+    are ranked by the number of matching words.
+    """
+
+    def __init__(self, max_hits: int = 1_000) -> None:
+        super().__init__(max_hits=max_hits)
+        self._tokens: dict[str, list[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    async def index(self, docs: Sequence[SearchDocument]) -> None:
+        for doc in docs:
+            self._tokens[doc.id] = [
+                token for content in doc.contents() for token in tokenize(content)
+            ]
+
+    async def delete(self, ids: Sequence[str]) -> None:
+        for id_ in ids:
+            self._tokens.pop(id_, None)
+
+    async def clear(self) -> None:
+        self._tokens.clear()
+
+    async def close(self) -> None:
+        return
+
+    async def search(self, text: str, limit: int) -> list[str]:
+        if not (terms := tokenize(text)):
+            return []
+        scores: dict[str, int] = {}
+        for id_, tokens in self._tokens.items():
+            score = 0
+            for term in terms:
+                if not (hits := sum(token.startswith(term) for token in tokens)):
+                    break
+                score += hits
+            else:
+                scores[id_] = score
+        return sorted(scores, key=lambda id_: -scores[id_])[:limit]
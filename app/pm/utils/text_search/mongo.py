@@ -0,0 +1,48 @@
+from collections.abc import Awaitable, Callable, Sequence
+
+from bson import ObjectId
+
+from ._base import BaseSearchBackend, SearchDocument
+
+__all__ = ('MongoSearchBackend',)
+
+
+# ruff: noqa: ARG002
+class MongoSearchBackend(BaseSearchBackend):
+    """Search with the ``text_index`` of the issues collection.
+
+    Mongo allows a single ``$text`` expression per query. The index is
+    maintained by Mongo, so there is nothing to feed.
+
+    Texts stored outside of issues (comments) are searched with
+    ``related_search``, returning ids of issues matching the text there.
+    """
+
+    text_clause_limit = 1
+
+    def __init__(
+        self,
+        related_search: Callable[[str], Awaitable[list[ObjectId]]] | None = None,
+    ) -> None:
+        self.related_search = related_search
+
+    async def match(self, text: str) -> dict:
+        clause = {'$text': {'$search': text}}
+        if self.related_search is None:
+            return clause
+        if not (ids := await self.related_search(text)):
+            return clause
+        # every clause of an $or holding $text has to be served by an index
+        return {'$or': [clause, {'_id': {'$in': ids}}]}
+
+    async def index(self, docs: Sequence[SearchDocument]) -> None:
+        return
+
+    async def delete(self, ids: Sequence[str]) -> None:
+        return
+
+    async def clear(self) -> None:
+        return
+
+    async def close(self) -> None:
+        return
@@ -0,0 +1,159 @@
+import asyncio
+import re
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, TypeVar
+
+from ._base import IndexedSearchBackend, SearchDocument
+
+__all__ = (
+    'SQLiteSearchBackend',
+    'fts_query',
+)
+
+T = TypeVar('T')
+
+# unicode61 splits on anything but letters and digits, underscore included
+_TOKEN_RE = re.compile(r'[^\W_]+')
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS issue_ids (id TEXT PRIMARY KEY);
+    CREATE VIRTUAL TABLE IF NOT EXISTS issue_texts USING fts5(
+        subject, text, aliases, comments, attachments,
+        tokenize = 'unicode61', prefix = '2 3'
+    );
+"""
+
+
+def fts_query(text: str) -> str:
+    """Build an FTS5 query matching every word of the text as a prefix.
+
+    Words made of several tokens (``PRJ-12``) are matched as a phrase, so
+    alias prefixes match ``PRJ-12`` and ``PRJ-120`` but not ``PRJ-1 12``.
+    """
+    words = (_TOKEN_RE.findall(word.lower()) for word in text.split())
+    return ' '.join(f'"{" ".join(tokens)}"*' for tokens in words if tokens)
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection) -> Iterator[None]:
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        yield
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+    conn.execute('COMMIT')
+
+
+def _index(conn: sqlite3.Connection, docs: Sequence[SearchDocument]) -> None:
+    with _transaction(conn):
+        for doc in docs:
+            (rowid,) = conn.execute(
+                'INSERT INTO issue_ids (id) VALUES (?) '
+                'ON CONFLICT (id) DO UPDATE SET id = excluded.id RETURNING rowid',
+                (doc.id,),
+            ).fetchone()
+            conn.execute('DELETE FROM issue_texts WHERE rowid = ?', (rowid,))
+            conn.execute(
+                'INSERT INTO issue_texts '
+                '(rowid, subject, text, aliases, comments, attachments) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (
+                    rowid,
+                    doc.subject,
+                    doc.text or '',
+                    ' '.join(doc.aliases),
+                    '\n'.join(doc.comments),
+                    '\n'.join(doc.attachments),
+                ),
+            )
+
+
+def _delete(conn: sqlite3.Connection, ids: Sequence[str]) -> None:
+    with _transaction(conn):
+        for id_ in ids:
+            row = conn.execute(
+                'DELETE FROM issue_ids WHERE id = ? RETURNING rowid', (id_,)
+            ).fetchone()
+            if row:
+                conn.execute('DELETE FROM issue_texts WHERE rowid = ?', row)
+
+
+def _clear(conn: sqlite3.Connection) -> None:
+    with _transaction(conn):
+        conn.execute('DELETE FROM issue_ids')
+        conn.execute('DELETE FROM issue_texts')
+
+
+def _search(conn: sqlite3.Connection, query: str, limit: int) -> list[str]:
+    rows = conn.execute(
+        'SELECT issue_ids.id FROM issue_texts '
+        'JOIN issue_ids ON issue_ids.rowid = issue_texts.rowid '
+        'WHERE issue_texts MATCH ? '
+        # bm25 column weights: subject, text, aliases, comments, attachments
+        'ORDER BY bm25(issue_texts, 3.0, 1.0, 5.0, 1.0, 1.0) LIMIT ?',
+        (query, limit),
+    )
+    return [id_ for (id_,) in rows]
+
+
+class SQLiteSearchBackend(IndexedSearchBackend):
+    """On-disk SQLite FTS5 index for single node deployments.
+
+    Every word of a search is matched as a prefix of issue words. The
+    database is opened in WAL mode, so every worker of the node can search
+    while one of them runs the indexer. Queries run in a thread, one at a
+    time per worker.
+    """
+
+    def __init__(self, path: str, max_hits: int = 1_000) -> None:
+        super().__init__(max_hits=max_hits)
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ':memory:':
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            conn.execute('PRAGMA journal_mode = WAL')
+            conn.execute('PRAGMA busy_timeout = 5000')
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _call(self, fn: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            return fn(self._connect(), *args)
+
+    async def search(self, text: str, limit: int) -> list[str]:
+        if not (query := fts_query(text)):
+            return []
+        return await asyncio.to_thread(self._call, _search, query, limit)
+
+    async def index(self, docs: Sequence[SearchDocument]) -> None:
+        if docs:
+            await asyncio.to_thread(self._call, _index, docs)
+
+    async def delete(self, ids: Sequence[str]) -> None:
+        if ids:
+            await asyncio.to_thread(self._call, _delete, ids)
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._call, _clear)
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._close)
@@ -1,21 +1,25 @@
-import importlib
+import hashlib
 import inspect
-import tempfile
+import types
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from importlib import import_module
-from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
     from pm.api.context import UserContext
     from pm.models.issue import Issue
     from pm.models.project import Project
+    from pm.services.workflows import ScheduledWorkflowBatch
 
 
 __all__ = (
+    'CompiledScriptCache',
     'OnChangeWorkflowScript',
     'ScheduledWorkflowScript',
     'WorkflowError',
+    'evict_compiled_script',
+    'get_compiled_scripts_stats',
     'get_on_change_script',
     'get_on_change_script_from_string',
     'get_scheduled_script',
@@ -34,6 +38,12 @@ class WorkflowError(Exception):
 
 
 class OnChangeWorkflowScript(ABC):
+    read_only: ClassVar[bool] = False
+    """Script only validates the issue and never modifies it.
+
+    Adjacent read-only scripts of a project are run concurrently.
+    """
+
     @abstractmethod
     async def run(
         self, issue: 'Issue', user_ctx: 'UserContext', *args: Any, **kwargs: Any
@@ -41,12 +51,29 @@ class OnChangeWorkflowScript(ABC):
         pass
 
 
-class ScheduledWorkflowScript(ABC):
-    @abstractmethod
-    async def run(
-        self, project: 'Project'
-    ) -> None:  # todo: should run on the list of projects
-        pass
+# either method may be overridden, loaders check that one of them is
+class ScheduledWorkflowScript(ABC):  # noqa: B024
+    """Script run on a schedule, overriding ``run``, ``run_batch`` or both."""
+
+    async def run(self, project: 'Project') -> None:  # noqa: B027
+        """Process a single project, called by the default ``run_batch``."""
+
+    async def run_batch(self, batch: 'ScheduledWorkflowBatch') -> None:
+        """Process all target projects at once.
+
+        Override to iterate ``batch.issues()`` across every project and stage
+        modified issues with ``batch.save()``; they are written in bulk.
+        """
+        for project in batch.projects:
+            await self.run(project)
+
+
+def _check_scheduled_cls(cls: type[ScheduledWorkflowScript]) -> None:
+    if (
+        cls.run is ScheduledWorkflowScript.run
+        and cls.run_batch is ScheduledWorkflowScript.run_batch
+    ):
+        raise TypeError(f'Class {cls} must override run or run_batch')
 
 
 def _import_cls(path: str) -> type[OnChangeWorkflowScript | ScheduledWorkflowScript]:
@@ -71,39 +98,116 @@ def get_scheduled_script(path: str) -> ScheduledWorkflowScript:
     cls = _import_cls(path)
     if not issubclass(cls, ScheduledWorkflowScript):
         raise TypeError(f'Class {cls} must be a subclass of ScheduledWorkflowScript')
+    _check_scheduled_cls(cls)
     return cls()
 
 
-def get_on_change_script_from_string(script: str) -> OnChangeWorkflowScript | None:
-    return load_workflow_script(script, OnChangeWorkflowScript)
+SCRIPT_CACHE_MAX_SIZE = 256
+
+
+class CompiledScriptCache:
+    """Per-process LRU of workflow script classes.
+
+    Entries are keyed by workflow id and script hash, so an edited script is
+    compiled again even in a worker which missed the explicit eviction.
+    """
+
+    def __init__(self, max_size: int = SCRIPT_CACHE_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[str | None, str, str], type | None] = (
+            OrderedDict()
+        )
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_class(
+        self,
+        script: str,
+        base_class: type,
+        workflow_id: str | None = None,
+    ) -> type | None:
+        key = (
+            workflow_id,
+            base_class.__name__,
+            hashlib.sha256(script.encode()).hexdigest(),
+        )
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return self._entries[key]
+        self._stats['misses'] += 1
+        cls = _find_script_class(load_module_from_string(script), base_class)
+        self._entries[key] = cls
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+        return cls
+
+    def evict(self, workflow_id: str) -> int:
+        keys = [key for key in self._entries if key[0] == workflow_id]
+        for key in keys:
+            del self._entries[key]
+        self._stats['evictions'] += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        return {**self._stats, 'size': len(self._entries)}
 
 
-def get_scheduled_script_from_string(script: str) -> ScheduledWorkflowScript | None:
-    return load_workflow_script(script, ScheduledWorkflowScript)
+_SCRIPTS_CACHE = CompiledScriptCache()
+
+
+def evict_compiled_script(workflow_id: str) -> None:
+    _SCRIPTS_CACHE.evict(workflow_id)
+
+
+def get_compiled_scripts_stats() -> dict[str, int]:
+    return _SCRIPTS_CACHE.get_stats()
+
+
+def get_on_change_script_from_string(
+    script: str, workflow_id: str | None = None
+) -> OnChangeWorkflowScript | None:
+    return load_workflow_script(script, OnChangeWorkflowScript, workflow_id)
+
+
+def get_scheduled_script_from_string(
+    script: str, workflow_id: str | None = None
+) -> ScheduledWorkflowScript | None:
+    cls = _SCRIPTS_CACHE.get_class(script, ScheduledWorkflowScript, workflow_id)
+    if not cls:
+        return None
+    _check_scheduled_cls(cls)
+    return cls()
 
 
 def load_module_from_string(script: str, module_name: str = 'dynamic_module') -> Any:
-    with tempfile.NamedTemporaryFile('w', suffix='.py', delete=False) as tmp:
-        tmp.write(script)
-    try:
-        spec = importlib.util.spec_from_file_location(module_name, tmp.name)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return module
-    finally:
-        Path(tmp.name).unlink()
+    module = types.ModuleType(module_name)
+    code = compile(script, f'<{module_name}>', 'exec')
+    exec(code, module.__dict__)  # noqa: S102  # nosec B102
+    return module
 
 
-def load_workflow_script(
-    script: str,
-    base_class: type,
-) -> OnChangeWorkflowScript | ScheduledWorkflowScript | None:
-    module = load_module_from_string(script)
+def _find_script_class(module: Any, base_class: type) -> type | None:
     for obj in vars(module).values():
         if (
             inspect.isclass(obj)
             and issubclass(obj, base_class)
             and obj is not base_class
         ):
-            return obj()
+            return obj
     return None
+
+
+def load_workflow_script(
+    script: str,
+    base_class: type,
+    workflow_id: str | None = None,
+) -> OnChangeWorkflowScript | ScheduledWorkflowScript | None:
+    cls = _SCRIPTS_CACHE.get_class(script, base_class, workflow_id)
+    return cls() if cls else None
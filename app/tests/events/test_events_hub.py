@@ -0,0 +1,124 @@
+"""Tests for the in-process SSE events hub."""
+
+from unittest import mock
+
+import pytest
+
+from pm.utils.events_bus import Event, EventType
+
+__all__ = ()
+
+
+def _event(issue_id: str, project_id: str = 'p1') -> Event:
+    return Event(
+        type=EventType.ISSUE_UPDATE,
+        data={'issue_id': issue_id, 'project_id': project_id},
+    )
+
+
+@pytest.fixture
+def hub():
+    from pm.api.events_hub import EventsHub
+
+    hub_ = EventsHub('redis://localhost')
+    with mock.patch.object(hub_, '_ensure_started'):
+        yield hub_
+
+
+@pytest.mark.asyncio
+async def test_dispatch_by_issue_and_project(hub):
+    from pm.api.events_hub import EventSubscription
+
+    by_issue = EventSubscription(issue_ids={'i1'})
+    by_project = EventSubscription(project_ids={'p2'})
+    wildcard = EventSubscription()
+    for sub in (by_issue, by_project, wildcard):
+        hub.add(sub)
+
+    assert hub.match(_event('i1')) == {by_issue, wildcard}
+    assert hub.match(_event('i2', 'p2')) == {by_project, wildcard}
+    assert hub.match(_event('i1', 'p2')) == {by_issue, by_project, wildcard}
+
+    hub.dispatch(_event('i1'))
+    assert (await by_issue.get()).data['issue_id'] == 'i1'
+    assert (await wildcard.get()).data['issue_id'] == 'i1'
+
+
+@pytest.mark.asyncio
+async def test_remove_cleans_index(hub):
+    from pm.api.events_hub import EventSubscription
+
+    sub = EventSubscription(issue_ids={'i1'}, project_ids={'p1'})
+    hub.add(sub)
+    assert hub.subscriptions_count == 1
+    hub.remove(sub)
+    assert hub.subscriptions_count == 0
+    assert not hub.match(_event('i1'))
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_drops_oldest_and_resyncs():
+    from pm.api.events_hub import RESYNC, EventSubscription
+
+    sub = EventSubscription(max_size=2)
+    for idx in range(3):
+        sub.push(_event(f'i{idx}'))
+
+    assert sub.dropped == 1
+    assert await sub.get() is RESYNC
+    assert (await sub.get()).data['issue_id'] == 'i1'
+    assert (await sub.get()).data['issue_id'] == 'i2'
+
+
+@pytest.mark.asyncio
+async def test_predicate_rejects_events(hub):
+    from pm.api.events_hub import EventSubscription
+
+    sub = EventSubscription(predicate=lambda ev: ev.data['issue_id'] != 'hidden')
+    hub.add(sub)
+    hub.dispatch(_event('hidden'))
+    hub.dispatch(_event('visible'))
+
+    assert (await sub.get()).data['issue_id'] == 'visible'
+
+
+@pytest.fixture
+def fake_redis_server():
+    import fakeredis
+
+    server = fakeredis.FakeServer()
+    with mock.patch(
+        'pm.api.events_hub.aioredis.from_url',
+        lambda *_, **__: fakeredis.FakeAsyncRedis(server=server),
+    ):
+        yield server
+
+
+async def _send(server, events):
+    import fakeredis
+
+    async with fakeredis.FakeAsyncRedis(server=server) as client:
+        for event in events:
+            await event.send(client, maxlen=100)
+        entries = await client.xrange('events:stream')
+    return [entry_id.decode() for entry_id, _ in entries]
+
+
+@pytest.mark.asyncio
+async def test_replay_after_last_event_id(hub, fake_redis_server):
+    ids = await _send(fake_redis_server, [_event(f'i{idx}') for idx in range(3)])
+
+    replayed = await hub.replay(ids[0], limit=10)
+
+    assert [ev.id for ev in replayed] == ids[1:]
+    assert [ev.data['issue_id'] for ev in replayed] == ['i1', 'i2']
+
+
+@pytest.mark.asyncio
+async def test_replay_gap_too_large_or_unknown(hub, fake_redis_server):
+    ids = await _send(fake_redis_server, [_event(f'i{idx}') for idx in range(3)])
+
+    assert await hub.replay(ids[0], limit=1) is None
+    assert await hub.replay('0-1', limit=10) is None
+    assert await hub.replay('not-an-id', limit=10) is None
+    assert await hub.replay(ids[-1], limit=10) == []
@@ -0,0 +1,80 @@
+"""Tests for in-memory permission checks of issue events."""
+
+from unittest import mock
+
+import pytest
+from bson import ObjectId
+
+__all__ = ()
+
+PROJECT_READABLE = str(ObjectId())
+PROJECT_HIDDEN = str(ObjectId())
+USER_ID = ObjectId()
+GROUP_ID = ObjectId()
+
+
+@pytest.fixture
+def can_read():
+    from pm.api.context import UserContext
+    from pm.permissions import ProjectPermissions
+
+    ctx = UserContext(
+        user=mock.Mock(id=USER_ID),
+        permissions={
+            ObjectId(PROJECT_READABLE): {ProjectPermissions.ISSUE_READ},
+            ObjectId(PROJECT_HIDDEN): {ProjectPermissions.PROJECT_READ},
+        },
+        all_group_ids={GROUP_ID},
+    )
+    return ctx.get_issue_event_read_filter()
+
+
+@pytest.mark.parametrize(
+    ('data', 'expected'),
+    [
+        pytest.param({'project_id': PROJECT_READABLE}, True, id='no_summary'),
+        pytest.param({'project_id': PROJECT_HIDDEN}, False, id='hidden_project'),
+        pytest.param(
+            {
+                'project_id': PROJECT_READABLE,
+                'permissions': {'inherit': False, 'users': [], 'groups': []},
+            },
+            False,
+            id='inheritance_disabled',
+        ),
+        pytest.param(
+            {
+                'project_id': PROJECT_HIDDEN,
+                'permissions': {'inherit': True, 'users': [str(USER_ID)], 'groups': []},
+            },
+            True,
+            id='shared_with_user',
+        ),
+        pytest.param(
+            {
+                'project_id': PROJECT_HIDDEN,
+                'permissions': {
+                    'inherit': False,
+                    'users': [],
+                    'groups': [str(GROUP_ID)],
+                },
+            },
+            True,
+            id='shared_with_group',
+        ),
+        pytest.param(
+            {
+                'project_id': PROJECT_HIDDEN,
+                'permissions': {
+                    'inherit': True,
+                    'users': [str(ObjectId())],
+                    'groups': [str(ObjectId())],
+                },
+            },
+            False,
+            id='shared_with_others',
+        ),
+    ],
+)
+def test_issue_event_read_filter(can_read, data, expected):
+    assert can_read(data) is expected
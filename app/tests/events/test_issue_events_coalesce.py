@@ -0,0 +1,49 @@
+"""Tests for coalesced delivery of issue SSE events."""
+
+import pytest
+
+from pm.utils.events_bus import Event, EventType
+
+__all__ = ()
+
+
+def _event(type_: EventType, issue_id: str) -> Event:
+    return Event(type=type_, data={'issue_id': issue_id, 'project_id': 'p1'})
+
+
+@pytest.mark.asyncio
+async def test_window_dedupes_and_groups_by_type():
+    from pm.api.events_hub import EventSubscription
+    from pm.api.routes.events.issue import _collect_window
+
+    sub = EventSubscription()
+    for event in (
+        _event(EventType.ISSUE_UPDATE, 'i1'),
+        _event(EventType.ISSUE_CREATE, 'i3'),
+        _event(EventType.ISSUE_UPDATE, 'i2'),
+        _event(EventType.ISSUE_UPDATE, 'i3'),
+        _event(EventType.ISSUE_DELETE, 'i2'),
+    ):
+        sub.push(event)
+
+    batch = await _collect_window(sub, _event(EventType.ISSUE_UPDATE, 'i1'), 0.05)
+    outputs = {out.type: out.data['issue_ids'] for out in batch.to_outputs()}
+
+    assert outputs == {
+        'issue_update': ['i1'],
+        'issue_create': ['i3'],
+        'issue_delete': ['i2'],
+    }
+
+
+@pytest.mark.asyncio
+async def test_window_interrupted_by_resync():
+    from pm.api.events_hub import RESYNC, EventSubscription
+    from pm.api.routes.events.issue import _collect_window
+
+    sub = EventSubscription()
+    sub.request_resync()
+
+    result = await _collect_window(sub, _event(EventType.ISSUE_UPDATE, 'i1'), 0.05)
+
+    assert result is RESYNC
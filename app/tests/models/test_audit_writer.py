@@ -0,0 +1,137 @@
+"""Tests for the batched audit record writer."""
+
+import asyncio
+from unittest import mock
+
+import bson
+import pytest
+
+__all__ = ()
+
+
+def test_write_data_files(tmp_path) -> None:
+    from pm.models import _audit
+
+    first = tmp_path / 'issues' / 'a' / 'r1.bson'
+    second = tmp_path / 'issues' / 'b' / 'r2.bson'
+    with mock.patch.object(_audit.os, 'fsync', wraps=_audit.os.fsync) as fsync:
+        _audit._write_data_files(  # pylint: disable=protected-access
+            [
+                (str(first), bson.encode({'data': 1})),
+                (str(second), bson.encode({'data': 2})),
+            ],
+            fsync=True,
+        )
+
+    assert bson.decode(first.read_bytes()) == {'data': 1}
+    assert bson.decode(second.read_bytes()) == {'data': 2}
+    # both files and both directories
+    assert fsync.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_not_started_writes_inline() -> None:
+    from pm.models import _audit
+
+    writer = _audit.AuditWriter(flush_interval=60, batch_size=10)
+    with mock.patch.object(
+        _audit, 'write_audit_records', new_callable=mock.AsyncMock
+    ) as write:
+        await writer.submit(['r1'])
+
+    write.assert_awaited_once_with(['r1'], False)
+    assert not writer.pending
+
+
+@pytest.mark.asyncio
+async def test_batches_and_drain_on_stop() -> None:
+    from pm.models import _audit
+
+    writer = _audit.AuditWriter(flush_interval=60, batch_size=2, fsync=True)
+    with mock.patch.object(
+        _audit, 'write_audit_records', new_callable=mock.AsyncMock
+    ) as write:
+        writer.start()
+        await writer.submit(['r1'])
+        await asyncio.sleep(0)
+        write.assert_not_awaited()
+
+        # a full batch wakes the writer up
+        await writer.submit(['r2'])
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        write.assert_awaited_once_with(['r1', 'r2'], True)
+
+        await writer.submit(['r3', 'r4', 'r5'])
+        assert await writer.stop() == 3
+        assert not writer.is_running
+
+    assert [c.args[0] for c in write.await_args_list] == [
+        ['r1', 'r2'],
+        ['r3', 'r4'],
+        ['r5'],
+    ]
+    assert not writer.pending
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_stays_queued() -> None:
+    from pymongo.errors import AutoReconnect
+
+    from pm.models import _audit
+
+    writer = _audit.AuditWriter(flush_interval=60, batch_size=2)
+    writer.pending = ['r1', 'r2', 'r3']
+    with mock.patch.object(
+        _audit,
+        'write_audit_records',
+        new_callable=mock.AsyncMock,
+        side_effect=[None, AutoReconnect()],
+    ):
+        assert await writer.flush() == 2
+
+    assert writer.pending == ['r3']
+
+
+@pytest.mark.asyncio
+async def test_stop_waits_for_batch_being_written() -> None:
+    from pm.models import _audit
+
+    written = []
+    started = asyncio.Event()
+
+    async def slow_write(records, _fsync) -> None:
+        started.set()
+        await asyncio.sleep(0.01)
+        written.extend(records)
+
+    writer = _audit.AuditWriter(flush_interval=60, batch_size=2)
+    with mock.patch.object(_audit, 'write_audit_records', slow_write):
+        writer.start()
+        await writer.submit(['r1', 'r2'])
+        await started.wait()
+        await writer.submit(['r3'])
+        assert await writer.stop() == 3
+
+    assert written == ['r1', 'r2', 'r3']
+    assert not writer.pending
+
+
+@pytest.mark.asyncio
+async def test_cancelled_write_keeps_batch_queued() -> None:
+    from pm.models import _audit
+
+    writer = _audit.AuditWriter(flush_interval=60, batch_size=2)
+    writer.pending = ['r1', 'r2', 'r3']
+    with (
+        mock.patch.object(
+            _audit,
+            'write_audit_records',
+            new_callable=mock.AsyncMock,
+            side_effect=asyncio.CancelledError(),
+        ),
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await writer.flush()
+
+    assert writer.pending == ['r1', 'r2', 'r3']
@@ -46,33 +46,7 @@ def _custom_fields() -> dict:
         ),
         pytest.param(
             'id',
-            [
-                {
-                    '$addFields': {
-                        'id__sort___p1': {
-                            '$arrayElemAt': [
-                                {'$split': [{'$arrayElemAt': ['$aliases', -1]}, '-']},
-                                0,
-                            ]
-                        },
-                        'id__sort___p2': {
-                            '$toInt': {
-                                '$arrayElemAt': [
-                                    {
-                                        '$split': [
-                                            {'$arrayElemAt': ['$aliases', -1]},
-                                            '-',
-                                        ]
-                                    },
-                                    -1,
-                                ]
-                            }
-                        },
-                    }
-                },
-                {'$sort': {'id__sort___p1': 1, 'id__sort___p2': 1}},
-                {'$project': {'id__sort___p1': 0, 'id__sort___p2': 0}},
-            ],
+            [{'$sort': {'sort_keys.id.slug': 1, 'sort_keys.id.num': 1}}],
             id='id_asc',
         ),
         pytest.param('subject', [{'$sort': {'subject': 1}}], id='subject_asc'),
@@ -109,33 +83,7 @@ def _custom_fields() -> dict:
         ),
         pytest.param(
             'id desc',
-            [
-                {
-                    '$addFields': {
-                        'id__sort___p1': {
-                            '$arrayElemAt': [
-                                {'$split': [{'$arrayElemAt': ['$aliases', -1]}, '-']},
-                                0,
-                            ]
-                        },
-                        'id__sort___p2': {
-                            '$toInt': {
-                                '$arrayElemAt': [
-                                    {
-                                        '$split': [
-                                            {'$arrayElemAt': ['$aliases', -1]},
-                                            '-',
-                                        ]
-                                    },
-                                    -1,
-                                ]
-                            }
-                        },
-                    }
-                },
-                {'$sort': {'id__sort___p1': -1, 'id__sort___p2': -1}},
-                {'$project': {'id__sort___p1': 0, 'id__sort___p2': 0}},
-            ],
+            [{'$sort': {'sort_keys.id.slug': -1, 'sort_keys.id.num': -1}}],
             id='id_desc',
         ),
         pytest.param('subject desc', [{'$sort': {'subject': -1}}], id='subject_desc'),
@@ -161,945 +109,117 @@ def _custom_fields() -> dict:
         ),
         pytest.param(
             'state',
-            [
-                {
-                    '$addFields': {
-                        'state__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^state$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'state__sort': 1}},
-                {'$project': {'state__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.state': 1}}],
             id='state_asc',
         ),
         pytest.param(
             'state desc',
-            [
-                {
-                    '$addFields': {
-                        'state__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^state$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'state__sort': -1}},
-                {'$project': {'state__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.state': -1}}],
             id='state_desc',
         ),
         pytest.param(
             'priority',
-            [
-                {
-                    '$addFields': {
-                        'priority__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^priority$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'priority__sort': 1}},
-                {'$project': {'priority__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.priority': 1}}],
             id='priority_asc',
         ),
         pytest.param(
             'priority desc',
-            [
-                {
-                    '$addFields': {
-                        'priority__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^priority$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'priority__sort': -1}},
-                {'$project': {'priority__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.priority': -1}}],
             id='priority_desc',
         ),
         pytest.param(
             'integer',
-            [
-                {
-                    '$addFields': {
-                        'integer__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^integer$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'integer__sort': 1}},
-                {'$project': {'integer__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.integer': 1}}],
             id='integer_asc',
         ),
         pytest.param(
             'integer desc',
-            [
-                {
-                    '$addFields': {
-                        'integer__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^integer$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'integer__sort': -1}},
-                {'$project': {'integer__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.integer': -1}}],
             id='integer_desc',
         ),
         pytest.param(
             'float',
-            [
-                {
-                    '$addFields': {
-                        'float__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^float$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'float__sort': 1}},
-                {'$project': {'float__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.float': 1}}],
             id='float_asc',
         ),
         pytest.param(
             'float desc',
-            [
-                {
-                    '$addFields': {
-                        'float__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^float$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'float__sort': -1}},
-                {'$project': {'float__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.float': -1}}],
             id='float_desc',
         ),
         pytest.param(
             'date',
-            [
-                {
-                    '$addFields': {
-                        'date__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^date$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'date__sort': 1}},
-                {'$project': {'date__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.date': 1}}],
             id='date_asc',
         ),
         pytest.param(
             'date desc',
-            [
-                {
-                    '$addFields': {
-                        'date__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^date$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'date__sort': -1}},
-                {'$project': {'date__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.date': -1}}],
             id='date_desc',
         ),
         pytest.param(
             'datetime',
-            [
-                {
-                    '$addFields': {
-                        'datetime__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^datetime$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'datetime__sort': 1}},
-                {'$project': {'datetime__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.datetime': 1}}],
             id='datetime_asc',
         ),
         pytest.param(
             'datetime desc',
-            [
-                {
-                    '$addFields': {
-                        'datetime__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^datetime$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'datetime__sort': -1}},
-                {'$project': {'datetime__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.datetime': -1}}],
             id='datetime_desc',
         ),
         pytest.param(
             'string',
-            [
-                {
-                    '$addFields': {
-                        'string__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^string$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'string__sort': 1}},
-                {'$project': {'string__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.string': 1}}],
             id='string_asc',
         ),
         pytest.param(
             'string desc',
-            [
-                {
-                    '$addFields': {
-                        'string__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^string$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'string__sort': -1}},
-                {'$project': {'string__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.string': -1}}],
             id='string_desc',
         ),
         pytest.param(
             'assignee',
-            [
-                {
-                    '$addFields': {
-                        'assignee__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^assignee$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.email',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'assignee__sort': 1}},
-                {'$project': {'assignee__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.assignee': 1}}],
             id='assignee_asc',
         ),
         pytest.param(
             'assignee desc',
-            [
-                {
-                    '$addFields': {
-                        'assignee__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^assignee$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.email',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'assignee__sort': -1}},
-                {'$project': {'assignee__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.assignee': -1}}],
             id='assignee_desc',
         ),
         pytest.param(
             'version',
-            [
-                {
-                    '$addFields': {
-                        'version__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^version$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'version__sort': 1}},
-                {'$project': {'version__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.version': 1}}],
             id='version_asc',
         ),
         pytest.param(
             'version desc',
-            [
-                {
-                    '$addFields': {
-                        'version__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^version$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'version__sort': -1}},
-                {'$project': {'version__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.version': -1}}],
             id='version_desc',
         ),
         pytest.param(
             'boolean',
-            [
-                {
-                    '$addFields': {
-                        'boolean__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^boolean$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'boolean__sort': 1}},
-                {'$project': {'boolean__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.boolean': 1}}],
             id='boolean_asc',
         ),
         pytest.param(
             'boolean desc',
-            [
-                {
-                    '$addFields': {
-                        'boolean__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^boolean$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'boolean__sort': -1}},
-                {'$project': {'boolean__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.boolean': -1}}],
             id='boolean_desc',
         ),
         pytest.param(
             'h-state',
-            [
-                {
-                    '$addFields': {
-                        'h-state__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^h-state$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'h-state__sort': 1}},
-                {'$project': {'h-state__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.h-state': 1}}],
             id='h-state_asc',
         ),
         pytest.param(
             'h-state desc',
-            [
-                {
-                    '$addFields': {
-                        'h-state__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^h-state$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'h-state__sort': -1}},
-                {'$project': {'h-state__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.h-state': -1}}],
             id='h-state_desc',
         ),
         pytest.param(
             'INTEGER',
-            [
-                {
-                    '$addFields': {
-                        'integer__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^integer$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'integer__sort': 1}},
-                {'$project': {'integer__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.integer': 1}}],
             id='integer_uppercase',
         ),
         pytest.param(
@@ -1116,30 +236,12 @@ def _custom_fields() -> dict:
             'project, id',
             [
                 {
-                    '$addFields': {
-                        'id__sort___p1': {
-                            '$arrayElemAt': [
-                                {'$split': [{'$arrayElemAt': ['$aliases', -1]}, '-']},
-                                0,
-                            ]
-                        },
-                        'id__sort___p2': {
-                            '$toInt': {
-                                '$arrayElemAt': [
-                                    {
-                                        '$split': [
-                                            {'$arrayElemAt': ['$aliases', -1]},
-                                            '-',
-                                        ]
-                                    },
-                                    -1,
-                                ]
-                            }
-                        },
+                    '$sort': {
+                        'project.name': 1,
+                        'sort_keys.id.slug': 1,
+                        'sort_keys.id.num': 1,
                     }
-                },
-                {'$sort': {'project.name': 1, 'id__sort___p1': 1, 'id__sort___p2': 1}},
-                {'$project': {'id__sort___p1': 0, 'id__sort___p2': 0}},
+                }
             ],
             id='multiple_builtin_fields',
         ),
@@ -1147,217 +249,35 @@ def _custom_fields() -> dict:
             'project desc, id asc',
             [
                 {
-                    '$addFields': {
-                        'id__sort___p1': {
-                            '$arrayElemAt': [
-                                {'$split': [{'$arrayElemAt': ['$aliases', -1]}, '-']},
-                                0,
-                            ]
-                        },
-                        'id__sort___p2': {
-                            '$toInt': {
-                                '$arrayElemAt': [
-                                    {
-                                        '$split': [
-                                            {'$arrayElemAt': ['$aliases', -1]},
-                                            '-',
-                                        ]
-                                    },
-                                    -1,
-                                ]
-                            }
-                        },
+                    '$sort': {
+                        'project.name': -1,
+                        'sort_keys.id.slug': 1,
+                        'sort_keys.id.num': 1,
                     }
-                },
-                {'$sort': {'project.name': -1, 'id__sort___p1': 1, 'id__sort___p2': 1}},
-                {'$project': {'id__sort___p1': 0, 'id__sort___p2': 0}},
+                }
             ],
             id='multiple_builtin_with_direction',
         ),
         pytest.param(
             'string, project desc',
-            [
-                {
-                    '$addFields': {
-                        'string__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^string$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'string__sort': 1, 'project.name': -1}},
-                {'$project': {'string__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.string': 1, 'project.name': -1}}],
             id='custom_and_builtin_fields',
         ),
         pytest.param(
             'integer, string desc',
-            [
-                {
-                    '$addFields': {
-                        'integer__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^integer$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                        'string__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^string$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'integer__sort': 1, 'string__sort': -1}},
-                {'$project': {'integer__sort': 0, 'string__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.integer': 1, 'sort_keys.fields.string': -1}}],
             id='multiple_custom_fields',
         ),
         pytest.param(
             'priority desc, assignee, created_at desc',
             [
-                {
-                    '$addFields': {
-                        'priority__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^priority$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                        'assignee__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^assignee$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.email',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
                 {
                     '$sort': {
-                        'priority__sort': -1,
-                        'assignee__sort': 1,
+                        'sort_keys.fields.priority': -1,
+                        'sort_keys.fields.assignee': 1,
                         'created_at': -1,
-                    },
-                },
-                {'$project': {'priority__sort': 0, 'assignee__sort': 0}},
+                    }
+                }
             ],
             id='complex_multi_type_sort',
         ),
@@ -1369,363 +289,40 @@ def _custom_fields() -> dict:
         pytest.param(
             'priority desc, resolved_at, closed_at desc',
             [
-                {
-                    '$addFields': {
-                        'priority__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^priority$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
                 {
                     '$sort': {
-                        'priority__sort': -1,
+                        'sort_keys.fields.priority': -1,
                         'resolved_at': 1,
                         'closed_at': -1,
-                    },
-                },
-                {'$project': {'priority__sort': 0}},
+                    }
+                }
             ],
             id='mixed_custom_and_datetime_fields_sort',
         ),
         pytest.param(
             'field name',
-            [
-                {
-                    '$addFields': {
-                        'field name__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^field name$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'field name__sort': 1}},
-                {'$project': {'field name__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.field name': 1}}],
             id='field_with_space',
         ),
         pytest.param(
             'state, priority desc, integer, float desc, date, string desc',
             [
-                {
-                    '$addFields': {
-                        'state__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^state$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                        'priority__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^priority$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                        'integer__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^integer$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                        'float__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^float$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                        'date__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^date$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                        'string__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^string$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
                 {
                     '$sort': {
-                        'state__sort': 1,
-                        'priority__sort': -1,
-                        'integer__sort': 1,
-                        'float__sort': -1,
-                        'date__sort': 1,
-                        'string__sort': -1,
-                    },
-                },
-                {
-                    '$project': {
-                        'state__sort': 0,
-                        'priority__sort': 0,
-                        'integer__sort': 0,
-                        'float__sort': 0,
-                        'date__sort': 0,
-                        'string__sort': 0,
-                    },
-                },
+                        'sort_keys.fields.state': 1,
+                        'sort_keys.fields.priority': -1,
+                        'sort_keys.fields.integer': 1,
+                        'sort_keys.fields.float': -1,
+                        'sort_keys.fields.date': 1,
+                        'sort_keys.fields.string': -1,
+                    }
+                }
             ],
             id='many_fields_sorting',
         ),
         pytest.param(
             'PrIoRiTy DESC, StAtE',
-            [
-                {
-                    '$addFields': {
-                        'priority__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^priority$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                        'state__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^state$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'priority__sort': -1, 'state__sort': 1}},
-                {'$project': {'priority__sort': 0, 'state__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.priority': -1, 'sort_keys.fields.state': 1}}],
             id='mixed_case_field_names',
         ),
         pytest.param(
@@ -1768,289 +365,37 @@ def _custom_fields() -> dict:
         ),
         pytest.param(
             'priority multi',
-            [
-                {
-                    '$addFields': {
-                        'priority multi__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^priority multi$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'priority multi__sort': 1}},
-                {'$project': {'priority multi__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.priority multi': 1}}],
             id='enum_multi_asc',
         ),
         pytest.param(
             'priority multi desc',
-            [
-                {
-                    '$addFields': {
-                        'priority multi__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^priority multi$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'priority multi__sort': -1}},
-                {'$project': {'priority multi__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.priority multi': -1}}],
             id='enum_multi_desc',
         ),
         pytest.param(
             'version multi',
-            [
-                {
-                    '$addFields': {
-                        'version multi__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^version multi$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'version multi__sort': 1}},
-                {'$project': {'version multi__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.version multi': 1}}],
             id='version_multi_asc',
         ),
         pytest.param(
             'version multi desc',
-            [
-                {
-                    '$addFields': {
-                        'version multi__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^version multi$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'version multi__sort': -1}},
-                {'$project': {'version multi__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.version multi': -1}}],
             id='version_multi_desc',
         ),
         pytest.param(
             'assignee multi',
-            [
-                {
-                    '$addFields': {
-                        'assignee multi__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^assignee multi$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.email',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'assignee multi__sort': 1}},
-                {'$project': {'assignee multi__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.assignee multi': 1}}],
             id='user_multi_asc',
         ),
         pytest.param(
             'assignee multi desc',
-            [
-                {
-                    '$addFields': {
-                        'assignee multi__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^assignee multi$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value.email',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'assignee multi__sort': -1}},
-                {'$project': {'assignee multi__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.assignee multi': -1}}],
             id='user_multi_desc',
         ),
         pytest.param(
             'date, date, date',
-            [
-                {
-                    '$addFields': {
-                        'date__sort': {
-                            '$ifNull': [
-                                {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$map': {
-                                                'input': {
-                                                    '$filter': {
-                                                        'input': '$fields',
-                                                        'as': 'field',
-                                                        'cond': {
-                                                            '$regexMatch': {
-                                                                'input': '$$field.name',
-                                                                'regex': '^date$',
-                                                                'options': 'i',
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                'as': 'matchedField',
-                                                'in': '$$matchedField.value',
-                                            },
-                                        },
-                                        0,
-                                    ],
-                                },
-                                None,
-                            ],
-                        },
-                    },
-                },
-                {'$sort': {'date__sort': 1}},
-                {'$project': {'date__sort': 0}},
-            ],
+            [{'$sort': {'sort_keys.fields.date': 1}}],
             id='triple_same_field',
         ),
         pytest.param(
@@ -2096,41 +441,7 @@ async def test_sort_transformation(
         pytest.param(
             '',
             'id desc',
-            (
-                {},
-                [
-                    {
-                        '$addFields': {
-                            'id__sort___p1': {
-                                '$arrayElemAt': [
-                                    {
-                                        '$split': [
-                                            {'$arrayElemAt': ['$aliases', -1]},
-                                            '-',
-                                        ]
-                                    },
-                                    0,
-                                ]
-                            },
-                            'id__sort___p2': {
-                                '$toInt': {
-                                    '$arrayElemAt': [
-                                        {
-                                            '$split': [
-                                                {'$arrayElemAt': ['$aliases', -1]},
-                                                '-',
-                                            ]
-                                        },
-                                        -1,
-                                    ]
-                                }
-                            },
-                        }
-                    },
-                    {'$sort': {'id__sort___p1': -1, 'id__sort___p2': -1}},
-                    {'$project': {'id__sort___p1': 0, 'id__sort___p2': 0}},
-                ],
-            ),
+            ({}, [{'$sort': {'sort_keys.id.slug': -1, 'sort_keys.id.num': -1}}]),
             id='sort_only_id_desc',
         ),
         pytest.param(
@@ -2165,46 +476,10 @@ async def test_sort_transformation(
                         '$elemMatch': {
                             'name': {'$regex': '^state$', '$options': 'i'},
                             'value.value': 'open',
-                        },
-                    },
+                        }
+                    }
                 },
-                [
-                    {
-                        '$addFields': {
-                            'priority__sort': {
-                                '$ifNull': [
-                                    {
-                                        '$arrayElemAt': [
-                                            {
-                                                '$map': {
-                                                    'input': {
-                                                        '$filter': {
-                                                            'input': '$fields',
-                                                            'as': 'field',
-                                                            'cond': {
-                                                                '$regexMatch': {
-                                                                    'input': '$$field.name',
-                                                                    'regex': '^priority$',
-                                                                    'options': 'i',
-                                                                },
-                                                            },
-                                                        },
-                                                    },
-                                                    'as': 'matchedField',
-                                                    'in': '$$matchedField.value.value',
-                                                },
-                                            },
-                                            0,
-                                        ],
-                                    },
-                                    None,
-                                ],
-                            },
-                        },
-                    },
-                    {'$sort': {'priority__sort': -1, 'created_at': 1}},
-                    {'$project': {'priority__sort': 0}},
-                ],
+                [{'$sort': {'sort_keys.fields.priority': -1, 'created_at': 1}}],
             ),
             id='complex_search_and_sort',
         ),
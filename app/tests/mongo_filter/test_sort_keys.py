@@ -0,0 +1,79 @@
+"""Tests for materialized issue sort keys."""
+
+import pytest
+
+__all__ = ()
+
+
+def _link(name: str) -> dict:
+    from beanie import PydanticObjectId
+
+    return {'id': PydanticObjectId(), 'gid': name.lower(), 'name': name}
+
+
+def _user(email: str):
+    from beanie import PydanticObjectId
+
+    import pm.models as m
+
+    return m.UserLinkField(
+        id=PydanticObjectId(),
+        name=email,
+        email=email,
+        is_active=True,
+        use_external_avatar=False,
+    )
+
+
+def test_update_sort_keys():
+    import pm.models as m
+    from pm.models.custom_fields import (
+        EnumCustomFieldValue,
+        IntegerCustomFieldValue,
+        StringCustomFieldValue,
+        UserMultiCustomFieldValue,
+    )
+
+    issue = m.Issue.model_construct(
+        aliases=['OLD-7', 'PRJ-12'],
+        fields=[
+            EnumCustomFieldValue(
+                **_link('Priority'),
+                value=m.EnumOption(id='1', value='High'),
+            ),
+            UserMultiCustomFieldValue(
+                **_link('Assignee Multi'),
+                value=[_user('a@example.com'), _user('b@example.com')],
+            ),
+            IntegerCustomFieldValue(**_link('Estimate'), value=3),
+            StringCustomFieldValue(**_link('String')),
+            IntegerCustomFieldValue(**_link('v1.2'), value=1),
+        ],
+    )
+    issue.update_sort_keys()
+
+    assert issue.sort_keys == {
+        'id': {'slug': 'PRJ', 'num': 12},
+        'fields': {
+            'priority': 'High',
+            'assignee multi': ['a@example.com', 'b@example.com'],
+            'estimate': 3,
+            'string': None,
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    ('aliases', 'expected'),
+    [
+        pytest.param([], {'slug': None, 'num': None}, id='no_aliases'),
+        pytest.param(['PRJ-X'], {'slug': 'PRJ', 'num': None}, id='non_numeric'),
+    ],
+)
+def test_id_sort_keys_without_number(aliases: list[str], expected: dict):
+    import pm.models as m
+
+    issue = m.Issue.model_construct(aliases=aliases, fields=[])
+    issue.update_sort_keys()
+
+    assert issue.sort_keys['id'] == expected
@@ -0,0 +1,52 @@
+"""Tests for the activity log permission filter."""
+
+from unittest import mock
+
+import pytest
+from bson import ObjectId
+
+__all__ = ()
+
+
+@pytest.mark.asyncio
+async def test_readable_issue_filter() -> None:
+    import pm.models as m
+    from pm.api.routes.api.v1 import activity
+
+    project_id, granted_id, hidden_id = ObjectId(), ObjectId(), ObjectId()
+    issue_flt = {'project.id': {'$in': [project_id]}}
+    user_ctx = mock.Mock(
+        get_issue_filter_for_permission=mock.Mock(return_value=issue_flt),
+        get_projects_with_permission=mock.Mock(return_value={project_id}),
+    )
+    collection = mock.Mock(
+        distinct=mock.AsyncMock(side_effect=[[granted_id], [hidden_id]])
+    )
+
+    with (
+        mock.patch.object(activity, 'current_user', return_value=user_ctx),
+        mock.patch.object(m.Issue, 'get_motor_collection', return_value=collection),
+    ):
+        flt = await activity._readable_issue_filter()  # pylint: disable=protected-access
+
+    assert flt == {
+        '$or': [
+            {'project_id': {'$in': [project_id]}, 'issue_id': {'$nin': [hidden_id]}},
+            {'issue_id': {'$in': [granted_id]}},
+        ],
+    }
+    collection.distinct.assert_has_awaits(
+        [
+            mock.call(
+                '_id',
+                {'$and': [issue_flt, {'permissions.0': {'$exists': True}}]},
+            ),
+            mock.call(
+                '_id',
+                {
+                    'project.id': {'$in': [project_id]},
+                    'disable_project_permissions_inheritance': True,
+                },
+            ),
+        ]
+    )
@@ -0,0 +1,42 @@
+"""Tests for the admin workflow stats endpoints."""
+
+from unittest import mock
+
+import pytest
+
+__all__ = ()
+
+
+@pytest.mark.asyncio
+async def test_script_cache_stats() -> None:
+    from pm.api.routes.api.v1.admin import workflow
+
+    stats = {'hits': 3, 'misses': 1, 'evictions': 0, 'size': 1}
+    with mock.patch.object(workflow, 'get_compiled_scripts_stats', return_value=stats):
+        output = await workflow.get_script_cache_stats()
+
+    assert output.payload.model_dump() == stats
+
+
+@pytest.mark.asyncio
+async def test_workflow_latency() -> None:
+    from pm.api.routes.api.v1.admin import workflow
+    from pm.services.workflows import LatencyHistogram
+
+    hist = LatencyHistogram(buckets=(10,))
+    hist.observe(5)
+    hist.observe(20)
+    stats = {'wf-1': {'name': 'Assign', **hist.to_dict()}}
+    with mock.patch.object(workflow, 'get_workflow_latency_stats', return_value=stats):
+        output = await workflow.get_workflow_latency()
+
+    assert [item.model_dump() for item in output.payload] == [
+        {
+            'id': 'wf-1',
+            'name': 'Assign',
+            'buckets': {'10': 1, '+Inf': 1},
+            'count': 2,
+            'total_ms': 25.0,
+            'max_ms': 20.0,
+        },
+    ]
@@ -0,0 +1,75 @@
+"""Tests for the issue feed window query."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+from bson import Binary, ObjectId
+
+__all__ = ()
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+def _collection(name: str, docs: list[dict] | None = None) -> mock.Mock:
+    collection = mock.Mock(aggregate=mock.Mock(return_value=_aiter(docs or [])))
+    collection.name = name
+    return collection
+
+
+@pytest.mark.asyncio
+async def test_feed_window_merges_records_in_window_order() -> None:
+    import pm.models as m
+    from pm.api.routes.api.v1.issue import feed
+
+    issue = SimpleNamespace(id=ObjectId())
+    comment = SimpleNamespace(id=uuid4(), created_at=datetime(2026, 1, 2))
+    record = SimpleNamespace(id=uuid4(), time=datetime(2026, 1, 1))
+    comments = _collection(
+        'issue_comments',
+        [
+            {'_id': Binary.from_uuid(record.id), 'type': 'history'},
+            {'_id': comment.id, 'type': 'comment'},
+        ],
+    )
+
+    with (
+        mock.patch.object(feed, 'bo'),
+        mock.patch.object(
+            m.IssueCommentEntry, 'get_motor_collection', return_value=comments
+        ),
+        mock.patch.object(
+            m.IssueHistoryEntry,
+            'get_motor_collection',
+            return_value=_collection('issue_history'),
+        ),
+        mock.patch.object(
+            m.IssueCommentEntry, 'find', return_value=_aiter([comment])
+        ) as find_comments,
+        mock.patch.object(m.IssueHistoryEntry, 'find', return_value=_aiter([record])),
+        mock.patch.object(m.IssueCommentEntry, 'id', create=True),
+        mock.patch.object(m.IssueHistoryEntry, 'id', create=True),
+    ):
+        window = await feed._feed_window(  # pylint: disable=protected-access
+            issue,
+            [feed.IssueFeedRecordType.COMMENT, feed.IssueFeedRecordType.HISTORY],
+            offset=20,
+            limit=10,
+            reverse=True,
+        )
+
+    assert window == [record, comment]
+    find_comments.assert_called_once()
+    [pipeline] = comments.aggregate.call_args.args
+    assert pipeline[0] == {'$match': {'issue_id': issue.id}}
+    assert pipeline[2]['$unionWith']['coll'] == 'issue_history'
+    assert pipeline[-3:] == [
+        {'$sort': {'time': -1, '_id': -1}},
+        {'$skip': 20},
+        {'$limit': 10},
+    ]
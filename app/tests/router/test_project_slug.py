@@ -0,0 +1,46 @@
+"""Tests for issue aliases following a project slug change."""
+
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from bson import ObjectId
+
+__all__ = ()
+
+
+@pytest.mark.asyncio
+async def test_slug_change_announces_realiased_issues() -> None:
+    import pm.models as m
+    from pm.api.routes.api.v1 import project
+    from pm.utils.events_bus import EventType
+
+    project_id = ObjectId()
+    issues = [SimpleNamespace(id=ObjectId()) for _ in range(3)]
+
+    with (
+        mock.patch.object(
+            m.Issue,
+            'update_project_slug',
+            new_callable=mock.AsyncMock,
+            return_value=issues,
+        ) as update_slug,
+        mock.patch.object(project, 'ALIAS_EVENTS_BATCH_SIZE', 2),
+        mock.patch.object(
+            project, 'issue_event_data', side_effect=lambda issue: issue.id
+        ),
+        mock.patch.object(
+            project, 'send_events', new_callable=mock.AsyncMock
+        ) as send_events,
+    ):
+        await project._update_issue_aliases(project_id, 'OLD', 'NEW')  # pylint: disable=protected-access
+
+    update_slug.assert_awaited_once_with(project_id, 'OLD', 'NEW')
+    batches = [call.args[0] for call in send_events.await_args_list]
+    assert [[event.data for event in batch] for batch in batches] == [
+        [issues[0].id, issues[1].id],
+        [issues[2].id],
+    ]
+    assert {event.type for batch in batches for event in batch} == {
+        EventType.ISSUE_UPDATE,
+    }
@@ -0,0 +1,17 @@
+from unittest import mock
+
+import pytest
+
+__all__ = ()
+
+
+@pytest.fixture(autouse=True)
+def no_related_text_search():
+    """Search transformation tests run without a database to look comments up in."""
+    from pm.services.text_search import SEARCH_BACKEND
+
+    if not hasattr(SEARCH_BACKEND, 'related_search'):
+        yield
+        return
+    with mock.patch.object(SEARCH_BACKEND, 'related_search', None):
+        yield
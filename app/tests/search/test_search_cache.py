@@ -0,0 +1,94 @@
+"""Tests for the compiled search query cache."""
+
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+__all__ = ()
+
+
+def _custom_fields() -> dict:
+    from pm.models import CustomFieldTypeT
+
+    return {'assignee': CustomFieldTypeT.USER, 'state': CustomFieldTypeT.STATE}
+
+
+@pytest.fixture
+def search_module():
+    from pm.api.issue_query import search
+
+    search.compile_search.cache_clear()
+    search.compile_expression.cache_clear()
+    with mock.patch.object(
+        search,
+        'get_custom_fields',
+        new_callable=mock.AsyncMock,
+        return_value=_custom_fields(),
+    ):
+        yield search
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_skips_parsing(search_module) -> None:
+    query = 'State: Open and (Assignee: me or #unresolved foo bar)'
+    with mock.patch.object(
+        search_module.parser, 'parse', wraps=search_module.parser.parse
+    ) as parse:
+        first = await search_module.transform_search(query, 'a@example.com')
+        calls = parse.call_count
+        second = await search_module.transform_search(query, 'a@example.com')
+
+    assert first == second
+    assert parse.call_count == calls
+    assert search_module.compile_search.cache_info().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_user_is_bound_per_call(search_module) -> None:
+    first = await search_module.transform_search('Assignee: me', 'a@example.com')
+    second = await search_module.transform_search('Assignee: me', 'b@example.com')
+
+    assert first['fields']['$elemMatch']['value.email'] == 'a@example.com'
+    assert second['fields']['$elemMatch']['value.email'] == 'b@example.com'
+
+
+@pytest.mark.asyncio
+async def test_relative_dates_are_bound_per_call(search_module) -> None:
+    with mock.patch.object(search_module, 'utcnow') as utcnow:
+        utcnow.return_value = datetime(2024, 2, 20, 12)
+        first = await search_module.transform_search('updated_at: today')
+        utcnow.return_value = datetime(2024, 2, 21, 12)
+        second = await search_module.transform_search('updated_at: today')
+
+    assert first['updated_at']['$gte'] == datetime(2024, 2, 20)
+    assert second['updated_at']['$gte'] == datetime(2024, 2, 21)
+
+
+@pytest.mark.asyncio
+async def test_cached_result_is_not_shared(search_module) -> None:
+    first = await search_module.transform_search('State: Open foo')
+    first['$and'].clear()
+
+    assert await search_module.transform_search('State: Open foo') == {
+        '$and': [
+            {
+                'fields': {
+                    '$elemMatch': {
+                        'name': {'$regex': '^state$', '$options': 'i'},
+                        'value.value': 'Open',
+                    },
+                },
+            },
+            {'$text': {'$search': 'foo'}},
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_parse_errors_are_not_cached(search_module) -> None:
+    for _ in range(2):
+        with pytest.raises(search_module.SearchTransformError):
+            await search_module.transform_search('State: Open)')
+
+    assert search_module.compile_search.cache_info().currsize == 0
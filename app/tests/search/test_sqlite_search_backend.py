@@ -0,0 +1,89 @@
+"""Tests for the SQLite full-text search backend."""
+
+import pytest
+from bson import ObjectId
+
+__all__ = ()
+
+
+def _doc(id_: ObjectId, subject: str, **kwargs):
+    from pm.utils.text_search import SearchDocument
+
+    return SearchDocument(id=str(id_), subject=subject, **kwargs)
+
+
+@pytest.fixture
+def sqlite_backend(tmp_path):
+    from pm.utils.text_search.sqlite import SQLiteSearchBackend
+
+    return SQLiteSearchBackend(str(tmp_path / 'index' / 'issues.db'))
+
+
+def test_fts_query():
+    from pm.utils.text_search.sqlite import fts_query
+
+    assert fts_query('Login PRJ-12') == '"login"* "prj 12"*'
+    assert fts_query('"quoted" OR -- NEAR(x)') == '"quoted"* "or"* "near x"*'
+    assert fts_query(' -- ') == ''
+
+
+@pytest.mark.asyncio
+async def test_prefix_and_multi_term_search(sqlite_backend) -> None:
+    first, second, third = ObjectId(), ObjectId(), ObjectId()
+    await sqlite_backend.index(
+        [
+            _doc(first, 'Login page crashes', aliases=['PRJ-120']),
+            _doc(second, 'Login button', comments=['crash on login']),
+            _doc(third, 'Export report', aliases=['PRJ-1'], text='12 rows'),
+        ],
+    )
+
+    assert set(await sqlite_backend.search('log crash', 10)) == {
+        str(first),
+        str(second),
+    }
+    assert await sqlite_backend.search('prj-12', 10) == [str(first)]
+    assert await sqlite_backend.search('export rows', 10) == [str(third)]
+    assert await sqlite_backend.search('login export', 10) == []
+    assert await sqlite_backend.search(' - ', 10) == []
+    assert len(await sqlite_backend.search('login', 1)) == 1
+    await sqlite_backend.close()
+
+
+@pytest.mark.asyncio
+async def test_alias_match_ranks_first(sqlite_backend) -> None:
+    by_alias, by_text = ObjectId(), ObjectId()
+    await sqlite_backend.index(
+        [
+            _doc(by_text, 'Duplicate', text='web page, see 7'),
+            _doc(by_alias, 'Crash', aliases=['WEB-7']),
+        ],
+    )
+
+    assert await sqlite_backend.search('web-7', 10) == [str(by_alias)]
+    assert await sqlite_backend.search('web', 10) == [str(by_alias), str(by_text)]
+    await sqlite_backend.close()
+
+
+@pytest.mark.asyncio
+async def test_reindex_delete_and_clear(sqlite_backend) -> None:
+    first, second = ObjectId(), ObjectId()
+    await sqlite_backend.index([_doc(first, 'Login page'), _doc(second, 'Export')])
+    await sqlite_backend.index([_doc(first, 'Signup page')])
+
+    assert await sqlite_backend.search('login', 10) == []
+    assert await sqlite_backend.search('page', 10) == [str(first)]
+
+    await sqlite_backend.delete([str(first), str(ObjectId())])
+
+    assert await sqlite_backend.search('signup', 10) == []
+    assert await sqlite_backend.match('export') == {'_id': {'$in': [second]}}
+
+    await sqlite_backend.close()
+    # the index survives reopening
+    assert await sqlite_backend.search('export', 10) == [str(second)]
+
+    await sqlite_backend.clear()
+
+    assert await sqlite_backend.search('export', 10) == []
+    await sqlite_backend.close()
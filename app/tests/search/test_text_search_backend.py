@@ -0,0 +1,228 @@
+"""Tests for pluggable text search backends."""
+
+import asyncio
+from unittest import mock
+
+import pytest
+from bson import ObjectId
+
+__all__ = ()
+
+
+def _doc(id_: ObjectId, subject: str, **kwargs):
+    from pm.utils.text_search import SearchDocument
+
+    return SearchDocument(id=str(id_), subject=subject, **kwargs)
+
+
+@pytest.fixture
+def memory_backend():
+    from pm.utils.text_search.memory import InMemorySearchBackend
+
+    return InMemorySearchBackend()
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_prefix_search(memory_backend) -> None:
+    first, second, third = ObjectId(), ObjectId(), ObjectId()
+    await memory_backend.index(
+        [
+            _doc(first, 'Login page crashes', aliases=['WEB-1']),
+            _doc(second, 'Login button', comments=['crash on login']),
+            _doc(third, 'Export report', text='Crashes on large exports'),
+        ],
+    )
+
+    assert await memory_backend.search('log crash', 10) == [str(second), str(first)]
+    assert await memory_backend.search('web-1', 10) == [str(first)]
+    assert await memory_backend.search('crash', 1) == [str(first)]
+    assert await memory_backend.search('   ', 10) == []
+
+    await memory_backend.delete([str(second), str(ObjectId())])
+
+    assert await memory_backend.search('login', 10) == [str(first)]
+    assert len(memory_backend) == 2
+
+
+@pytest.mark.asyncio
+async def test_indexed_backend_matches_ids(memory_backend) -> None:
+    issue_id = ObjectId()
+    await memory_backend.index([_doc(issue_id, 'Login page')])
+
+    assert await memory_backend.match('login') == {'_id': {'$in': [issue_id]}}
+    assert await memory_backend.match('nothing') == {'_id': {'$in': []}}
+
+
+@pytest.mark.asyncio
+async def test_indexed_backend_rejects_searches_over_the_cap() -> None:
+    from pm.api.issue_query.search import SearchTransformError, resolve_text_search
+    from pm.utils.text_search import TooManyHitsError
+    from pm.utils.text_search.memory import InMemorySearchBackend
+
+    backend = InMemorySearchBackend(max_hits=2)
+    await backend.index([_doc(ObjectId(), 'Login page') for _ in range(2)])
+    assert len((await backend.match('login'))['_id']['$in']) == 2
+
+    await backend.index([_doc(ObjectId(), 'Login button')])
+    with pytest.raises(TooManyHitsError):
+        await backend.match('login')
+    with pytest.raises(SearchTransformError, match='more than 2 issues'):
+        await resolve_text_search({'$text': {'$search': 'login'}}, backend=backend)
+
+
+@pytest.mark.asyncio
+async def test_resolve_text_search_with_indexed_backend(memory_backend) -> None:
+    from pm.api.issue_query.search import resolve_text_search
+
+    first, second = ObjectId(), ObjectId()
+    await memory_backend.index([_doc(first, 'Login page'), _doc(second, 'Export')])
+    query = {
+        '$or': [
+            {'$text': {'$search': 'login'}},
+            {'$and': [{'subject': 'x'}, {'$text': {'$search': 'export'}}]},
+        ],
+    }
+
+    assert await resolve_text_search(query, backend=memory_backend) == {
+        '$or': [
+            {'_id': {'$in': [first]}},
+            {'$and': [{'subject': 'x'}, {'_id': {'$in': [second]}}]},
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_resolve_text_search_with_mongo_backend() -> None:
+    from pm.api.issue_query.search import SearchTransformError, resolve_text_search
+    from pm.utils.text_search.mongo import MongoSearchBackend
+
+    backend = MongoSearchBackend()
+    query = {'$and': [{'subject': 'x'}, {'$text': {'$search': 'login'}}]}
+
+    assert await resolve_text_search(query, backend=backend) == query
+    with pytest.raises(SearchTransformError):
+        await resolve_text_search(
+            {'$or': [query, {'$text': {'$search': 'export'}}]},
+            backend=backend,
+        )
+
+
+@pytest.mark.asyncio
+async def test_mongo_backend_matches_related_texts() -> None:
+    from pm.utils.text_search.mongo import MongoSearchBackend
+
+    commented = ObjectId()
+    related_search = mock.AsyncMock(side_effect=[[commented], []])
+    backend = MongoSearchBackend(related_search=related_search)
+
+    assert await backend.match('login') == {
+        '$or': [{'$text': {'$search': 'login'}}, {'_id': {'$in': [commented]}}],
+    }
+    assert await backend.match('export') == {'$text': {'$search': 'export'}}
+    related_search.assert_has_awaits([mock.call('login'), mock.call('export')])
+
+
+def test_encrypted_texts_are_not_indexed():
+    import pm.models as m
+    from pm.services.text_search import issue_search_document
+
+    issue_id = ObjectId()
+    issue = m.Issue.model_construct(
+        id=issue_id,
+        subject='Subject',
+        text='ciphertext',
+        encryption=[mock.Mock()],
+        aliases=['PRJ-1'],
+        attachments=[
+            m.IssueAttachment.model_construct(ocr_text='scanned'),
+            m.IssueAttachment.model_construct(ocr_text=None),
+        ],
+    )
+    comments = [
+        m.IssueComment.model_construct(text='plain', encryption=None),
+        m.IssueComment.model_construct(text='cipher', encryption=[mock.Mock()]),
+    ]
+
+    assert issue_search_document(issue, comments) == _doc(
+        issue_id,
+        'Subject',
+        aliases=['PRJ-1'],
+        comments=['plain'],
+        attachments=['scanned'],
+    )
+
+
+@pytest.mark.asyncio
+async def test_indexer_indexes_and_acks_events(memory_backend) -> None:
+    from pm.services import text_search
+    from pm.utils.events_bus import Event, EventType
+
+    issue_id = str(ObjectId())
+    event = Event(type=EventType.ISSUE_UPDATE, data={'issue_id': issue_id})
+    entries = [
+        (b'1-0', {b'msg': event._to_bus_msg()}),  # pylint: disable=protected-access
+        (b'2-0', None),
+    ]
+    client = mock.AsyncMock()
+    indexer = text_search.SearchIndexer('redis://', backend=memory_backend)
+
+    with mock.patch.object(text_search, 'index_issues') as index_issues:
+        await indexer.process(client, entries)
+
+    index_issues.assert_awaited_once_with({issue_id}, backend=memory_backend)
+    client.xack.assert_awaited_once_with(
+        text_search.EVENTS_STREAM, text_search.INDEXER_GROUP, b'1-0', b'2-0'
+    )
+
+
+@pytest.mark.asyncio
+async def test_indexer_restarts_after_errors(memory_backend) -> None:
+    from pymongo.errors import AutoReconnect
+
+    from pm.services import text_search
+
+    indexer = text_search.SearchIndexer('redis://', backend=memory_backend)
+    with (
+        mock.patch.object(
+            text_search.aioredis, 'from_url', return_value=mock.AsyncMock()
+        ),
+        mock.patch.object(
+            indexer,
+            'ensure_group',
+            side_effect=[AutoReconnect(), ValueError(), asyncio.CancelledError()],
+        ),
+        mock.patch.object(
+            text_search.asyncio, 'sleep', new_callable=mock.AsyncMock
+        ) as sleep,
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await indexer.run()
+
+    assert [c.args[0] for c in sleep.await_args_list] == [
+        text_search.RECONNECT_DELAY,
+        text_search.RECONNECT_DELAY * 2,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_indexer_removes_stale_consumers(memory_backend) -> None:
+    from pm.services import text_search
+
+    idle = text_search.CONSUMER_MAX_IDLE_MS + 1
+    client = mock.AsyncMock()
+    client.xautoclaim.return_value = [b'0-0', [], []]
+    client.xinfo_consumers.return_value = [
+        {'name': b'host-1', 'pending': 0, 'idle': idle},
+        {'name': b'host-2', 'pending': 1, 'idle': idle},
+        {'name': b'host-3', 'pending': 0, 'idle': 10},
+        {'name': b'host-4', 'pending': 0, 'idle': idle},
+    ]
+    indexer = text_search.SearchIndexer(
+        'redis://', backend=memory_backend, consumer='host-4'
+    )
+
+    await indexer.claim_stale(client)
+
+    client.xgroup_delconsumer.assert_awaited_once_with(
+        text_search.EVENTS_STREAM, text_search.INDEXER_GROUP, 'host-1'
+    )
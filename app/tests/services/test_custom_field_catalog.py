@@ -0,0 +1,130 @@
+"""Tests for the custom field catalog."""
+
+from unittest import mock
+
+import pytest
+
+__all__ = ()
+
+
+def _field(name: str, gid: str, type_: str):
+    from beanie import PydanticObjectId
+
+    import pm.models as m
+
+    return m.CustomField.model_construct(
+        id=PydanticObjectId(),
+        name=name,
+        gid=gid,
+        type=m.CustomFieldTypeT(type_),
+    )
+
+
+def test_catalog_indexes():
+    from pm.services.custom_field_catalog import CustomFieldCatalog
+
+    state_a = _field('State', 'state', 'state')
+    state_b = _field('State', 'state', 'state')
+    priority = _field('Priority', 'priority', 'enum')
+    catalog = CustomFieldCatalog([state_a, state_b, priority])
+
+    assert catalog.get(priority.id) is priority
+    assert catalog.group('state') == [state_a, state_b]
+    assert catalog.group('missing') == []
+    assert catalog.group_field('state') is state_a
+    assert catalog.groups() == {'state': state_a, 'priority': priority}
+    assert catalog.by_name['priority'] == [priority]
+    assert catalog.types == {'state': 'state', 'priority': 'enum'}
+
+
+@pytest.mark.asyncio
+async def test_catalog_is_reused_until_invalidated():
+    from pm.cache import CacheTag
+    from pm.services import custom_field_catalog as cfc
+    from pm.utils.cache import LocalCache
+
+    local = LocalCache()
+    load = mock.AsyncMock(side_effect=lambda: cfc.CustomFieldCatalog([]))
+    with (
+        mock.patch.object(cfc, 'get_local_cache', return_value=local),
+        mock.patch.object(cfc, '_load', load),
+    ):
+        first = await cfc.get_custom_field_catalog()
+        local.invalidate_tags([CacheTag.GROUPS], generation=1)
+        assert await cfc.get_custom_field_catalog() is first
+        local.invalidate_tags([CacheTag.CUSTOM_FIELDS], generation=2)
+        second = await cfc.get_custom_field_catalog()
+
+    assert second is not first
+    assert load.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_catalog_is_kept_briefly_without_invalidations():
+    from pm.services import custom_field_catalog as cfc
+    from pm.utils.cache import LocalCache
+
+    local = LocalCache()
+    local.active = False
+    load = mock.AsyncMock(side_effect=lambda: cfc.CustomFieldCatalog([]))
+    for local_ in (None, local):
+        with (
+            mock.patch.object(cfc, 'get_local_cache', return_value=local_),
+            mock.patch.object(cfc, '_load', load),
+            mock.patch.object(cfc, '_FALLBACK', None),
+            mock.patch.object(cfc.time, 'monotonic', return_value=100.0) as now,
+        ):
+            first = await cfc.get_custom_field_catalog()
+            assert await cfc.get_custom_field_catalog() is first
+            now.return_value += cfc.FALLBACK_TTL
+            assert await cfc.get_custom_field_catalog() is not first
+
+    assert load.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_embedded_link_updates_invalidate_catalog():
+    from types import SimpleNamespace
+
+    from beanie import PydanticObjectId
+
+    import pm.models as m
+    from pm.cache import CacheTag
+    from pm.models.custom_fields import _base, user_cf
+
+    user = SimpleNamespace(
+        id=PydanticObjectId(),
+        name='User',
+        email='user@example.com',
+        is_active=True,
+        use_external_avatar=False,
+    )
+    group = SimpleNamespace(id=PydanticObjectId(), name='Group', description=None)
+    calls = [
+        (m.OwnedCustomField, 'update_user_embedded_links', user),
+        (m.OwnedMultiCustomField, 'update_user_embedded_links', user),
+        (m.UserCustomField, 'update_user_embedded_links', user),
+        (m.UserCustomField, 'update_group_embedded_links', group),
+        (m.UserCustomField, 'remove_group_embedded_links', group.id),
+    ]
+    for model, method, arg in calls:
+        for modified_count in (0, 1):
+            query = mock.Mock(
+                update=mock.AsyncMock(
+                    return_value=mock.Mock(modified_count=modified_count)
+                ),
+            )
+            with (
+                mock.patch.object(model, 'find', return_value=query, create=True),
+                mock.patch.object(model, 'options', mock.MagicMock(), create=True),
+                mock.patch.object(user_cf, 'GroupLinkField'),
+                mock.patch.object(
+                    _base, 'invalidate_cache_tags', new_callable=mock.AsyncMock
+                ) as invalidate,
+            ):
+                await getattr(model, method)(arg)
+
+            if modified_count:
+                invalidate.assert_awaited_once_with(CacheTag.CUSTOM_FIELDS)
+            else:
+                invalidate.assert_not_awaited()
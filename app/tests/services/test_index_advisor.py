@@ -0,0 +1,128 @@
+"""Tests for the custom field index advisor."""
+
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+__all__ = ()
+
+
+def _field_filter(name: str, **condition) -> dict:
+    return {
+        'fields': {
+            '$elemMatch': {
+                'name': {'$regex': f'^{name}$', '$options': 'i'},
+                **condition,
+            },
+        },
+    }
+
+
+def test_extract_field_predicates():
+    from pm.services.index_advisor import FieldPredicate, extract_field_predicates
+
+    query = {
+        '$and': [
+            {'$or': [_field_filter('state', **{'value.value': 'open'})]},
+            _field_filter('assignee', **{'value.email': 'user@example.com'}),
+            _field_filter('due date', value={'$gte': datetime(2024, 1, 1)}),
+            _field_filter('state', **{'value.value': 'closed'}),
+            {'project.slug': {'$regex': '^prj$', '$options': 'i'}},
+            {'fields': {'$size': 0}},
+        ],
+    }
+
+    assert extract_field_predicates(query) == {
+        FieldPredicate('state', 'value.value', '$eq'),
+        FieldPredicate('assignee', 'value.email', '$eq'),
+        FieldPredicate('due date', 'value', 'range'),
+    }
+    assert extract_field_predicates({'subject': 'x'}) == set()
+
+
+def test_observe_search_sampling():
+    from pm.services import index_advisor
+
+    recorder = mock.Mock()
+    query = _field_filter('state', **{'value.value': 'open'})
+    with (
+        mock.patch.object(index_advisor, '_RECORDER', recorder),
+        mock.patch.object(index_advisor, 'CONFIG') as config,
+    ):
+        config.INDEX_ADVISOR_SAMPLE_RATE = 0.0
+        index_advisor.observe_search(query)
+        recorder.record.assert_not_called()
+
+        config.INDEX_ADVISOR_SAMPLE_RATE = 1.0
+        index_advisor.observe_search({'subject': 'x'})
+        index_advisor.observe_search(query)
+        recorder.record.assert_called_once_with(
+            {index_advisor.FieldPredicate('state', 'value.value', '$eq')},
+        )
+
+
+@pytest.mark.asyncio
+async def test_recorder_flush_counts_per_group() -> None:
+    from pm.services import index_advisor
+
+    catalog = mock.Mock()
+    catalog.by_name = {
+        'state': [mock.Mock(gid='g1'), mock.Mock(gid='g2'), mock.Mock(gid='g1')],
+    }
+    collection = mock.Mock(bulk_write=mock.AsyncMock())
+    state = index_advisor.FieldPredicate('state', 'value.value', '$eq')
+    missing = index_advisor.FieldPredicate('gone', 'value', '$eq')
+    recorder = index_advisor.UsageRecorder()
+    recorder.record({state, missing})
+    recorder.record({state})
+
+    with (
+        mock.patch.object(
+            index_advisor,
+            'get_custom_field_catalog',
+            new_callable=mock.AsyncMock,
+            return_value=catalog,
+        ),
+        mock.patch.object(
+            index_advisor.m.QueryFieldUsage,
+            'get_motor_collection',
+            return_value=collection,
+        ),
+    ):
+        assert await recorder.flush() == 2
+        assert await recorder.flush() == 0
+
+    [updates] = collection.bulk_write.await_args.args
+    assert [(u._filter, u._doc['$inc']) for u in updates] == [  # pylint: disable=protected-access
+        ({'gid': 'g1', 'path': 'value.value', 'operator': '$eq'}, {'uses': 2}),
+        ({'gid': 'g2', 'path': 'value.value', 'operator': '$eq'}, {'uses': 2}),
+    ]
+    assert not recorder.counts
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+@pytest.mark.asyncio
+async def test_estimate_selectivity() -> None:
+    from pm.services import index_advisor
+
+    collection = mock.Mock(
+        estimated_document_count=mock.AsyncMock(return_value=100),
+        aggregate=mock.Mock(
+            return_value=_aiter([{'_id': 'open', 'n': 30}, {'_id': 'closed', 'n': 10}]),
+        ),
+    )
+    with mock.patch.object(
+        index_advisor.m.Issue, 'get_motor_collection', return_value=collection
+    ):
+        issues, distinct, selectivity = await index_advisor.estimate_selectivity(
+            'g1', 'value.value'
+        )
+
+    assert (issues, distinct) == (40, 2)
+    # (30 * 30 + 10 * 10) / 40 expected matches out of 100 sampled issues
+    assert selectivity == pytest.approx(0.25)
@@ -0,0 +1,107 @@
+"""Tests for issue history and comment bookkeeping."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from bson import ObjectId
+
+__all__ = ()
+
+
+def _author() -> SimpleNamespace:
+    return SimpleNamespace(
+        id=ObjectId(),
+        name='User',
+        email='user@example.com',
+        is_active=True,
+        use_external_avatar=False,
+    )
+
+
+def test_gen_history_record_updates_counters():
+    import pm.models as m
+
+    issue = m.Issue.model_construct(
+        id=ObjectId(),
+        subject='New',
+        text=None,
+        fields=[],
+        history_count=2,
+        last_history_at=None,
+    )
+    time = datetime(2026, 1, 1)
+
+    with (
+        mock.patch.object(m.Issue, '_fields_diff', return_value={}),
+        mock.patch.object(m.Issue, '_params_diff', return_value={}),
+    ):
+        assert issue.gen_history_record(_author(), time) is None
+    assert issue.history_count == 2
+
+    with (
+        mock.patch.object(m.Issue, '_fields_diff', return_value={}),
+        mock.patch.object(
+            m.Issue, '_params_diff', return_value={'subject': ('Old', 'New')}
+        ),
+    ):
+        record = issue.gen_history_record(_author(), time)
+
+    assert record.time == time
+    assert [(c.field, c.old_value, c.new_value) for c in record.changes] == [
+        ('subject', 'Old', 'New'),
+    ]
+    assert (issue.history_count, issue.last_history_at) == (3, time)
+
+
+def test_comment_counters():
+    import pm.models as m
+
+    issue = m.Issue.model_construct(comments_count=0, last_comment_at=None)
+    created_at = datetime(2026, 1, 1)
+
+    issue.comment_added(m.IssueComment.model_construct(created_at=created_at))
+    issue.comment_deleted()
+    issue.comment_deleted()
+
+    assert (issue.comments_count, issue.last_comment_at) == (0, created_at)
+
+
+@pytest.mark.asyncio
+async def test_option_rename_updates_history_and_activities() -> None:
+    import pm.models as m
+
+    field = SimpleNamespace(id=ObjectId(), type=m.CustomFieldTypeT.ENUM_MULTI)
+    option = SimpleNamespace(id='opt')
+    finds = {
+        model: mock.Mock(return_value=mock.Mock(update=mock.AsyncMock()))
+        for model in (m.Issue, m.IssueHistoryEntry, m.IssueActivity)
+    }
+    with (
+        mock.patch.object(m.Issue, 'find', finds[m.Issue], create=True),
+        mock.patch.object(
+            m.IssueHistoryEntry, 'find', finds[m.IssueHistoryEntry], create=True
+        ),
+        mock.patch.object(m.IssueActivity, 'find', finds[m.IssueActivity], create=True),
+        mock.patch.object(m.Issue, 'refresh_sort_keys', new_callable=mock.AsyncMock),
+    ):
+        await m.Issue.update_field_option_embedded_links(field, option)
+
+    for model in (m.IssueHistoryEntry, m.IssueActivity):
+        [query] = finds[model].call_args.args
+        assert query['changes']['$elemMatch']['field.id'] == field.id
+        update = finds[model].return_value.update
+        update.assert_awaited_once_with(
+            {
+                '$set': {
+                    'changes.$[o].old_value.$[v]': option,
+                    'changes.$[n].new_value.$[v]': option,
+                },
+            },
+            array_filters=[
+                {'o.field.id': field.id, 'o.old_value.id': 'opt'},
+                {'n.field.id': field.id, 'n.new_value.id': 'opt'},
+                {'v.id': 'opt'},
+            ],
+        )
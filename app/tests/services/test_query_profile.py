@@ -0,0 +1,159 @@
+"""Tests for query plan summaries and slow query capture."""
+
+import asyncio
+from datetime import datetime
+from unittest import mock
+
+import pytest
+from bson import ObjectId
+
+__all__ = ()
+
+CLASSIC_AGGREGATE_EXPLAIN = {
+    'stages': [
+        {
+            '$cursor': {
+                'queryPlanner': {
+                    'winningPlan': {
+                        'stage': 'FETCH',
+                        'inputStage': {
+                            'stage': 'IXSCAN',
+                            'indexName': 'fields_gid_value_index',
+                        },
+                    },
+                    'rejectedPlans': [
+                        {'stage': 'COLLSCAN'},
+                        {'stage': 'IXSCAN', 'indexName': 'project_id_index'},
+                    ],
+                },
+                'executionStats': {
+                    'nReturned': 12,
+                    'executionTimeMillis': 7,
+                    'totalKeysExamined': 40,
+                    'totalDocsExamined': 30,
+                },
+            },
+        },
+        {'$sort': {'sortKey': {'updated_at': -1}}},
+    ],
+}
+
+SBE_FIND_EXPLAIN = {
+    'queryPlanner': {
+        'winningPlan': {
+            'queryPlan': {'stage': 'COLLSCAN'},
+            'slotBasedPlan': {'stages': '[1] scan s1 s2'},
+        },
+        'rejectedPlans': [],
+    },
+    'executionStats': {
+        'nReturned': 3,
+        'executionTimeMillis': 120,
+        'totalKeysExamined': 0,
+        'totalDocsExamined': 50_000,
+    },
+}
+
+
+def test_summarize_classic_aggregate_plan():
+    from pm.services.query_profile import QueryPlan, summarize_plan
+
+    assert summarize_plan(CLASSIC_AGGREGATE_EXPLAIN) == QueryPlan(
+        indexes=['fields_gid_value_index'],
+        collection_scan=False,
+        docs_examined=30,
+        keys_examined=40,
+        returned=12,
+        execution_time_ms=7,
+    )
+
+
+def test_summarize_sbe_plan():
+    from pm.services.query_profile import QueryPlan, summarize_plan
+
+    assert summarize_plan(SBE_FIND_EXPLAIN) == QueryPlan(
+        indexes=[],
+        collection_scan=True,
+        docs_examined=50_000,
+        keys_examined=0,
+        returned=3,
+        execution_time_ms=120,
+    )
+
+
+def test_to_json_compatible():
+    from pm.services.query_profile import to_json_compatible
+
+    oid = ObjectId()
+    assert to_json_compatible(
+        {'_id': oid, 'updated_at': {'$gte': datetime(2024, 2, 20)}},
+    ) == {
+        '_id': {'$oid': str(oid)},
+        'updated_at': {'$gte': {'$date': '2024-02-20T00:00:00Z'}},
+    }
+
+
+@pytest.fixture
+def profile_module():
+    from pm.services import query_profile
+
+    query_profile.clear_slow_queries()
+    with (
+        mock.patch.object(query_profile, 'CONFIG') as config,
+        mock.patch.object(
+            query_profile,
+            'explain_query',
+            new_callable=mock.AsyncMock,
+            return_value=SBE_FIND_EXPLAIN,
+        ),
+    ):
+        config.SLOW_QUERY_THRESHOLD_MS = 100.0
+        config.SLOW_QUERY_SAMPLE_RATE = 1.0
+        yield query_profile
+    query_profile.clear_slow_queries()
+
+
+def _find_query() -> mock.Mock:
+    q = mock.Mock()
+    q.get_filter_query.return_value = {'subject': 'foo'}
+    return q
+
+
+async def _wait_pending(module) -> None:
+    # pylint: disable=protected-access
+    await asyncio.gather(*module._PENDING)
+
+
+@pytest.mark.asyncio
+async def test_fast_query_is_not_captured(profile_module) -> None:
+    profile_module.observe_query('issue_list', 'foo', _find_query(), [], 99.0)
+    await _wait_pending(profile_module)
+
+    assert profile_module.get_slow_queries() == []
+    profile_module.explain_query.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_slow_query_is_captured_with_plan(profile_module) -> None:
+    pipeline = [{'$sort': {'updated_at': -1}}, {'$limit': 50}]
+    profile_module.observe_query('issue_list', 'foo', _find_query(), pipeline, 250.0)
+    await _wait_pending(profile_module)
+
+    [captured] = profile_module.get_slow_queries()
+    assert captured.source == 'issue_list'
+    assert captured.query == 'foo'
+    assert captured.duration_ms == 250.0
+    assert captured.filter == {'subject': 'foo'}
+    assert captured.pipeline == pipeline
+    assert captured.plan.collection_scan
+    assert captured.plan.docs_examined == 50_000
+    assert captured.error is None
+
+
+@pytest.mark.asyncio
+async def test_capture_disabled(profile_module) -> None:
+    profile_module.CONFIG.SLOW_QUERY_THRESHOLD_MS = 0.0
+    profile_module.observe_query('issue_list', 'foo', _find_query(), [], 1000.0)
+    await _wait_pending(profile_module)
+
+    assert profile_module.get_slow_queries() == []
@@ -0,0 +1,70 @@
+"""Tests for targeted document updates."""
+
+from pm.utils.document import diff_update
+
+__all__ = ()
+
+
+def test_changed_values_are_set_at_their_path():
+    old = {
+        'subject': 'Old',
+        'fields': [
+            {'id': 1, 'value': {'value': 'open', 'color': None}},
+            {'id': 2, 'value': None},
+        ],
+        'sort_keys': {'fields': {'state': 'open'}},
+    }
+    new = {
+        'subject': 'New',
+        'fields': [
+            {'id': 1, 'value': {'value': 'closed', 'color': None}},
+            {'id': 2, 'value': 'x'},
+        ],
+        'sort_keys': {'fields': {'state': 'closed', 'priority': 'high'}},
+    }
+
+    assert diff_update(old, new) == {
+        '$set': {
+            'subject': 'New',
+            'fields.0.value.value': 'closed',
+            'fields.1.value': 'x',
+            'sort_keys.fields.state': 'closed',
+            'sort_keys.fields.priority': 'high',
+        },
+    }
+
+
+def test_appended_items_are_pushed():
+    old = {'tags': [{'id': 1}], 'subscribers': [], 'aliases': ['A-1']}
+    new = {'tags': [{'id': 1}, {'id': 2}], 'subscribers': [3], 'aliases': ['A-1']}
+
+    assert diff_update(old, new) == {
+        '$push': {'tags': {'$each': [{'id': 2}]}, 'subscribers': {'$each': [3]}},
+    }
+
+
+def test_removed_and_reordered_values_replace_the_parent():
+    old = {
+        'tags': [{'id': 1}, {'id': 2}],
+        'sort_keys': {'fields': {'state': 'open', 'a.b': 1}},
+        'meta': {'x': 1, 'y': 2},
+        'text': None,
+    }
+    new = {
+        'tags': [{'id': 2}],
+        'sort_keys': {'fields': {'state': 'open', 'a.b': 2}},
+        'meta': {'x': 1},
+        'text': {'value': 'x'},
+        'added': 1,
+    }
+
+    assert diff_update(old, new) == {
+        '$set': {
+            'tags': [{'id': 2}],
+            'sort_keys.fields': {'state': 'open', 'a.b': 2},
+            'meta': {'x': 1},
+            'text': {'value': 'x'},
+            'added': 1,
+        },
+    }
+    assert diff_update(old, old) == {}
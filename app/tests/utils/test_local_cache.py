@@ -0,0 +1,127 @@
+"""Tests for the in-process cache tier."""
+
+from unittest import mock
+
+import pytest
+
+from pm.utils.cache import CacheRegistry, LocalCache, cached
+from pm.utils.cache.local import MISSING
+
+__all__ = ()
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_expiration():
+    clock = _Clock()
+    cache = LocalCache(clock=clock)
+    cache.set('key', {'value'}, ttl=10)
+
+    assert cache.get('key') == {'value'}
+    clock.now = 10
+    assert cache.get('key') is MISSING
+
+
+def test_lru_eviction():
+    cache = LocalCache(max_size=2)
+    cache.set('a', 1, ttl=10)
+    cache.set('b', 2, ttl=10)
+    cache.get('a')
+    cache.set('c', 3, ttl=10)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is MISSING
+    assert cache.get('c') == 3
+
+
+def test_tag_invalidation_drops_tagged_entries():
+    cache = LocalCache()
+    version = cache.version()
+    cache.set('groups', 1, ttl=10, tags=['groups'])
+    cache.set('tags', 2, ttl=10, tags=['tags', 'groups'])
+    cache.set('projects', 3, ttl=10, tags=['projects'])
+
+    assert cache.invalidate_tags(['groups'], generation=1) == 2
+    assert cache.get('groups') is MISSING
+    assert cache.get('tags') is MISSING
+    assert cache.get('projects') == 3
+    # value computed before the invalidation is not stored
+    cache.set('groups', 1, ttl=10, tags=['groups'], version=version)
+    assert cache.get('groups') is MISSING
+    cache.set('other', 4, ttl=10, tags=['projects'], version=version)
+    assert cache.get('other') == 4
+
+
+def test_generation_gap_drops_entries():
+    cache = LocalCache()
+    cache.set('a', 1, ttl=10, tags=['projects'])
+    cache.invalidate_tags(['groups'], generation=1)
+    # own broadcast received back
+    cache.invalidate_tags(['groups'], generation=1)
+    assert cache.get('a') == 1
+
+    version = cache.version()
+    cache.invalidate_tags(['groups'], generation=3)
+    assert cache.get('a') is MISSING
+    cache.set('a', 1, ttl=10, tags=['projects'], version=version)
+    assert cache.get('a') is MISSING
+
+
+def test_cached_values_are_frozen():
+    cache = LocalCache()
+    value = cache.set('a', {'p': {'read'}}, ttl=10)
+
+    assert cache.get('a') is value
+    assert value['p'] == frozenset({'read'})
+    with pytest.raises(TypeError):
+        value['q'] = set()
+    with pytest.raises(AttributeError):
+        value['p'].add('write')
+
+
+def test_inactive_cache_is_bypassed():
+    cache = LocalCache()
+    cache.active = False
+    cache.set('a', 1, ttl=10)
+    cache.active = True
+
+    assert cache.get('a') is MISSING
+
+
+@pytest.mark.asyncio
+async def test_cached_uses_local_tier():
+    provider = mock.Mock(
+        spec=['get', 'set', 'local'],
+        get=mock.AsyncMock(return_value=None),
+        set=mock.AsyncMock(),
+        local=LocalCache(),
+    )
+    registry = CacheRegistry()
+    registry.set_provider(provider)
+    calls = []
+
+    @cached(
+        registry=registry,
+        local_ttl=60,
+        serializer=sorted,
+        deserializer=set,
+        key_builder=lambda _func, args, _kwargs: f'key:{args[0]}',
+    )
+    async def resolve(user_id: str) -> set[str]:
+        calls.append(user_id)
+        return {user_id}
+
+    first = await resolve('u1')
+    assert first == {'u1'}
+    assert await resolve('u1') is first
+    assert isinstance(first, frozenset)
+
+    assert calls == ['u1']
+    provider.get.assert_awaited_once()
+    provider.set.assert_awaited_once()
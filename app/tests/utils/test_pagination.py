@@ -0,0 +1,204 @@
+"""Tests for keyset pagination helpers."""
+
+import datetime as dt
+from functools import cmp_to_key
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from bson import ObjectId
+from pydantic import BaseModel
+
+from pm.api.utils.pagination import (
+    CountMode,
+    InvalidCursorError,
+    count_documents,
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+    keyset_pipeline,
+    next_cursor,
+)
+
+__all__ = ()
+
+
+class _Item(BaseModel):
+    name: str
+
+
+def _matches(doc: dict, query: dict) -> bool:
+    for key, cond in query.items():
+        if key == '$or':
+            if not any(_matches(doc, sub) for sub in cond):
+                return False
+            continue
+        if key == '$and':
+            if not all(_matches(doc, sub) for sub in cond):
+                return False
+            continue
+        value = doc.get(key)
+        if not isinstance(cond, dict):
+            if value != cond:
+                return False
+            continue
+        for op, arg in cond.items():
+            if op == '$ne' and value == arg:
+                return False
+            if op == '$gt' and (value is None or not value > arg):
+                return False
+            if op == '$lt' and (value is None or not value < arg):
+                return False
+    return True
+
+
+def _sorted(docs: list[dict], sort: dict[str, int]) -> list[dict]:
+    def cmp(a: dict, b: dict) -> int:
+        for field, direction in sort.items():
+            va, vb = a.get(field), b.get(field)
+            if va == vb:
+                continue
+            # nulls sort first in ascending order
+            if va is None:
+                return -direction
+            if vb is None:
+                return direction
+            return direction if va > vb else -direction
+        return 0
+
+    return sorted(docs, key=cmp_to_key(cmp))
+
+
+def _run(docs: list[dict], pipeline: list[dict]) -> list[dict]:
+    for stage in pipeline:
+        if '$match' in stage:
+            docs = [doc for doc in docs if _matches(doc, stage['$match'])]
+        elif '$sort' in stage:
+            docs = _sorted(docs, stage['$sort'])
+        elif '$skip' in stage:
+            docs = docs[stage['$skip'] :]
+        elif '$limit' in stage:
+            docs = docs[: stage['$limit']]
+    return docs
+
+
+def test_cursor_roundtrip():
+    values = [dt.datetime(2025, 1, 2, 3, 4, 5), None, 'x', ObjectId()]
+    assert decode_cursor(encode_cursor(values), 4) == values
+
+
+@pytest.mark.parametrize('cursor', ['garbage', encode_cursor([1, 2])])
+def test_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, 3)
+
+
+def test_id_tiebreaker_and_projection():
+    pipeline, sort = keyset_pipeline(
+        [{'$addFields': {'x': 1}}, {'$sort': {'x': 1}}, {'$project': {'x': 0}}],
+        _Item,
+        limit=10,
+        offset=5,
+    )
+    assert sort == {'x': 1, '_id': 1}
+    assert pipeline == [
+        {'$addFields': {'x': 1}},
+        {'$sort': {'x': 1, '_id': 1}},
+        {'$skip': 5},
+        {'$limit': 10},
+        {'$project': {'name': 1, 'x': 1, '_id': 1}},
+    ]
+
+
+@pytest.mark.parametrize('direction', [1, -1])
+def test_pages_cover_all_documents_once(direction):
+    docs = [
+        {'_id': ObjectId(), 'rank': rank, 'name': str(idx)}
+        for idx, rank in enumerate([3, None, 1, 3, None, 2, 1, 3, None, 2, 2])
+    ]
+    sort_pipeline = [{'$sort': {'rank': direction}}]
+    expected = _run(docs, keyset_pipeline(sort_pipeline, _Item, limit=100)[0])
+
+    seen, cursor = [], None
+    while True:
+        pipeline, sort = keyset_pipeline(sort_pipeline, _Item, limit=3, cursor=cursor)
+        page = _run(docs, pipeline)
+        seen += page
+        if not (cursor := next_cursor(page, sort, 3)):
+            break
+    assert [doc['_id'] for doc in seen] == [doc['_id'] for doc in expected]
+
+
+def test_count_mode_parse():
+    assert CountMode.parse('exact') == CountMode('exact')
+    assert CountMode.parse('capped:100') == CountMode('capped', 100)
+    with pytest.raises(ValueError, match='Invalid count mode'):
+        CountMode.parse('capped:0')
+
+
+def _query(flt: dict, matched: int) -> SimpleNamespace:
+    async def count_documents_(_flt, limit=0):
+        return min(matched, limit) if limit else matched
+
+    collection = SimpleNamespace(
+        count_documents=mock.AsyncMock(side_effect=count_documents_),
+        estimated_document_count=mock.AsyncMock(return_value=1000),
+    )
+    return SimpleNamespace(
+        count=mock.AsyncMock(return_value=matched),
+        get_filter_query=lambda: flt,
+        document_model=SimpleNamespace(get_motor_collection=lambda: collection),
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('mode', 'flt', 'matched', 'expected'),
+    [
+        ('exact', {'a': 1}, 50, (50, True)),
+        ('none', {'a': 1}, 50, (None, False)),
+        ('capped:10', {'a': 1}, 50, (10, False)),
+        ('capped:100', {'a': 1}, 50, (50, True)),
+        ('estimated', {}, 50, (1000, False)),
+        ('estimated', {'a': 1}, 50_000, (10_000, False)),
+    ],
+)
+async def test_count_documents(mode, flt, matched, expected):
+    assert (
+        await count_documents(_query(flt, matched), CountMode.parse(mode)) == expected
+    )
+
+
+def _aggregate(result: list[dict]) -> mock.Mock:
+    return mock.Mock(
+        return_value=SimpleNamespace(to_list=mock.AsyncMock(return_value=result)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_exact_count_runs_page_query() -> None:
+    q = _query({'a': 1}, 50)
+    q.aggregate = _aggregate([{'_id': 1}, {'_id': 2}])
+    page = [{'$sort': {'_id': 1}}, {'$limit': 2}]
+
+    assert await fetch_page(q, page, CountMode.parse('exact')) == (
+        [{'_id': 1}, {'_id': 2}],
+        50,
+        True,
+    )
+    q.aggregate.assert_called_once_with(page)
+    q.count.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_capped_count_runs_page_query() -> None:
+    q = _query({'a': 1}, 50)
+    q.aggregate = _aggregate([{'_id': 1}])
+    page = [{'$limit': 1}]
+
+    assert await fetch_page(q, page, CountMode.parse('capped:10')) == (
+        [{'_id': 1}],
+        10,
+        False,
+    )
+    q.aggregate.assert_called_once_with(page)
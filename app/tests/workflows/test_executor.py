@@ -0,0 +1,92 @@
+"""Tests for the on-change workflows executor."""
+
+import pytest
+
+__all__ = ()
+
+VALIDATOR = """
+import asyncio
+
+from pm.workflows import OnChangeWorkflowScript, WorkflowError
+
+
+class Validator(OnChangeWorkflowScript):
+    read_only = True
+
+    async def run(self, issue):
+        issue.append(('start', {name!r}))
+        await asyncio.sleep({delay})
+        issue.append(('end', {name!r}))
+        if {fail!r}:
+            raise WorkflowError({name!r})
+"""
+
+MUTATOR = """
+from pm.workflows import OnChangeWorkflowScript
+
+
+class Mutator(OnChangeWorkflowScript):
+    async def run(self, issue):
+        issue.append(('mutate', {name!r}))
+"""
+
+
+def _workflow(script: str, name: str, delay: float = 0, fail: bool = False):
+    from beanie import PydanticObjectId
+
+    import pm.models as m
+
+    return m.OnChangeWorkflow.model_construct(
+        id=PydanticObjectId(),
+        name=name,
+        script=script.format(name=name, delay=delay, fail=fail),
+    )
+
+
+@pytest.mark.asyncio
+async def test_adjacent_read_only_scripts_run_concurrently():
+    from pm.services.workflows import run_on_change_workflows
+
+    calls = []
+    workflows = [
+        _workflow(VALIDATOR, 'v1', delay=0.01),
+        _workflow(VALIDATOR, 'v2', delay=0.01),
+        _workflow(MUTATOR, 'm1'),
+        _workflow(VALIDATOR, 'v3'),
+    ]
+    await run_on_change_workflows(workflows, calls, None, budget=1)
+
+    assert calls[:2] == [('start', 'v1'), ('start', 'v2')]
+    assert calls[4:] == [('mutate', 'm1'), ('start', 'v3'), ('end', 'v3')]
+
+
+@pytest.mark.asyncio
+async def test_first_failure_in_project_order_is_raised():
+    from pm.services.workflows import run_on_change_workflows
+    from pm.workflows import WorkflowError
+
+    workflows = [
+        _workflow(VALIDATOR, 'slow', delay=0.02, fail=True),
+        _workflow(VALIDATOR, 'fast', fail=True),
+    ]
+    with pytest.raises(WorkflowError) as exc_info:
+        await run_on_change_workflows(workflows, [], None, budget=1)
+    assert exc_info.value.msg == 'slow'
+
+
+@pytest.mark.asyncio
+async def test_time_budget():
+    from pm.services.workflows import (
+        get_workflow_latency_stats,
+        run_on_change_workflows,
+    )
+    from pm.workflows import WorkflowError
+
+    wf = _workflow(VALIDATOR, 'stuck', delay=10)
+    with pytest.raises(WorkflowError, match='did not finish'):
+        await run_on_change_workflows([wf], [], None, budget=0.01)
+
+    stats = get_workflow_latency_stats()[str(wf.id)]
+    assert stats['name'] == 'stuck'
+    assert stats['count'] == 1
+    assert sum(stats['buckets'].values()) == 1
@@ -0,0 +1,202 @@
+"""Tests for the scheduled workflow script API."""
+
+from types import SimpleNamespace
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+
+__all__ = ()
+
+
+@pytest.mark.asyncio
+async def test_run_batch_defaults_to_run_per_project():
+    from pm.workflows import ScheduledWorkflowScript
+
+    class Script(ScheduledWorkflowScript):
+        def __init__(self) -> None:
+            self.projects = []
+
+        async def run(self, project) -> None:
+            self.projects.append(project)
+
+    script = Script()
+    await script.run_batch(SimpleNamespace(projects=['p1', 'p2']))
+
+    assert script.projects == ['p1', 'p2']
+
+
+@pytest.mark.asyncio
+async def test_batch_only_script():
+    from pm.workflows import ScheduledWorkflowScript, get_scheduled_script_from_string
+
+    script = get_scheduled_script_from_string(
+        """
+from pm.workflows import ScheduledWorkflowScript
+
+
+class Script(ScheduledWorkflowScript):
+    async def run_batch(self, batch):
+        batch.seen = len(batch.projects)
+"""
+    )
+    batch = SimpleNamespace(projects=['p1', 'p2'])
+    assert isinstance(script, ScheduledWorkflowScript)
+    await script.run_batch(batch)
+    assert batch.seen == 2
+
+
+def test_script_must_override_run_or_run_batch():
+    from pm.workflows import get_scheduled_script_from_string
+
+    with pytest.raises(TypeError, match='must override run or run_batch'):
+        get_scheduled_script_from_string(
+            """
+from pm.workflows import ScheduledWorkflowScript
+
+
+class Script(ScheduledWorkflowScript):
+    pass
+"""
+        )
+
+
+@pytest.mark.asyncio
+async def test_scheduled_run_credits_workflow_bot():
+    from pm.tasks.actions import workflows
+
+    author = SimpleNamespace(email='workflows@so.bot')
+    script = mock.Mock(run_batch=mock.AsyncMock())
+    batch = mock.Mock(flush=mock.AsyncMock())
+    find = mock.Mock(return_value=mock.Mock(to_list=mock.AsyncMock(return_value=[])))
+    with (
+        mock.patch.object(
+            workflows, 'get_scheduled_script_from_string', return_value=script
+        ),
+        mock.patch.object(
+            workflows,
+            'get_workflow_author',
+            new_callable=mock.AsyncMock,
+            return_value=author,
+        ),
+        mock.patch.object(
+            workflows, 'ScheduledWorkflowBatch', return_value=batch
+        ) as batch_cls,
+        mock.patch.object(workflows.m.Project, 'find', find, create=True),
+        mock.patch.object(workflows.m.Project, 'id', None, create=True),
+        mock.patch.object(workflows.bo, 'In'),
+    ):
+        await workflows.run_workflows('script', [])
+
+    batch_cls.assert_called_once_with([], author=author)
+    script.run_batch.assert_awaited_once_with(batch)
+    batch.flush.assert_awaited_once_with()
+
+
+class _Issue:
+    def __init__(self) -> None:
+        from bson import ObjectId
+
+        self.id = ObjectId()
+        self.revision_id = uuid4()
+        self.saved = False
+
+    def changes_update(self) -> dict:
+        return {'$set': {'subject': 'changed'}}
+
+    def get_saved_state(self) -> dict:
+        return {'subject': 'old'}
+
+    def _save_state(self) -> None:
+        self.saved = True
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+@pytest.mark.asyncio
+async def test_batch_flush_skips_concurrently_modified_issues():
+    from bson import Binary
+
+    from pm.services import workflows
+
+    stored, modified = _Issue(), _Issue()
+    revisions = {stored.id: stored.revision_id, modified.id: modified.revision_id}
+    collection = mock.Mock(
+        bulk_write=mock.AsyncMock(return_value=mock.Mock(matched_count=1)),
+        # the re-read only finds the issue carrying the new revision
+        find=mock.Mock(side_effect=lambda *_: _aiter([{'_id': stored.id}])),
+    )
+    batch = workflows.ScheduledWorkflowBatch(projects=[])
+    batch._pending = {stored.id: stored, modified.id: modified}  # pylint: disable=protected-access
+    batch._history = {stored.id: ['r1'], modified.id: ['r2']}  # pylint: disable=protected-access
+
+    m = workflows.m
+    with (
+        mock.patch.object(m.Issue, 'get_motor_collection', return_value=collection),
+        mock.patch.object(m.AuditRecord, 'create_record', side_effect=lambda **kw: kw),
+        mock.patch.object(
+            m, 'queue_audit_records', new_callable=mock.AsyncMock
+        ) as queue_audit,
+        mock.patch.object(
+            m.IssueHistoryEntry,
+            'from_record',
+            side_effect=lambda issue_id, record: (issue_id, record),
+            create=True,
+        ),
+        mock.patch.object(
+            m.IssueHistoryEntry, 'insert_many', new_callable=mock.AsyncMock
+        ) as insert_history,
+        mock.patch.object(
+            m.IssueActivity,
+            'issue_updated',
+            side_effect=lambda issue, record: (issue.id, record),
+        ),
+        mock.patch.object(
+            m.IssueActivity, 'log', new_callable=mock.AsyncMock
+        ) as log_activity,
+        mock.patch.object(
+            workflows, 'issue_event_data', side_effect=lambda issue: issue.id
+        ),
+        mock.patch.object(
+            workflows, 'send_events', new_callable=mock.AsyncMock
+        ) as send_events,
+    ):
+        await batch.flush()
+
+    [operations] = collection.bulk_write.await_args.args
+    assert collection.bulk_write.await_args.kwargs == {'ordered': False}
+    for op, issue in zip(operations, (stored, modified), strict=True):
+        # pylint: disable=protected-access
+        assert op._filter == {
+            '_id': issue.id,
+            'revision_id': Binary.from_uuid(revisions[issue.id]),
+        }
+        assert op._doc['$set'] == {
+            'subject': 'changed',
+            'revision_id': Binary.from_uuid(issue.revision_id),
+        }
+        assert issue.revision_id != revisions[issue.id]
+
+    [query, _] = collection.find.call_args.args
+    assert query['revision_id'] == {
+        '$in': [
+            Binary.from_uuid(stored.revision_id),
+            Binary.from_uuid(modified.revision_id),
+        ],
+    }
+    assert (batch.written, batch.conflicts) == (1, 1)
+    assert not batch._pending  # pylint: disable=protected-access
+    assert stored.saved
+    assert not modified.saved
+
+    [records] = queue_audit.await_args.args
+    assert [(r['object_id'], r['revision'], r['next_revision']) for r in records] == [
+        (stored.id, revisions[stored.id], stored.revision_id),
+    ]
+    insert_history.assert_awaited_once_with([(stored.id, 'r1')])
+    log_activity.assert_awaited_once_with((stored.id, 'r1'))
+    [events] = send_events.await_args.args
+    assert [event.data for event in events] == [stored.id]
@@ -0,0 +1,67 @@
+"""Tests for the compiled workflow scripts cache."""
+
+from pm.workflows import (
+    CompiledScriptCache,
+    OnChangeWorkflowScript,
+    ScheduledWorkflowScript,
+)
+
+__all__ = ()
+
+SCRIPT = """
+from pm.workflows import OnChangeWorkflowScript
+
+
+class Script(OnChangeWorkflowScript):
+    async def run(self, issue, user_ctx):
+        pass
+"""
+
+
+def test_compiles_once_per_script():
+    cache = CompiledScriptCache()
+
+    first = cache.get_class(SCRIPT, OnChangeWorkflowScript, 'wf')
+    second = cache.get_class(SCRIPT, OnChangeWorkflowScript, 'wf')
+
+    assert first is second
+    assert issubclass(first, OnChangeWorkflowScript)
+    assert cache.get_stats() == {'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1}
+
+
+def test_changed_script_is_recompiled():
+    cache = CompiledScriptCache()
+
+    first = cache.get_class(SCRIPT, OnChangeWorkflowScript, 'wf')
+    second = cache.get_class(SCRIPT + '\n# edited\n', OnChangeWorkflowScript, 'wf')
+
+    assert first is not second
+    assert cache.get_stats()['misses'] == 2
+
+
+def test_missing_script_class_is_cached():
+    cache = CompiledScriptCache()
+
+    assert cache.get_class(SCRIPT, ScheduledWorkflowScript) is None
+    assert cache.get_class(SCRIPT, ScheduledWorkflowScript) is None
+    assert cache.get_stats()['hits'] == 1
+
+
+def test_evict_by_workflow_id():
+    cache = CompiledScriptCache()
+    cache.get_class(SCRIPT, OnChangeWorkflowScript, 'wf1')
+    cache.get_class(SCRIPT, OnChangeWorkflowScript, 'wf2')
+
+    assert cache.evict('wf1') == 1
+    assert len(cache) == 1
+    cache.get_class(SCRIPT, OnChangeWorkflowScript, 'wf1')
+    assert cache.get_stats()['misses'] == 3
+
+
+def test_lru_eviction():
+    cache = CompiledScriptCache(max_size=2)
+    for workflow_id in ('wf1', 'wf2', 'wf3'):
+        cache.get_class(SCRIPT, OnChangeWorkflowScript, workflow_id)
+
+    assert len(cache) == 2
+    assert cache.get_stats()['evictions'] == 1
@@ -258,6 +258,7 @@ class SnailOrbitClient(BaseClient):
             Individual items from paginated results
         """
         offset = 0
+        cursor = None
         params = params or {}
 
         while True:
@@ -266,6 +267,8 @@ class SnailOrbitClient(BaseClient):
                 'limit': limit,
                 'offset': offset,
             }
+            if cursor:
+                page_params['cursor'] = cursor
 
             response = self.get(path, params=page_params)
 
@@ -278,6 +281,13 @@ class SnailOrbitClient(BaseClient):
 
             yield from items
 
+            # Follow the keyset cursor when the endpoint returns one
+            if next_cursor := response.get('next_cursor'):
+                cursor = next_cursor
+                continue
+            if cursor:
+                break
+
             # Check if we have more pages
             if response.get('count', 0) <= offset + limit:
                 break
@@ -407,6 +417,7 @@ class SnailOrbitAsyncClient(BaseClient):
     ) -> AsyncIterator[Any]:
         """Async paginate through API results."""
         offset = 0
+        cursor = None
         params = params or {}
 
         while True:
@@ -415,6 +426,8 @@ class SnailOrbitAsyncClient(BaseClient):
                 'limit': limit,
                 'offset': offset,
             }
+            if cursor:
+                page_params['cursor'] = cursor
 
             response = await self.get(path, params=page_params)
 
@@ -428,6 +441,13 @@ class SnailOrbitAsyncClient(BaseClient):
             for item in items:
                 yield item
 
+            # Follow the keyset cursor when the endpoint returns one
+            if next_cursor := response.get('next_cursor'):
+                cursor = next_cursor
+                continue
+            if cursor:
+                break
+
             # Check if we have more pages
             if response.get('count', 0) <= offset + limit:
                 break
@@ -192,6 +192,7 @@ class SyncHttpTransport(BaseTransport):
     ) -> Generator[Any, None, None]:
         """Synchronous pagination through API results."""
         offset = 0
+        cursor = None
         params = params or {}
 
         while True:
@@ -200,6 +201,8 @@ class SyncHttpTransport(BaseTransport):
                 'limit': limit,
                 'offset': offset,
             }
+            if cursor:
+                page_params['cursor'] = cursor
 
             # Since this is sync paginate, we need to avoid async call
             # We'll directly call the sync HTTP request
@@ -222,6 +225,13 @@ class SyncHttpTransport(BaseTransport):
             for item in items:
                 yield item
 
+            # Follow the keyset cursor when the endpoint returns one
+            if next_cursor := data.get('next_cursor'):
+                cursor = next_cursor
+                continue
+            if cursor:
+                break
+
             # Check if we have more pages
             if data.get('count', 0) <= offset + limit:
                 break
@@ -314,6 +324,7 @@ class AsyncHttpTransport(BaseTransport):
     ) -> AsyncIterator[Any]:
         """Async pagination through API results."""
         offset = 0
+        cursor = None
         params = params or {}
 
         while True:
@@ -322,6 +333,8 @@ class AsyncHttpTransport(BaseTransport):
                 'limit': limit,
                 'offset': offset,
             }
+            if cursor:
+                page_params['cursor'] = cursor
 
             response = await self.request('GET', url, params=page_params)
 
@@ -335,6 +348,13 @@ class AsyncHttpTransport(BaseTransport):
             for item in items:
                 yield item
 
+            # Follow the keyset cursor when the endpoint returns one
+            if next_cursor := response.get('next_cursor'):
+                cursor = next_cursor
+                continue
+            if cursor:
+                break
+
             # Check if we have more pages
             if response.get('count', 0) <= offset + limit:
                 break
@@ -42,6 +42,17 @@ export const useEventSubscriptionAutoReFetch = (
                     ]),
                 );
             }
+            if (message.type === "resync") {
+                dispatch(
+                    issueApi.util.invalidateTags(["Issues", "IssueHistories"]),
+                );
+                dispatch(
+                    agileBoardApi.util.invalidateTags([
+                        "AgileBoardIssue",
+                        "AgileBoardIssues",
+                    ]),
+                );
+            }
         },
         [dispatch],
     );
@@ -7,4 +7,8 @@ export type IssueUpdateEventType = {
     data: { issue_id: string };
 };
 
-export type EventType = PingEventType | IssueUpdateEventType;
+export type ResyncEventType = {
+    type: "resync";
+};
+
+export type EventType = PingEventType | IssueUpdateEventType | ResyncEventType;